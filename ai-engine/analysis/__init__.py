@@ -2,5 +2,54 @@
 Analysis module
 """
 from .meeting_analyzer import MeetingAnalyzer, AnalysisResult
+from .streaming import IncrementalJSONParser
+from .structured import ANALYSIS_STATS, analysis_json_schema
+from .local_analyzer import LocalAnalyzer, LocalAnalysisResult
+from .dynamics import SpeakerDynamics, compute_dynamics
+from .linking import SegmentIndex, link_to_segments, parse_timestamp
+from .hedging import HedgedCaller, CircuitBreaker, LLM_STATS
+from .incremental import IncrementalAnalyzer, RollingState
+from .templates import TemplateEngine, TemplateSpec, TemplateResult
+from .retrieval import (
+    HashingEmbedder,
+    MeetingQA,
+    QAResult,
+    QA_STATS,
+    chunk_transcript,
+    select_context,
+)
+from .vector_index import VectorIndex, SearchHit, KIND_SUMMARY, KIND_CHUNK, KIND_PROFILE
 
-__all__ = ["MeetingAnalyzer", "AnalysisResult"]
+__all__ = [
+    "MeetingAnalyzer",
+    "AnalysisResult",
+    "IncrementalJSONParser",
+    "ANALYSIS_STATS",
+    "analysis_json_schema",
+    "LocalAnalyzer",
+    "LocalAnalysisResult",
+    "SpeakerDynamics",
+    "compute_dynamics",
+    "SegmentIndex",
+    "link_to_segments",
+    "parse_timestamp",
+    "HedgedCaller",
+    "CircuitBreaker",
+    "LLM_STATS",
+    "IncrementalAnalyzer",
+    "RollingState",
+    "TemplateEngine",
+    "TemplateSpec",
+    "TemplateResult",
+    "HashingEmbedder",
+    "MeetingQA",
+    "QAResult",
+    "QA_STATS",
+    "chunk_transcript",
+    "select_context",
+    "VectorIndex",
+    "SearchHit",
+    "KIND_SUMMARY",
+    "KIND_CHUNK",
+    "KIND_PROFILE",
+]
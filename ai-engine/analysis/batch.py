@@ -0,0 +1,295 @@
+"""
+Batch analysis - submit many meeting analyses as one provider batch job
+Supports OpenAI Batch API, Anthropic Message Batches and a local stand-in
+"""
+import json
+import os
+import tempfile
+import uuid
+from typing import List, Dict, Any, Optional, Callable
+from dataclasses import dataclass
+
+from .meeting_analyzer import MeetingAnalyzer, AnalysisResult
+
+
+# Normalized batch job states
+BATCH_PENDING = "pending"
+BATCH_COMPLETED = "completed"
+BATCH_FAILED = "failed"
+
+
+@dataclass
+class BatchRequest:
+    """One analysis request inside a batch"""
+    custom_id: str
+    prompt: str
+
+
+class BatchBackend:
+    """Base class for provider batch backends"""
+
+    def __init__(self, analyzer: MeetingAnalyzer):
+        self.analyzer = analyzer
+
+    def submit(self, requests: List[BatchRequest]) -> str:
+        """Submit requests, return provider batch id"""
+        raise NotImplementedError
+
+    def status(self, batch_id: str) -> str:
+        """Normalized batch state (pending/completed/failed)"""
+        raise NotImplementedError
+
+    def results(self, batch_id: str) -> Dict[str, str]:
+        """Raw model text per custom_id for succeeded requests"""
+        raise NotImplementedError
+
+
+class OpenAIBatchBackend(BatchBackend):
+    """
+    OpenAI Batch API (/v1/chat/completions, 24h window)
+
+    Talks to ``/files`` and ``/batches`` over HTTP: the pinned SDK
+    predates the Batch API. Key and base URL are the analyzer's.
+    """
+
+    def _client(self):
+        import httpx
+        api_key = self.analyzer.api_key or os.environ.get("OPENAI_API_KEY", "")
+        return httpx.Client(
+            base_url=self.analyzer.base_url or os.environ.get("OPENAI_BASE_URL") or "https://api.openai.com/v1",
+            headers={"Authorization": f"Bearer {api_key}"},
+            timeout=120,
+        )
+
+    def _batch(self, client, batch_id: str) -> Dict[str, Any]:
+        response = client.get(f"/batches/{batch_id}")
+        response.raise_for_status()
+        return response.json()
+
+    def submit(self, requests: List[BatchRequest]) -> str:
+        lines = [
+            json.dumps({
+                "custom_id": request.custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self.analyzer._openai_params(request.prompt),
+            })
+            for request in requests
+        ]
+
+        with self._client() as client:
+            response = client.post(
+                "/files",
+                data={"purpose": "batch"},
+                files={"file": ("batch.jsonl", "\n".join(lines).encode("utf-8"), "application/jsonl")},
+            )
+            response.raise_for_status()
+
+            response = client.post("/batches", json={
+                "input_file_id": response.json()["id"],
+                "endpoint": "/v1/chat/completions",
+                "completion_window": "24h",
+            })
+            response.raise_for_status()
+            return response.json()["id"]
+
+    def status(self, batch_id: str) -> str:
+        with self._client() as client:
+            state = self._batch(client, batch_id)["status"]
+        if state == "completed":
+            return BATCH_COMPLETED
+        if state in ("failed", "expired", "cancelled"):
+            return BATCH_FAILED
+        return BATCH_PENDING
+
+    def results(self, batch_id: str) -> Dict[str, str]:
+        with self._client() as client:
+            output_file_id = self._batch(client, batch_id).get("output_file_id")
+            if not output_file_id:
+                return {}
+
+            response = client.get(f"/files/{output_file_id}/content")
+            response.raise_for_status()
+            output = response.text
+
+        results = {}
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            response = entry.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+            results[entry["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+        return results
+
+
+class AnthropicBatchBackend(BatchBackend):
+    """
+    Anthropic Message Batches API
+
+    Talks to ``/v1/messages/batches`` over HTTP (the SDK is optional),
+    with the analyzer's key and base URL.
+    """
+
+    def _client(self):
+        import httpx
+        return httpx.Client(
+            base_url=self.analyzer.base_url or os.environ.get("ANTHROPIC_BASE_URL") or "https://api.anthropic.com",
+            headers={
+                "x-api-key": self.analyzer.api_key or os.environ.get("ANTHROPIC_API_KEY", ""),
+                "anthropic-version": "2023-06-01",
+            },
+            timeout=120,
+        )
+
+    def _batch(self, client, batch_id: str) -> Dict[str, Any]:
+        response = client.get(f"/v1/messages/batches/{batch_id}")
+        response.raise_for_status()
+        return response.json()
+
+    def submit(self, requests: List[BatchRequest]) -> str:
+        with self._client() as client:
+            response = client.post("/v1/messages/batches", json={
+                "requests": [
+                    {
+                        "custom_id": request.custom_id,
+                        "params": self.analyzer._anthropic_params(request.prompt),
+                    }
+                    for request in requests
+                ]
+            })
+            response.raise_for_status()
+            return response.json()["id"]
+
+    def status(self, batch_id: str) -> str:
+        with self._client() as client:
+            batch = self._batch(client, batch_id)
+        if batch["processing_status"] == "ended":
+            return BATCH_COMPLETED
+        return BATCH_PENDING
+
+    def results(self, batch_id: str) -> Dict[str, str]:
+        with self._client() as client:
+            results_url = self._batch(client, batch_id).get("results_url")
+            if not results_url:
+                return {}
+
+            response = client.get(results_url)
+            response.raise_for_status()
+            output = response.text
+
+        results = {}
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            result = entry.get("result") or {}
+            if result.get("type") == "succeeded":
+                results[entry["custom_id"]] = result["message"]["content"][0]["text"]
+        return results
+
+
+class LocalBatchBackend(BatchBackend):
+    """
+    Stand-in for tests and local development
+
+    Runs every request through ``call_llm`` (the analyzer's own
+    ``_call_llm`` by default) at submit time and stores the results as
+    one JSON file per batch in ``state_dir``, so a poll from another
+    worker process (or after a restart) still finds them. Like a provider
+    batch, results can be read again if writing them back failed.
+    """
+
+    def __init__(
+        self,
+        analyzer: MeetingAnalyzer,
+        call_llm: Optional[Callable[[str], str]] = None,
+        state_dir: Optional[str] = None
+    ):
+        super().__init__(analyzer)
+        self.call_llm = call_llm or analyzer._call_llm
+        self.state_dir = state_dir or os.path.join(tempfile.gettempdir(), "meetingmind-batches")
+
+    def _path(self, batch_id: str) -> str:
+        return os.path.join(self.state_dir, f"{batch_id}.json")
+
+    def submit(self, requests: List[BatchRequest]) -> str:
+        batch_id = f"local-{uuid.uuid4()}"
+        results = {
+            request.custom_id: self.call_llm(request.prompt)
+            for request in requests
+        }
+
+        os.makedirs(self.state_dir, exist_ok=True)
+        path = self._path(batch_id)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+            json.dump(results, f)
+        os.replace(f"{path}.tmp", path)
+        return batch_id
+
+    def status(self, batch_id: str) -> str:
+        return BATCH_COMPLETED if os.path.exists(self._path(batch_id)) else BATCH_FAILED
+
+    def results(self, batch_id: str) -> Dict[str, str]:
+        path = self._path(batch_id)
+        if not os.path.exists(path):
+            return {}
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+
+BATCH_BACKENDS = {
+    "openai": OpenAIBatchBackend,
+    "anthropic": AnthropicBatchBackend,
+    "local": LocalBatchBackend,
+}
+
+
+def get_batch_backend(
+    analyzer: MeetingAnalyzer,
+    provider: Optional[str] = None,
+    **options
+) -> BatchBackend:
+    """
+    Batch backend for a provider (defaults to the analyzer's provider)
+
+    ``options`` go to the backend constructor (e.g. ``state_dir`` of the
+    local backend).
+    """
+    provider = provider or analyzer.llm_provider
+    if provider not in BATCH_BACKENDS:
+        raise ValueError(f"Unsupported batch provider: {provider}")
+    return BATCH_BACKENDS[provider](analyzer, **options)
+
+
+def build_batch_request(
+    analyzer: MeetingAnalyzer,
+    custom_id: str,
+    transcript: List[Dict[str, Any]],
+    meeting_title: str = "",
+    previous_meetings: List[str] = None
+) -> BatchRequest:
+    """Build the same prompt analyze_meeting would send, for batching"""
+    prompt = analyzer._build_analysis_prompt(
+        analyzer._format_transcript(transcript),
+        meeting_title,
+        previous_meetings,
+    )
+    return BatchRequest(custom_id=custom_id, prompt=prompt)
+
+
+def parse_batch_result(
+    analyzer: MeetingAnalyzer,
+    response: str,
+    transcript: List[Dict[str, Any]]
+) -> AnalysisResult:
+    """
+    Parse one batch response into an AnalysisResult
+
+    Missing or malformed fields are repaired as in ``analyze_meeting``,
+    so batch and interactive results come out the same.
+    """
+    data = analyzer._extract_json(response)
+    data = analyzer._repair_invalid_fields(data, analyzer._format_transcript(transcript))
+    return analyzer._build_result(data, transcript)
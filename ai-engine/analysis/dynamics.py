@@ -0,0 +1,133 @@
+"""
+Conversation dynamics - per-speaker talk time, turns, overlaps and latency
+Vectorized with numpy over sorted segment start/end arrays
+"""
+from typing import List, Dict, Any
+from dataclasses import dataclass, asdict
+
+import numpy as np
+
+
+@dataclass
+class SpeakerDynamics:
+    """Conversation dynamics for one speaker"""
+    speaker: str
+    talk_time_seconds: float
+    talk_time_percent: float
+    turn_count: int
+    interruption_count: int
+    interrupted_count: int
+    overlap_seconds: float
+    longest_monologue_seconds: float
+    avg_response_latency: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def compute_dynamics(
+    transcript: List[Dict[str, Any]]
+) -> Dict[str, SpeakerDynamics]:
+    """
+    Compute conversation dynamics per speaker in one pass
+
+    Consecutive segments of the same speaker form a turn. A turn that
+    starts before the previous speaker's turn has ended counts as an
+    interruption (for the new speaker) and the shared time as overlap;
+    otherwise the gap is the new speaker's response latency.
+
+    Args:
+        transcript: List of transcript segments ({"speaker", "start", "end"})
+
+    Returns:
+        Dict of speaker name -> SpeakerDynamics
+    """
+    if not transcript:
+        return {}
+
+    n = len(transcript)
+    speaker_codes: Dict[str, int] = {}
+    starts = np.fromiter(
+        (float(s.get("start", 0) or 0) for s in transcript), dtype=np.float64, count=n
+    )
+    ends = np.fromiter(
+        (float(s.get("end", 0) or 0) for s in transcript), dtype=np.float64, count=n
+    )
+    codes = np.fromiter(
+        (
+            speaker_codes.setdefault(s.get("speaker") or "Unknown", len(speaker_codes))
+            for s in transcript
+        ),
+        dtype=np.int64,
+        count=n,
+    )
+    names = list(speaker_codes)
+    n_speakers = len(names)
+
+    order = np.argsort(starts, kind="stable")
+    starts, ends, codes = starts[order], ends[order], codes[order]
+
+    # Talk time
+    durations = np.clip(ends - starts, 0.0, None)
+    talk = np.bincount(codes, weights=durations, minlength=n_speakers)
+    total = talk.sum()
+
+    # Turns: runs of consecutive segments with the same speaker
+    new_turn = np.empty(len(codes), dtype=bool)
+    new_turn[0] = True
+    np.not_equal(codes[1:], codes[:-1], out=new_turn[1:])
+    turn_idx = np.flatnonzero(new_turn)
+
+    turn_speaker = codes[turn_idx]
+    turn_start = starts[turn_idx]
+    turn_end = np.maximum.reduceat(ends, turn_idx)
+
+    turns = np.bincount(turn_speaker, minlength=n_speakers)
+
+    longest = np.zeros(n_speakers)
+    np.maximum.at(longest, turn_speaker, turn_end - turn_start)
+
+    # Turn transitions: overlap vs gap against the previous turn
+    prev_end = turn_end[:-1]
+    next_start = turn_start[1:]
+    next_speaker = turn_speaker[1:]
+    prev_speaker = turn_speaker[:-1]
+
+    gap = next_start - prev_end
+    interrupted = gap < 0
+    overlap = np.where(
+        interrupted,
+        np.minimum(prev_end, turn_end[1:]) - next_start,
+        0.0,
+    )
+
+    interruptions = np.bincount(next_speaker[interrupted], minlength=n_speakers)
+    interrupted_by = np.bincount(prev_speaker[interrupted], minlength=n_speakers)
+    overlaps = np.bincount(next_speaker, weights=overlap, minlength=n_speakers)
+
+    responded = ~interrupted
+    latency_sum = np.bincount(next_speaker[responded], weights=gap[responded], minlength=n_speakers)
+    latency_count = np.bincount(next_speaker[responded], minlength=n_speakers)
+    latency = np.divide(
+        latency_sum,
+        latency_count,
+        out=np.zeros(n_speakers),
+        where=latency_count > 0,
+    )
+
+    percent = talk / total * 100 if total > 0 else np.zeros(n_speakers)
+
+    return {
+        str(name): SpeakerDynamics(
+            speaker=str(name),
+            talk_time_seconds=round(float(talk[i]), 3),
+            talk_time_percent=round(float(percent[i]), 2),
+            turn_count=int(turns[i]),
+            interruption_count=int(interruptions[i]),
+            interrupted_count=int(interrupted_by[i]),
+            overlap_seconds=round(float(overlaps[i]), 3),
+            longest_monologue_seconds=round(float(longest[i]), 3),
+            avg_response_latency=round(float(latency[i]), 3),
+        )
+        for i, name in enumerate(names)
+    }
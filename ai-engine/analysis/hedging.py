@@ -0,0 +1,379 @@
+"""
+Hedged LLM requests - failover between providers with circuit breakers
+"""
+import contextvars
+import queue as queues
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+
+# Per-provider request outcomes and hedging events (process-wide), keyed
+# "<provider>.<outcome>": ok, error, invalid, hedged, rejected, cancelled
+LLM_STATS: Counter = Counter()
+
+Attempt = Tuple[str, Callable[[], Any]]
+Observer = Callable[[str, str, Optional[float]], None]
+
+
+class InvalidResponse(Exception):
+    """A provider answered, but not with a usable result"""
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker of one provider
+
+    Closed: calls pass. After ``failure_threshold`` failures in a row it
+    opens and rejects calls for ``reset_seconds``; then one trial call is
+    let through (half-open) and its outcome closes or re-opens it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.clock = clock
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if self.trial or self.clock() - self.opened_at >= self.reset_seconds:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if self.trial or self.clock() - self.opened_at < self.reset_seconds:
+                return False
+            self.trial = True
+            return True
+
+    def release(self) -> None:
+        """End a call that was abandoned without an outcome (frees the trial)"""
+        with self._lock:
+            self.trial = False
+
+    def record(self, ok: bool) -> None:
+        with self._lock:
+            self.trial = False
+            if ok:
+                self.failures = 0
+                self.opened_at = None
+            else:
+                self.failures += 1
+                if self.opened_at is not None or self.failures >= self.failure_threshold:
+                    self.opened_at = self.clock()
+
+
+class LatencyWindow:
+    """Latencies of a provider's last ``size`` successful calls"""
+
+    def __init__(self, size: int = 200, min_samples: int = 20):
+        self.samples: Deque[float] = deque(maxlen=size)
+        self.min_samples = min_samples
+
+    def add(self, seconds: float) -> None:
+        self.samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """q-th percentile, or None until ``min_samples`` calls were seen"""
+        if len(self.samples) < self.min_samples:
+            return None
+        values = sorted(self.samples)
+        return values[min(len(values) - 1, int(round(q / 100 * (len(values) - 1))))]
+
+
+class HedgedCaller:
+    """
+    Run one request against providers in order of preference
+
+    Usage:
+        hedger = HedgedCaller(observer=metrics_callback)
+        provider, text = hedger.call(
+            [("openai:gpt-4o-mini", call_openai), ("anthropic:claude", call_anthropic)],
+            valid=lambda text: bool(text),
+        )
+
+    The first provider is called; if it has not produced a valid result
+    after its hedge delay (the ``quantile`` of its recent latencies,
+    clamped to ``min_delay``..``max_delay``, ``default_delay`` until
+    enough calls were seen) the next one is started as well, and the
+    first valid result wins. An error or invalid result starts the next
+    provider right away. Providers whose circuit breaker is open are
+    skipped; when all are, the first is tried anyway. Calls that lose the
+    race still finish in the background and count towards latency,
+    breaker state and metrics.
+
+    ``stream`` hedges the same way on time to the first chunk; the
+    stream that yields first is used and the others are cancelled.
+
+    Breakers and latency windows live on the caller, so share one
+    instance per process.
+    """
+
+    def __init__(
+        self,
+        quantile: float = 95.0,
+        min_delay: float = 2.0,
+        max_delay: float = 60.0,
+        default_delay: float = 20.0,
+        failure_threshold: int = 5,
+        reset_seconds: float = 60.0,
+        observer: Optional[Observer] = None,
+        max_workers: int = 32
+    ):
+        self.quantile = quantile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.default_delay = default_delay
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.observer = observer
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.latencies: Dict[str, LatencyWindow] = {}
+        self.first_chunk_latencies: Dict[str, LatencyWindow] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="llm-hedge")
+
+    def breaker(self, provider: str) -> CircuitBreaker:
+        with self._lock:
+            if provider not in self.breakers:
+                self.breakers[provider] = CircuitBreaker(self.failure_threshold, self.reset_seconds)
+                self.latencies[provider] = LatencyWindow()
+                self.first_chunk_latencies[provider] = LatencyWindow()
+            return self.breakers[provider]
+
+    def hedge_delay(self, provider: str, streaming: bool = False) -> float:
+        """Wait before hedging: on the full result, or on the first chunk when streaming"""
+        self.breaker(provider)
+        windows = self.first_chunk_latencies if streaming else self.latencies
+        observed = windows[provider].percentile(self.quantile)
+        if observed is None:
+            return self.default_delay
+        return min(max(observed, self.min_delay), self.max_delay)
+
+    def call(
+        self,
+        attempts: List[Attempt],
+        valid: Callable[[Any], bool] = bool
+    ) -> Tuple[str, Any]:
+        """
+        Returns:
+            (provider, result) of the first valid result; when providers
+            answered but none validly, the last answer, so the caller's
+            own parsing and repair still apply
+
+        Raises:
+            The last provider's error when no provider answered
+        """
+        queue = list(attempts)
+        running = {}
+        errors: List[Exception] = []
+        answered = None
+
+        def start(attempt):
+            provider, fn = attempt
+            context = contextvars.copy_context()
+            future = self._executor.submit(context.run, self._run, provider, fn, valid)
+            running[future] = provider
+
+        start(self._take(queue) or attempts[0])
+        while running:
+            timeout = self.hedge_delay(list(running.values())[-1]) if queue else None
+            done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+
+            if not done:
+                # Slow provider: hedge with the next one, keep waiting for both
+                attempt = self._take(queue)
+                if attempt:
+                    self._event(attempt[0], "hedged")
+                    start(attempt)
+                continue
+
+            for future in done:
+                provider = running.pop(future)
+                result, error = future.result()
+                if error is None:
+                    return provider, result
+                if isinstance(error, InvalidResponse):
+                    answered = (provider, result)
+                errors.append(error)
+
+            # Failed fast: fail over instead of waiting out the hedge delay
+            if not running:
+                attempt = self._take(queue)
+                if attempt:
+                    start(attempt)
+
+        if answered is not None:
+            return answered
+        raise errors[-1]
+
+    def stream(self, attempts: List[Tuple[str, Callable[[], Iterator[Any]]]]) -> Iterator[Any]:
+        """
+        Yield the chunks of the first provider that starts streaming
+
+        Only one stream can feed the caller, so the race is on the first
+        chunk: when the running stream has not produced one after its
+        hedge delay (quantile of its recent times to first chunk) the
+        next provider's stream is started too, and the first to yield
+        wins; the other is cancelled. A stream that fails before its
+        first chunk fails over right away; one that fails later raises.
+
+        Streams run on the caller's executor; a cancelled stream is
+        closed at its next chunk (a blocking read cannot be interrupted).
+        """
+        pending = list(attempts)
+        events: "queues.Queue" = queues.Queue()
+        running: Dict[int, str] = {}
+        cancels: List[threading.Event] = []
+        winner: Optional[int] = None
+        errors: List[Exception] = []
+
+        def start(attempt):
+            provider, fn = attempt
+            cancels.append(threading.Event())
+            runner = len(cancels) - 1
+            running[runner] = provider
+            context = contextvars.copy_context()
+            self._executor.submit(context.run, self._pump, runner, provider, fn, events, cancels[runner])
+
+        try:
+            start(self._take(pending) or attempts[0])
+            while True:
+                timeout = None
+                if winner is None and pending:
+                    timeout = self.hedge_delay(list(running.values())[-1], streaming=True)
+                try:
+                    runner, kind, payload = events.get(timeout=timeout)
+                except queues.Empty:
+                    # No first chunk yet: hedge with the next provider
+                    attempt = self._take(pending)
+                    if attempt:
+                        self._event(attempt[0], "hedged")
+                        start(attempt)
+                    continue
+
+                if winner is None and kind != "error":
+                    winner = runner
+                    for other, cancel in enumerate(cancels):
+                        if other != winner:
+                            cancel.set()
+                if winner is not None:
+                    if runner != winner:
+                        continue
+                    if kind == "chunk":
+                        yield payload
+                        continue
+                    if kind == "error":
+                        raise payload
+                    return
+
+                # Failed before its first chunk: fail over without waiting
+                del running[runner]
+                errors.append(payload)
+                if not running:
+                    attempt = self._take(pending)
+                    if attempt is None:
+                        raise errors[-1]
+                    start(attempt)
+        finally:
+            for cancel in cancels:
+                cancel.set()
+
+    def _take(self, queue: List[Attempt]) -> Optional[Attempt]:
+        """Pop the next attempt whose breaker lets it through"""
+        while queue:
+            provider, fn = queue.pop(0)
+            if self.breaker(provider).allow():
+                return provider, fn
+            self._event(provider, "rejected")
+        return None
+
+    def _run(self, provider: str, fn: Callable[[], Any], valid: Callable[[Any], bool]):
+        start = time.perf_counter()
+        result, error = None, None
+        try:
+            result = fn()
+            if not valid(result):
+                error = InvalidResponse(f"Unusable response from {provider}")
+        except Exception as e:
+            error = e
+        self._finish(provider, time.perf_counter() - start, error)
+        return result, error
+
+    def _pump(
+        self,
+        runner: int,
+        provider: str,
+        fn: Callable[[], Iterator[Any]],
+        events: "queues.Queue",
+        cancel: threading.Event
+    ) -> None:
+        """Run one stream, putting (runner, chunk|end|error, payload) on ``events``"""
+        start = time.perf_counter()
+        first_chunk = None
+        stream = None
+        try:
+            stream = fn()
+            for chunk in stream:
+                if cancel.is_set():
+                    break
+                if first_chunk is None:
+                    first_chunk = time.perf_counter() - start
+                events.put((runner, "chunk", chunk))
+        except Exception as e:
+            error = e
+        else:
+            error = None
+        finally:
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()
+
+        if cancel.is_set():
+            # Lost the race: no outcome for breaker or latency stats
+            self.breaker(provider).release()
+            self._event(provider, "cancelled")
+            return
+        self._finish(provider, time.perf_counter() - start, error, first_chunk)
+        events.put((runner, "end", None) if error is None else (runner, "error", error))
+
+    def _finish(
+        self,
+        provider: str,
+        seconds: float,
+        error: Optional[Exception],
+        first_chunk: Optional[float] = None
+    ) -> None:
+        self.breaker(provider).record(error is None)
+        if error is None:
+            self.latencies[provider].add(seconds)
+            if first_chunk is not None:
+                self.first_chunk_latencies[provider].add(first_chunk)
+            outcome = "ok"
+        else:
+            outcome = "invalid" if isinstance(error, InvalidResponse) else "error"
+        self._event(provider, outcome, seconds)
+
+    def _event(self, provider: str, outcome: str, seconds: Optional[float] = None) -> None:
+        LLM_STATS[f"{provider}.{outcome}"] += 1
+        if self.observer is not None:
+            try:
+                self.observer(provider, outcome, seconds)
+            except Exception as e:
+                print(f"LLM metrics error: {e}")
@@ -0,0 +1,152 @@
+"""
+Incremental Analyzer - rolling analysis for live meetings
+Sends only new segments plus a compact running state to the LLM
+"""
+import json
+from typing import List, Dict, Any, Optional
+from dataclasses import dataclass, field, asdict
+
+from .meeting_analyzer import MeetingAnalyzer
+
+
+@dataclass
+class RollingState:
+    """Compact running state of a live meeting analysis"""
+    summary: str = ""
+    open_action_items: List[Dict[str, Any]] = field(default_factory=list)
+    key_topics: List[str] = field(default_factory=list)
+    decisions_made: List[str] = field(default_factory=list)
+    last_segment_end: float = 0.0
+    segments_processed: int = 0
+    updates: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "RollingState":
+        if not data:
+            return cls()
+        known = {k: v for k, v in data.items() if k in cls.__dataclass_fields__}
+        return cls(**known)
+
+
+class IncrementalAnalyzer:
+    """
+    Rolling meeting analyzer
+
+    Each update sends the compact state (running summary, open action
+    items, topics, decisions) plus only the segments since the previous
+    update, so per-update prompt size stays bounded no matter how long
+    the meeting runs. State size is capped by the limits below.
+    """
+
+    def __init__(
+        self,
+        analyzer: MeetingAnalyzer,
+        max_summary_words: int = 150,
+        max_action_items: int = 20,
+        max_topics: int = 10,
+        max_decisions: int = 10,
+        max_new_chars: int = 12000
+    ):
+        self.analyzer = analyzer
+        self.max_summary_words = max_summary_words
+        self.max_action_items = max_action_items
+        self.max_topics = max_topics
+        self.max_decisions = max_decisions
+        self.max_new_chars = max_new_chars
+
+    def update(
+        self,
+        state: RollingState,
+        new_segments: List[Dict[str, Any]],
+        meeting_title: str = ""
+    ) -> RollingState:
+        """
+        Fold new transcript segments into the rolling state
+
+        Args:
+            state: State after the previous update
+            new_segments: Segments that ended after ``state.last_segment_end``
+            meeting_title: Title of the meeting
+
+        Returns:
+            New RollingState (the input state is not modified)
+        """
+        if not new_segments:
+            return state
+
+        formatted = self.analyzer._format_transcript(new_segments)
+        if len(formatted) > self.max_new_chars:
+            # Keep the most recent part; older text is already summarized
+            formatted = formatted[-self.max_new_chars:]
+
+        prompt = self._build_update_prompt(state, formatted, meeting_title)
+        data = self.analyzer._extract_json(self.analyzer._call_llm(prompt))
+
+        return RollingState(
+            summary=data.get("summary") or state.summary,
+            open_action_items=self._as_list(
+                data.get("open_action_items"), state.open_action_items
+            )[:self.max_action_items],
+            key_topics=self._as_list(
+                data.get("key_topics"), state.key_topics
+            )[:self.max_topics],
+            decisions_made=self._as_list(
+                data.get("decisions_made"), state.decisions_made
+            )[:self.max_decisions],
+            last_segment_end=max(
+                [state.last_segment_end] + [float(s.get("end", 0)) for s in new_segments]
+            ),
+            segments_processed=state.segments_processed + len(new_segments),
+            updates=state.updates + 1,
+        )
+
+    def _as_list(self, value: Any, default: List[Any]) -> List[Any]:
+        return value if isinstance(value, list) else list(default)
+
+    def _build_update_prompt(
+        self,
+        state: RollingState,
+        new_transcript: str,
+        meeting_title: str
+    ) -> str:
+        """Build prompt from compact state + new segments only"""
+        compact_state = {
+            "summary": state.summary,
+            "open_action_items": state.open_action_items,
+            "key_topics": state.key_topics,
+            "decisions_made": state.decisions_made,
+        }
+
+        return f"""You are an expert meeting analyst updating a live analysis of an ongoing meeting.
+
+Meeting Title: {meeting_title}
+
+=== CURRENT STATE ===
+{json.dumps(compact_state, ensure_ascii=False)}
+=== END CURRENT STATE ===
+
+=== NEW TRANSCRIPT SINCE LAST UPDATE ===
+{new_transcript}
+=== END NEW TRANSCRIPT ===
+
+Update the state with the new transcript and respond in JSON format:
+
+{{
+    "summary": "Updated summary of the whole meeting so far (max {self.max_summary_words} words)",
+    "open_action_items": [
+        {{
+            "task": "description",
+            "assignee": "person name or email",
+            "due_date": "YYYY-MM-DD or null",
+            "priority": "high|medium|low"
+        }}
+    ],
+    "key_topics": ["topic1", "topic2", ...],
+    "decisions_made": ["decision1", ...]
+}}
+
+Drop action items that were completed or cancelled in the new transcript.
+Keep at most {self.max_action_items} action items, {self.max_topics} topics and {self.max_decisions} decisions."""
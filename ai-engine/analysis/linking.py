@@ -0,0 +1,115 @@
+"""
+Segment linking - map LLM timestamps (key moments, action items) to
+transcript segments with a bisect index over sorted start times
+"""
+import re
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Sequence
+
+# [H:]MM:SS anywhere in the value, e.g. "12:34", "[1:02:03]", "around 05:10"
+CLOCK_PATTERN = re.compile(r"(?<!\d)(?:(\d{1,2}):)?(\d{1,3}):(\d{2})(?:\.\d+)?(?!\d)")
+
+
+def parse_timestamp(value: Any) -> Optional[float]:
+    """
+    Seconds from the start of the meeting, None if the value has no time
+
+    Numbers are taken as seconds; strings need a clock time ([H:]MM:SS).
+    """
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value) if value >= 0 else None
+    if not isinstance(value, str):
+        return None
+
+    match = CLOCK_PATTERN.search(value)
+    if not match:
+        return None
+    hours, minutes, seconds = match.groups()
+    if int(seconds) >= 60:
+        return None
+    return int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds)
+
+
+def format_timestamp(seconds: float) -> str:
+    """MM:SS, or H:MM:SS from one hour on - the form parse_timestamp reads"""
+    seconds = max(0, int(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+class SegmentIndex:
+    """
+    Interval index over transcript segments sorted by start time
+
+    ``locate(t)`` finds the segment covering second ``t`` with one
+    bisection (O(log n)). A time falling in a silence between segments
+    goes to the nearer neighbour; times more than ``tolerance`` seconds
+    outside the transcript match nothing.
+    """
+
+    def __init__(
+        self,
+        starts: Sequence[float],
+        ends: Sequence[float],
+        tolerance: float = 30.0
+    ):
+        self.starts = [float(s) for s in starts]
+        self.ends = [float(e) for e in ends]
+        self.tolerance = tolerance
+        self.last_end = max(self.ends, default=0.0)
+
+    @classmethod
+    def from_segments(
+        cls,
+        segments: List[Dict[str, Any]],
+        tolerance: float = 30.0
+    ) -> "SegmentIndex":
+        """Build from {"start", "end"} dicts already sorted by start"""
+        return cls(
+            [s.get("start") or 0 for s in segments],
+            [s.get("end") or 0 for s in segments],
+            tolerance=tolerance,
+        )
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def locate(self, seconds: Optional[float]) -> Optional[int]:
+        """Position of the segment at ``seconds``, None if there is none"""
+        if seconds is None or not self.starts:
+            return None
+        if seconds < self.starts[0] - self.tolerance or seconds > self.last_end + self.tolerance:
+            return None
+
+        i = bisect_right(self.starts, seconds) - 1
+        if i < 0:
+            return 0
+
+        # In a gap after segment i: take whichever neighbour is closer
+        if seconds > self.ends[i] and i + 1 < len(self.starts):
+            if self.starts[i + 1] - seconds < seconds - self.ends[i]:
+                return i + 1
+        return i
+
+
+def link_to_segments(
+    items: List[Dict[str, Any]],
+    index: SegmentIndex,
+    key: str = "timestamp"
+) -> List[Optional[int]]:
+    """
+    Segment position for each item's ``key`` timestamp
+
+    Returns:
+        One entry per item: index into the segments, or None when the
+        item has no usable timestamp
+    """
+    return [
+        index.locate(parse_timestamp(item.get(key))) if isinstance(item, dict) else None
+        for item in items
+    ]
@@ -0,0 +1,230 @@
+"""
+Local Analyzer - fast, no-LLM meeting insights
+Keyphrase topics, lexicon sentiment and question/decision heuristics
+"""
+import re
+from typing import List, Dict, Any, Tuple
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+@dataclass
+class LocalAnalysisResult:
+    """Result of local (no-LLM) analysis"""
+    key_topics: List[str]
+    sentiment_score: float
+    sentiment_label: str
+    questions: List[str] = field(default_factory=list)
+    decisions: List[str] = field(default_factory=list)
+
+
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are aren as at be
+because been before being below between both but by can could did didn do
+does doesn doing don down during each few for from further get got had has
+have having he her here hers herself him himself his how i if in into is
+isn it its itself just know let like ll me more most my myself need no nor
+not now of off ok okay on once only or other our ours ourselves out over own
+really right said same say she should so some such than that the their
+theirs them themselves then there these they thing things think this those
+through to too under until up us very want was we well were what when where
+which while who whom why will with would yeah yes you your yours yourself
+going gonna actually maybe kind sort mean sure lot bit
+это как так что его она они мы вы для или уже вот там тут все ещё еще
+""".split())
+
+POSITIVE_WORDS = frozenset("""
+good great excellent awesome amazing love happy glad agree agreed
+perfect nice success successful progress improve improved win wins
+helpful clear excited fantastic positive resolved done thanks thank
+отлично хорошо супер согласен согласны спасибо успех
+""".split())
+
+NEGATIVE_WORDS = frozenset("""
+bad poor terrible awful hate problem problems issue issues concern
+concerned worried risk risks blocker blocked blocking delay delayed fail
+failed failure broken bug bugs difficult unclear disagree frustrated
+negative late missed wrong confusing
+плохо проблема проблемы риск задержка ошибка сложно
+""".split())
+
+QUESTION_STARTERS = re.compile(
+    r"^\s*(who|what|when|where|why|how|which|can|could|should|would|do|does|did|is|are|will)\b",
+    re.IGNORECASE,
+)
+
+DECISION_PATTERNS = re.compile(
+    r"\b(we decided|decided to|we('ll| will) go with|let'?s go with|agreed (to|on|that)"
+    r"|we agree|final decision|decision is|we('re| are) going to|approved)\b",
+    re.IGNORECASE,
+)
+
+TOKEN_PATTERN = re.compile(r"[^\W\d_]{3,}", re.UNICODE)
+
+
+class LocalAnalyzer:
+    """
+    Dependency-light meeting analyzer (numpy only)
+
+    Runs in milliseconds on the transcript so basic insights are
+    available before the LLM tier finishes:
+    - TF-IDF keyphrase topics (segments are documents, uni+bigrams)
+    - Lexicon-based sentiment
+    - Question and decision detection
+    """
+
+    def __init__(
+        self,
+        max_topics: int = 8,
+        max_items: int = 10,
+        min_phrase_count: int = 2
+    ):
+        self.max_topics = max_topics
+        self.max_items = max_items
+        self.min_phrase_count = min_phrase_count
+
+    def analyze(
+        self,
+        transcript: List[Dict[str, Any]]
+    ) -> LocalAnalysisResult:
+        """
+        Analyze transcript segments locally
+
+        Args:
+            transcript: List of transcript segments ({"speaker", "text", ...})
+
+        Returns:
+            LocalAnalysisResult with topics, sentiment, questions, decisions
+        """
+        texts = [segment.get("text", "") or "" for segment in transcript]
+
+        vocab, doc_idx, term_idx = self._index_terms(texts)
+        key_topics = self._rank_topics(vocab, doc_idx, term_idx, len(texts))
+        score, label = self._score_sentiment(vocab, term_idx)
+
+        return LocalAnalysisResult(
+            key_topics=key_topics,
+            sentiment_score=score,
+            sentiment_label=label,
+            questions=self._find_questions(texts),
+            decisions=self._find_decisions(texts),
+        )
+
+    def _index_terms(
+        self,
+        texts: List[str]
+    ) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """Map segment unigrams/bigrams to (doc index, term id) arrays"""
+        vocab: Dict[str, int] = {}
+        docs: List[int] = []
+        terms: List[int] = []
+
+        for doc, text in enumerate(texts):
+            tokens = TOKEN_PATTERN.findall(text.lower())
+            previous = None
+            for token in tokens:
+                if token in STOPWORDS:
+                    previous = None
+                    continue
+                for term in (token, f"{previous} {token}" if previous else None):
+                    if term is None:
+                        continue
+                    docs.append(doc)
+                    terms.append(vocab.setdefault(term, len(vocab)))
+                previous = token
+
+        return (
+            list(vocab),
+            np.asarray(docs, dtype=np.int64),
+            np.asarray(terms, dtype=np.int64),
+        )
+
+    def _rank_topics(
+        self,
+        vocab: List[str],
+        doc_idx: np.ndarray,
+        term_idx: np.ndarray,
+        n_docs: int
+    ) -> List[str]:
+        """Rank terms by aggregate TF-IDF across segments"""
+        if term_idx.size == 0:
+            return []
+
+        n_terms = len(vocab)
+        tf = np.bincount(term_idx, minlength=n_terms).astype(np.float64)
+
+        # Document frequency from unique (doc, term) pairs
+        pairs = np.unique(doc_idx * n_terms + term_idx)
+        df = np.bincount(pairs % n_terms, minlength=n_terms)
+        idf = np.log((1.0 + n_docs) / (1.0 + df)) + 1.0
+
+        is_phrase = np.fromiter((" " in term for term in vocab), dtype=bool, count=n_terms)
+        scores = tf * idf
+        # Phrases are more descriptive; require them to repeat
+        scores = np.where(is_phrase, scores * 1.5, scores)
+        scores[is_phrase & (tf < self.min_phrase_count)] = 0.0
+
+        order = np.argsort(-scores, kind="stable")
+
+        topics: List[str] = []
+        covered = set()
+        for i in order:
+            if scores[i] <= 0 or len(topics) >= self.max_topics:
+                break
+            term = vocab[i]
+            words = term.split()
+            if all(word in covered for word in words):
+                continue
+            topics.append(term)
+            covered.update(words)
+
+        return topics
+
+    def _score_sentiment(
+        self,
+        vocab: List[str],
+        term_idx: np.ndarray
+    ) -> Tuple[float, str]:
+        """Lexicon sentiment mapped to the 0..1 scale used by the LLM tier"""
+        if term_idx.size == 0:
+            return 0.5, "neutral"
+
+        polarity = np.fromiter(
+            (
+                1 if term in POSITIVE_WORDS else -1 if term in NEGATIVE_WORDS else 0
+                for term in vocab
+            ),
+            dtype=np.int8,
+            count=len(vocab),
+        )
+        hits = polarity[term_idx]
+        positive = int(np.count_nonzero(hits > 0))
+        negative = int(np.count_nonzero(hits < 0))
+
+        # Smoothed so a couple of words don't swing the score to an extreme
+        score = 0.5 + 0.5 * (positive - negative) / (positive + negative + 5)
+        score = round(float(score), 2)
+
+        if score >= 0.6:
+            label = "positive"
+        elif score <= 0.4:
+            label = "negative"
+        else:
+            label = "neutral"
+
+        return score, label
+
+    def _find_questions(self, texts: List[str]) -> List[str]:
+        """Segments that look like questions"""
+        questions = [
+            text.strip() for text in texts
+            if text.strip().endswith("?")
+            or (QUESTION_STARTERS.match(text) and "?" in text)
+        ]
+        return questions[:self.max_items]
+
+    def _find_decisions(self, texts: List[str]) -> List[str]:
+        """Segments that look like decisions"""
+        decisions = [text.strip() for text in texts if DECISION_PATTERNS.search(text)]
+        return decisions[:self.max_items]
@@ -2,10 +2,119 @@
 Meeting Analyzer - LLM-powered meeting analysis
 Generates summaries, action items, topics, and insights
 """
+import copy
 import json
-from typing import List, Dict, Optional, Any
+from contextlib import contextmanager
+from typing import List, Dict, Optional, Any, Iterator, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
+from types import SimpleNamespace
+
+try:
+    from opentelemetry import trace
+except ImportError:
+    # Tracing is optional; without it LLM calls are simply not traced
+    trace = None
+
+from .streaming import IncrementalJSONParser, FieldCallback
+from .structured import ANALYSIS_STATS, analysis_json_schema, invalid_fields
+from .dynamics import compute_dynamics
+from .linking import format_timestamp
+from .hedging import HedgedCaller
+
+
+ANALYSIS_SYSTEM_PROMPT = "You are an expert meeting analyst. Always respond with valid JSON."
+
+# Static part of the analysis prompt. Kept byte-identical across calls and
+# placed before any meeting-specific text so provider prompt caching
+# (Anthropic cache_control, OpenAI automatic prefix caching) can reuse it.
+# Both only cache prefixes of at least 1024 tokens, so the field rules and
+# the worked example live here rather than after the transcript.
+ANALYSIS_INSTRUCTIONS = """You are an expert meeting analyst. Analyze the meeting transcript given after these instructions and provide comprehensive insights.
+
+Provide your analysis in JSON format with the following structure:
+
+{
+    "summary": "Concise 3-5 sentence summary of the meeting",
+    "key_topics": ["topic1", "topic2", ...],
+    "action_items": [
+        {
+            "task": "description",
+            "assignee": "person name or email",
+            "due_date": "YYYY-MM-DD or null",
+            "priority": "high|medium|low",
+            "timestamp": "MM:SS of the transcript line where it was agreed, or null"
+        }
+    ],
+    "sentiment": {
+        "score": 0.0 to 1.0,
+        "label": "positive|neutral|negative"
+    },
+    "key_moments": [
+        {
+            "timestamp": "MM:SS of the transcript line where it happened",
+            "description": "what happened",
+            "importance": "high|medium|low"
+        }
+    ],
+    "decisions_made": ["decision1", "decision2", ...],
+    "follow_up_questions": ["question1", "question2", ...],
+    "risks_identified": ["risk1", "risk2", ...],
+    "talk_time_analysis": {
+        "speaker1": percentage,
+        "speaker2": percentage
+    }
+}
+
+Field rules:
+
+- summary: 3-5 sentences in the language of the transcript. Say what the meeting was for, what was decided and what happens next. Do not list every topic and do not repeat the title.
+- key_topics: 3-8 short noun phrases (1-4 words each) naming what was actually discussed, most discussed first. Use the participants' own terms for products, projects and systems. No generic topics like "meeting", "discussion" or "updates".
+- action_items: only commitments someone made or was given during the meeting, not ideas or wishes. One item per task; write the task as an imperative sentence a person could act on without reading the transcript. assignee is the speaker name as written in the transcript, or null when nobody took the task. due_date only when a date or weekday was stated; resolve weekdays to YYYY-MM-DD only if the meeting date is known, otherwise put the stated day into the task text and use null. priority is high for blockers, customer-facing issues and anything due within two days, low for nice-to-haves, medium otherwise. timestamp is the [MM:SS] (or [H:MM:SS]) of the transcript line where the task was agreed, copied exactly.
+- sentiment: score 0.0 is hostile or alarmed, 0.5 neutral and matter-of-fact, 1.0 enthusiastic. label must agree with the score: negative below 0.4, positive above 0.6, neutral in between. Judge the tone of the conversation, not the subject - a calm discussion of an outage is neutral.
+- key_moments: 2-6 turning points - decisions, disagreements, surprises, escalations or commitments - each with the exact timestamp of the line where it happened. importance high for moments that change plans, scope, budget or deadlines.
+- decisions_made: conclusions the group reached, written as statements ("Ship the beta on 1 June"). Proposals that were not agreed belong in follow_up_questions or nowhere.
+- follow_up_questions: open questions the meeting raised but did not answer, phrased as questions.
+- risks_identified: concrete threats to schedule, budget, quality, security or people mentioned or clearly implied, each with its consequence.
+- talk_time_analysis: share of the spoken words per speaker in percent, summing to about 100.
+
+Use empty lists when nothing qualifies; never invent people, dates or numbers that are not in the transcript. Previous meeting summaries, when given, are context only: do not repeat their action items unless they were discussed again.
+
+Example - for this transcript:
+
+[00:00] [Maria]: Quick sync on the checkout release. QA found the coupon bug again yesterday.
+[00:09] [Dev]: I traced it to the currency rounding. I can have a fix by Wednesday.
+[00:16] [Maria]: Then we move the release from Thursday to Monday, agreed?
+[00:20] [Sam]: Agreed, but marketing already announced Thursday. Someone has to tell them.
+[00:27] [Maria]: I'll talk to marketing today. Sam, can you update the status page copy?
+[00:33] [Sam]: Sure, by tomorrow.
+
+the expected response is:
+
+{
+    "summary": "The team met about the checkout release after QA found the coupon bug again. Dev traced it to currency rounding and will fix it by Wednesday. The release moves from Thursday to Monday; Maria will inform marketing, who already announced Thursday, and Sam will update the status page copy.",
+    "key_topics": ["checkout release", "coupon bug", "currency rounding", "release date"],
+    "action_items": [
+        {"task": "Fix the coupon bug caused by currency rounding", "assignee": "Dev", "due_date": null, "priority": "high", "timestamp": "00:09"},
+        {"task": "Tell marketing the release moves from Thursday to Monday", "assignee": "Maria", "due_date": null, "priority": "high", "timestamp": "00:27"},
+        {"task": "Update the status page copy for the Monday release", "assignee": "Sam", "due_date": null, "priority": "medium", "timestamp": "00:33"}
+    ],
+    "sentiment": {"score": 0.55, "label": "neutral"},
+    "key_moments": [
+        {"timestamp": "00:00", "description": "QA reports the coupon bug has returned", "importance": "high"},
+        {"timestamp": "00:16", "description": "Release moved from Thursday to Monday", "importance": "high"},
+        {"timestamp": "00:20", "description": "Marketing has already announced the Thursday date", "importance": "medium"}
+    ],
+    "decisions_made": ["Move the checkout release from Thursday to Monday"],
+    "follow_up_questions": ["Does the Monday date leave QA enough time to verify the fix?"],
+    "risks_identified": ["Customers expect the Thursday release announced by marketing; a late correction may cause confusion"],
+    "talk_time_analysis": {"Maria": 54, "Dev": 24, "Sam": 22}
+}
+
+Be specific and actionable. Extract exact quotes when relevant."""
+
+# Prompt prefixes eligible for explicit cache breakpoints
+CACHEABLE_PREFIXES = [ANALYSIS_INSTRUCTIONS]
 
 
 @dataclass
@@ -36,17 +145,37 @@ class MeetingAnalyzer:
     - Talk time analytics
     - Key moment identification
     - Pre-meeting brief generation
+    - Provider-native structured output with per-field repair
+    - Hedged requests and failover to a fallback provider
     """
     
     def __init__(
         self,
         llm_provider: str = "openai",
         api_key: Optional[str] = None,
-        model: str = "gpt-4o-mini"
+        model: str = "gpt-4o-mini",
+        structured_output: bool = False,
+        repair_fields: bool = True,
+        prompt_caching: bool = True,
+        base_url: Optional[str] = None,
+        fallback: Optional["MeetingAnalyzer"] = None,
+        hedger: Optional[HedgedCaller] = None
     ):
         self.llm_provider = llm_provider
         self.api_key = api_key
         self.model = model
+        self.structured_output = structured_output
+        self.repair_fields = repair_fields
+        self.prompt_caching = prompt_caching
+        self.base_url = base_url
+        
+        # Requests are hedged to / fail over to the fallback analyzer's
+        # provider; the hedger holds the circuit breakers and latency
+        # stats, so callers share one (a private one is made otherwise)
+        self.fallback = fallback
+        self.hedger = hedger or (HedgedCaller() if fallback else None)
+        self.last_usage: Dict[str, int] = {}
+        self.last_provider: Optional[str] = None
         
         if api_key:
             if llm_provider == "openai":
@@ -84,23 +213,82 @@ class MeetingAnalyzer:
         )
         
         # Get LLM response
-        llm_response = self._call_llm(prompt)
+        if self.structured_output:
+            data = self._call_llm_structured(prompt)
+        else:
+            data = self._extract_json(self._call_llm(prompt, validate=self._is_complete_json))
         
-        # Parse response
-        result = self._parse_llm_response(llm_response, transcript)
+        # Re-request only the fields that are missing or malformed
+        data = self._repair_invalid_fields(data, formatted_transcript)
         
-        return result
+        return self._build_result(data, transcript)
+    
+    def analyze_meeting_stream(
+        self,
+        transcript: List[Dict[str, Any]],
+        meeting_title: str = "",
+        previous_meetings: List[str] = None,
+        on_field: Optional[FieldCallback] = None
+    ) -> AnalysisResult:
+        """
+        Analyze meeting transcript while streaming the LLM response
+        
+        Each top-level field (summary, key_topics, action_items, ...) is
+        passed to ``on_field(name, value)`` as soon as the model closes it,
+        instead of waiting for the full completion.
+        
+        Args:
+            transcript: List of transcript segments with speaker info
+            meeting_title: Title of the meeting
+            previous_meetings: Optional summaries of previous meetings
+            on_field: Callback invoked with (field_name, value)
+            
+        Returns:
+            AnalysisResult with all insights
+        """
+        formatted_transcript = self._format_transcript(transcript)
+        
+        prompt = self._build_analysis_prompt(
+            formatted_transcript,
+            meeting_title,
+            previous_meetings
+        )
+        
+        parser = IncrementalJSONParser(on_field=on_field)
+        chunks = []
+        for delta in self._stream_llm(prompt):
+            chunks.append(delta)
+            parser.feed(delta)
+        
+        if parser.done:
+            data = parser.result()
+        else:
+            # Stream ended without a complete object - parse what we have
+            data = self._extract_json("".join(chunks))
+        
+        data = self._repair_invalid_fields(data, formatted_transcript)
+        
+        return self._build_result(data, transcript)
     
     def _format_transcript(
         self,
         transcript: List[Dict[str, Any]]
     ) -> str:
-        """Format transcript for LLM consumption"""
+        """
+        Format transcript for LLM consumption
+        
+        Segments with a start time are prefixed with it ([MM:SS]), so the
+        timestamps of key moments and action items can be linked back to
+        transcript segments.
+        """
         lines = []
         for segment in transcript:
             speaker = segment.get("speaker", "Unknown")
             text = segment.get("text", "")
-            lines.append(f"[{speaker}]: {text}")
+            if segment.get("start") is not None:
+                lines.append(f"[{format_timestamp(segment['start'])}] [{speaker}]: {text}")
+            else:
+                lines.append(f"[{speaker}]: {text}")
         
         return "\n".join(lines)
     
@@ -118,54 +306,46 @@ class MeetingAnalyzer:
             for i, summary in enumerate(previous_meetings, 1):
                 context += f"\nMeeting {i}:\n{summary}\n"
         
-        prompt = f"""You are an expert meeting analyst. Analyze the following meeting transcript and provide comprehensive insights.
+        # Static instructions first so every call shares the same
+        # cacheable prefix; per-meeting content goes after it
+        prompt = f"""{ANALYSIS_INSTRUCTIONS}
 
 Meeting Title: {meeting_title}
 {context}
 
 === TRANSCRIPT ===
 {transcript}
-=== END TRANSCRIPT ===
-
-Provide your analysis in JSON format with the following structure:
-
-{{
-    "summary": "Concise 3-5 sentence summary of the meeting",
-    "key_topics": ["topic1", "topic2", ...],
-    "action_items": [
-        {{
-            "task": "description",
-            "assignee": "person name or email",
-            "due_date": "YYYY-MM-DD or null",
-            "priority": "high|medium|low"
-        }}
-    ],
-    "sentiment": {{
-        "score": 0.0 to 1.0,
-        "label": "positive|neutral|negative"
-    }},
-    "key_moments": [
-        {{
-            "timestamp": "approximate time or description",
-            "description": "what happened",
-            "importance": "high|medium|low"
-        }}
-    ],
-    "decisions_made": ["decision1", "decision2", ...],
-    "follow_up_questions": ["question1", "question2", ...],
-    "risks_identified": ["risk1", "risk2", ...],
-    "talk_time_analysis": {{
-        "speaker1": percentage,
-        "speaker2": percentage
-    }}
-}}
-
-Be specific and actionable. Extract exact quotes when relevant."""
+=== END TRANSCRIPT ==="""
 
         return prompt
     
-    def _call_llm(self, prompt: str) -> str:
-        """Call LLM API"""
+    @property
+    def label(self) -> str:
+        """Provider and model, as used for circuit breakers and metrics"""
+        return f"{self.llm_provider}:{self.model}"
+    
+    def _call_llm(
+        self,
+        prompt: str,
+        validate: Optional[Callable[[str], bool]] = None
+    ) -> str:
+        """
+        Call LLM API
+        
+        With a hedger the call goes through it (and to the fallback
+        provider when configured); ``validate`` decides which answers
+        count as a result - by default any non-empty text.
+        """
+        with self._llm_span("call", prompt):
+            if self.hedger is None:
+                return self._call_provider(prompt)
+            return self._call_hedged(
+                lambda analyzer: analyzer._call_provider(prompt),
+                validate or (lambda text: bool(text and text.strip()))
+            )
+    
+    def _call_provider(self, prompt: str) -> str:
+        """Call this analyzer's own provider"""
         if self.llm_provider == "openai":
             return self._call_openai(prompt)
         elif self.llm_provider == "anthropic":
@@ -173,27 +353,177 @@ Be specific and actionable. Extract exact quotes when relevant."""
         else:
             raise ValueError(f"Unsupported LLM provider: {self.llm_provider}")
     
-    def _call_openai(self, prompt: str) -> str:
-        """Call OpenAI API"""
-        from openai import OpenAI
+    def _call_hedged(
+        self,
+        call: Callable[["MeetingAnalyzer"], Any],
+        valid: Callable[[Any], bool]
+    ) -> Any:
+        """
+        Run ``call`` on this provider, hedged/failed over to the fallback
         
-        client = OpenAI()
+        Each attempt runs on a copy of its analyzer so concurrent attempts
+        do not overwrite each other's ``last_usage``; the winner's usage
+        and provider label are kept.
+        """
+        def attempt(analyzer):
+            worker = copy.copy(analyzer)
+            return call(worker), worker.last_usage
         
-        response = client.chat.completions.create(
-            model=self.model,
-            messages=[
+        attempts = [(self.label, lambda: attempt(self))]
+        if self.fallback is not None:
+            attempts.append((self.fallback.label, lambda: attempt(self.fallback)))
+        
+        provider, (result, usage) = self.hedger.call(attempts, valid=lambda pair: valid(pair[0]))
+        self.last_usage = usage
+        self.last_provider = provider
+        return result
+    
+    @contextmanager
+    def _llm_span(self, operation: str, prompt: str):
+        """
+        Trace span around one LLM request (no-op without opentelemetry)
+        
+        Joins the caller's trace, e.g. the analyze_meeting task run, and
+        carries provider, model, prompt size and the token usage reported
+        by the provider.
+        """
+        if trace is None:
+            yield None
+            return
+        
+        tracer = trace.get_tracer(__name__)
+        with tracer.start_as_current_span(f"llm.{operation}") as span:
+            span.set_attribute("llm.provider", self.llm_provider)
+            span.set_attribute("llm.model", self.model)
+            span.set_attribute("llm.prompt_chars", len(prompt))
+            usage_before = self.last_usage
+            yield span
+            if self.last_usage is not usage_before:
+                for key, value in self.last_usage.items():
+                    span.set_attribute(f"llm.usage.{key}", value)
+    
+    def _client_options(self) -> Dict[str, Any]:
+        """SDK client arguments; with a fallback, failing over replaces SDK retries"""
+        options = {"api_key": self.api_key, "base_url": self.base_url}
+        if self.fallback is not None:
+            options["max_retries"] = 0
+        return options
+    
+    def _split_cacheable(self, prompt: str):
+        """Split prompt into (static cacheable prefix, variable suffix)"""
+        if self.prompt_caching:
+            for prefix in CACHEABLE_PREFIXES:
+                if prompt.startswith(prefix):
+                    return prefix, prompt[len(prefix):]
+        return "", prompt
+    
+    def _openai_params(self, prompt: str) -> Dict[str, Any]:
+        """
+        Chat completion request body for OpenAI (shared by sync/stream/batch)
+        
+        OpenAI caches identical prompt prefixes automatically, so the
+        system message and static instructions must come first.
+        """
+        return {
+            "model": self.model,
+            "messages": [
                 {
                     "role": "system",
-                    "content": "You are an expert meeting analyst. Always respond with valid JSON."
+                    "content": ANALYSIS_SYSTEM_PROMPT
                 },
                 {
                     "role": "user",
                     "content": prompt
                 }
             ],
-            temperature=0.3,
-            max_tokens=2000,
-        )
+            "temperature": 0.3,
+            "max_tokens": 2000,
+        }
+    
+    def _anthropic_params(self, prompt: str) -> Dict[str, Any]:
+        """
+        Messages request body for Anthropic (shared by sync/stream/batch)
+        
+        A known static prefix is sent as its own content block with a
+        ``cache_control`` breakpoint so later calls read it from cache.
+        """
+        prefix, suffix = self._split_cacheable(prompt)
+        
+        if prefix:
+            content = [
+                {
+                    "type": "text",
+                    "text": prefix,
+                    "cache_control": {"type": "ephemeral"},
+                },
+                {
+                    "type": "text",
+                    "text": suffix,
+                },
+            ]
+        else:
+            content = prompt
+        
+        return {
+            "model": self.model,
+            "max_tokens": 2000,
+            "system": ANALYSIS_SYSTEM_PROMPT,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": content
+                }
+            ],
+        }
+    
+    def _record_usage(self, usage: Any) -> Dict[str, int]:
+        """
+        Normalize provider token usage and add it to ANALYSIS_STATS
+        
+        Returns:
+            Dict with prompt_tokens (including cached), cached_tokens,
+            cache_write_tokens and completion_tokens
+        """
+        if usage is None:
+            return {}
+        if isinstance(usage, dict):
+            # Usage the installed SDK does not model (stream chunks) stays a dict
+            usage = SimpleNamespace(**{
+                key: SimpleNamespace(**value) if isinstance(value, dict) else value
+                for key, value in usage.items()
+            })
+        
+        if hasattr(usage, "input_tokens"):
+            # Anthropic: input_tokens excludes cache reads/writes
+            cached = getattr(usage, "cache_read_input_tokens", 0) or 0
+            written = getattr(usage, "cache_creation_input_tokens", 0) or 0
+            normalized = {
+                "prompt_tokens": (usage.input_tokens or 0) + cached + written,
+                "cached_tokens": cached,
+                "cache_write_tokens": written,
+                "completion_tokens": getattr(usage, "output_tokens", 0) or 0,
+            }
+        else:
+            details = getattr(usage, "prompt_tokens_details", None)
+            normalized = {
+                "prompt_tokens": getattr(usage, "prompt_tokens", 0) or 0,
+                "cached_tokens": getattr(details, "cached_tokens", 0) or 0,
+                "cache_write_tokens": 0,
+                "completion_tokens": getattr(usage, "completion_tokens", 0) or 0,
+            }
+        
+        self.last_usage = normalized
+        ANALYSIS_STATS.update(normalized)
+        return normalized
+    
+    def _call_openai(self, prompt: str) -> str:
+        """Call OpenAI API"""
+        from openai import OpenAI
+        
+        client = OpenAI(**self._client_options())
+        
+        response = client.chat.completions.create(**self._openai_params(prompt))
+        self._record_usage(response.usage)
         
         return response.choices[0].message.content
     
@@ -201,20 +531,175 @@ Be specific and actionable. Extract exact quotes when relevant."""
         """Call Anthropic API"""
         from anthropic import Anthropic
         
-        client = Anthropic()
+        client = Anthropic(**self._client_options())
+        
+        response = client.messages.create(**self._anthropic_params(prompt))
+        self._record_usage(response.usage)
+        
+        return response.content[0].text
+    
+    def _call_llm_structured(
+        self,
+        prompt: str,
+        schema: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Call LLM API with provider-native structured output
+        
+        OpenAI uses a strict ``json_schema`` response format, Anthropic a
+        forced tool call whose input schema is the analysis schema.
+        
+        Returns:
+            Parsed response fields
+        """
+        schema = schema or analysis_json_schema()
+        
+        with self._llm_span("structured", prompt):
+            if self.hedger is not None:
+                return self._call_hedged(
+                    lambda analyzer: analyzer._call_provider_structured(prompt, schema),
+                    bool
+                )
+            return self._call_provider_structured(prompt, schema)
+    
+    def _call_provider_structured(
+        self,
+        prompt: str,
+        schema: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Structured call to this analyzer's own provider"""
+        if self.llm_provider == "openai":
+            return self._call_openai_structured(prompt, schema)
+        elif self.llm_provider == "anthropic":
+            return self._call_anthropic_structured(prompt, schema)
+        else:
+            raise ValueError(f"Unsupported LLM provider: {self.llm_provider}")
+    
+    def _call_openai_structured(
+        self,
+        prompt: str,
+        schema: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Call OpenAI API with a JSON schema response format"""
+        from openai import OpenAI
+        
+        client = OpenAI(**self._client_options())
+        
+        response = client.chat.completions.create(
+            **self._openai_params(prompt),
+            response_format={
+                "type": "json_schema",
+                "json_schema": {
+                    "name": "meeting_analysis",
+                    "schema": schema,
+                    "strict": True,
+                },
+            },
+        )
+        self._record_usage(response.usage)
+        
+        return self._extract_json(response.choices[0].message.content)
+    
+    def _call_anthropic_structured(
+        self,
+        prompt: str,
+        schema: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Call Anthropic API forcing a tool call with the analysis schema"""
+        from anthropic import Anthropic
+        
+        client = Anthropic(**self._client_options())
         
         response = client.messages.create(
-            model=self.model,
-            max_tokens=2000,
-            messages=[
+            **self._anthropic_params(prompt),
+            tools=[
                 {
-                    "role": "user",
-                    "content": prompt
+                    "name": "record_meeting_analysis",
+                    "description": "Record the structured meeting analysis",
+                    "input_schema": schema,
                 }
-            ]
+            ],
+            tool_choice={"type": "tool", "name": "record_meeting_analysis"},
         )
+        self._record_usage(response.usage)
         
-        return response.content[0].text
+        for block in response.content:
+            if block.type == "tool_use":
+                return dict(block.input)
+        
+        ANALYSIS_STATS["parse_failures"] += 1
+        return {}
+    
+    def _stream_llm(self, prompt: str) -> Iterator[str]:
+        """
+        Stream LLM API response as text deltas
+        
+        With a hedger, a provider that is slow to send its first delta
+        is hedged with the fallback's stream and the first to start
+        wins; one that fails before its first delta fails over at once.
+        """
+        if self.hedger is None:
+            return self._stream_provider(prompt)
+        
+        def attempt(analyzer):
+            # On a copy, like _call_hedged; a final None delta marks the
+            # end, after the provider reported its usage
+            worker = copy.copy(analyzer)
+            for delta in worker._stream_provider(prompt):
+                yield worker, delta
+            yield worker, None
+        
+        def deltas():
+            for worker, delta in self.hedger.stream(attempts):
+                if delta is None:
+                    self.last_usage = worker.last_usage
+                    self.last_provider = worker.label
+                else:
+                    yield delta
+        
+        attempts = [(self.label, lambda: attempt(self))]
+        if self.fallback is not None:
+            attempts.append((self.fallback.label, lambda: attempt(self.fallback)))
+        return deltas()
+    
+    def _stream_provider(self, prompt: str) -> Iterator[str]:
+        """Stream this analyzer's own provider"""
+        if self.llm_provider == "openai":
+            return self._stream_openai(prompt)
+        elif self.llm_provider == "anthropic":
+            return self._stream_anthropic(prompt)
+        else:
+            raise ValueError(f"Unsupported LLM provider: {self.llm_provider}")
+    
+    def _stream_openai(self, prompt: str) -> Iterator[str]:
+        """Stream OpenAI API response"""
+        from openai import OpenAI
+        
+        client = OpenAI(**self._client_options())
+        
+        stream = client.chat.completions.create(
+            **self._openai_params(prompt),
+            stream=True,
+            # As extra_body: the pinned SDK (openai 1.10) has no stream_options argument
+            extra_body={"stream_options": {"include_usage": True}},
+        )
+        
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+            if getattr(chunk, "usage", None):
+                self._record_usage(chunk.usage)
+    
+    def _stream_anthropic(self, prompt: str) -> Iterator[str]:
+        """Stream Anthropic API response"""
+        from anthropic import Anthropic
+        
+        client = Anthropic(**self._client_options())
+        
+        with client.messages.stream(**self._anthropic_params(prompt)) as stream:
+            for text in stream.text_stream:
+                yield text
+            self._record_usage(stream.get_final_message().usage)
     
     def _parse_llm_response(
         self,
@@ -222,19 +707,119 @@ Be specific and actionable. Extract exact quotes when relevant."""
         transcript: List[Dict[str, Any]]
     ) -> AnalysisResult:
         """Parse LLM response into AnalysisResult"""
-        # Extract JSON from response
-        try:
-            # Find JSON in response (might be wrapped in markdown)
-            import re
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                data = json.loads(json_match.group())
-            else:
-                data = json.loads(response)
-        except json.JSONDecodeError as e:
-            print(f"JSON parse error: {e}")
+        # Extract JSON from response (might be wrapped in markdown).
+        # A single pass up to the matching closing brace, so trailing
+        # text after the object cannot break the match.
+        data = self._extract_json(response)
+        
+        if not data:
             data = self._create_fallback_response()
         
+        return self._build_result(data, transcript)
+    
+    def _is_complete_json(self, response: str) -> bool:
+        """Whether the reply holds a complete JSON object (hedging validity check)"""
+        parser = IncrementalJSONParser()
+        parser.feed(response or "")
+        return parser.done
+    
+    def _extract_json(self, response: str) -> Dict[str, Any]:
+        """
+        Extract the analysis object from raw model text
+        
+        Fields that decoded cleanly are kept even when the reply is
+        truncated or another field is malformed, so only the broken
+        fields need to be repaired.
+        """
+        # Single pass up to the matching closing brace, so trailing
+        # text after the object cannot break the match
+        parser = IncrementalJSONParser()
+        parser.feed(response or "")
+        data = parser.result()
+        
+        if not parser.done:
+            try:
+                parsed = json.loads(response)
+                if isinstance(parsed, dict):
+                    return parsed
+            except (json.JSONDecodeError, TypeError) as e:
+                print(f"JSON parse error: {e}")
+            ANALYSIS_STATS["parse_failures"] += 1
+        
+        return data
+    
+    def _repair_invalid_fields(
+        self,
+        data: Dict[str, Any],
+        formatted_transcript: str
+    ) -> Dict[str, Any]:
+        """
+        Re-request only missing or malformed fields
+        
+        One small follow-up call asks for just the broken fields (with a
+        schema restricted to them) instead of re-running the whole
+        analysis. Fields still invalid afterwards get fallback defaults.
+        
+        Args:
+            data: Parsed response fields
+            formatted_transcript: Transcript as sent in the original prompt
+            
+        Returns:
+            Response fields with repaired values merged in
+        """
+        broken = invalid_fields(data)
+        if not broken:
+            return data
+        
+        data = dict(data)
+        
+        if self.repair_fields:
+            ANALYSIS_STATS["repair_calls"] += 1
+            schema = analysis_json_schema(only=broken)
+            prompt = self._build_repair_prompt(formatted_transcript, schema)
+            
+            try:
+                if self.structured_output:
+                    repaired = self._call_llm_structured(prompt, schema)
+                else:
+                    repaired = self._extract_json(self._call_llm(prompt))
+            except Exception as e:
+                print(f"Field repair error: {e}")
+                repaired = {}
+            
+            for key in broken:
+                if key in repaired and not invalid_fields(repaired, analysis_json_schema(only=[key])):
+                    data[key] = repaired[key]
+                    ANALYSIS_STATS["repaired_fields"] += 1
+        
+        fallback = self._create_fallback_response()
+        for key in invalid_fields(data):
+            data[key] = fallback.get(key)
+        
+        return data
+    
+    def _build_repair_prompt(
+        self,
+        transcript: str,
+        schema: Dict[str, Any]
+    ) -> str:
+        """Build prompt requesting only the given schema fields"""
+        return f"""You are an expert meeting analyst. Analyze the following meeting transcript.
+
+=== TRANSCRIPT ===
+{transcript}
+=== END TRANSCRIPT ===
+
+Respond with a JSON object containing ONLY these fields, matching this JSON schema exactly:
+
+{json.dumps(schema, indent=2)}"""
+    
+    def _build_result(
+        self,
+        data: Dict[str, Any],
+        transcript: List[Dict[str, Any]]
+    ) -> AnalysisResult:
+        """Build AnalysisResult from parsed LLM fields"""
         # Calculate talk time from transcript
         talk_time = self._calculate_talk_time(transcript)
         
@@ -259,23 +844,13 @@ Be specific and actionable. Extract exact quotes when relevant."""
         transcript: List[Dict[str, Any]]
     ) -> Dict[str, float]:
         """Calculate talk time distribution per speaker"""
-        speaker_times = {}
-        total_time = 0
-        
-        for segment in transcript:
-            speaker = segment.get("speaker", "Unknown")
-            start = segment.get("start", 0)
-            end = segment.get("end", 0)
-            duration = end - start
-            
-            speaker_times[speaker] = speaker_times.get(speaker, 0) + duration
-            total_time += duration
+        dynamics = compute_dynamics(transcript)
         
         # Convert to percentages
-        if total_time > 0:
+        if any(d.talk_time_seconds > 0 for d in dynamics.values()):
             return {
-                speaker: round((time / total_time) * 100, 2)
-                for speaker, time in speaker_times.items()
+                speaker: d.talk_time_percent
+                for speaker, d in dynamics.items()
             }
         
         return {}
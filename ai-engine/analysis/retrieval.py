@@ -0,0 +1,315 @@
+"""
+Retrieval - chunk embeddings and retrieval-augmented meeting Q&A
+Hashing embeddings need no model download or network access
+"""
+import re
+import time
+import zlib
+from collections import Counter
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from .meeting_analyzer import MeetingAnalyzer
+from .linking import format_timestamp
+
+
+# Q&A counters (process-wide): questions, retrieval_ms, llm_ms, prompt_tokens
+QA_STATS: Counter = Counter()
+
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+class HashingEmbedder:
+    """
+    Feature-hashing text embedder
+
+    Unigrams and bigrams are hashed (CRC32) into ``dim`` buckets with a
+    sign bit, weighted by sublinear term frequency and L2-normalized, so
+    cosine similarity is a plain dot product.
+    """
+
+    name = "hashing-v1"
+
+    def __init__(self, dim: int = 1024):
+        self.dim = dim
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """Embed texts into an (n, dim) float32 matrix of unit rows"""
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+
+        for row, text in enumerate(texts):
+            tokens = TOKEN_PATTERN.findall(text.lower())
+            features = Counter(tokens)
+            features.update(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
+
+            for feature, count in features.items():
+                h = zlib.crc32(feature.encode("utf-8"))
+                sign = 1.0 if h & 0x80000000 else -1.0
+                matrix[row, h % self.dim] += sign * (1.0 + np.log(count))
+
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+
+@dataclass
+class TextChunk:
+    """Contiguous span of transcript segments"""
+    text: str
+    start: float
+    end: float
+    meeting_id: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+def chunk_transcript(
+    segments: List[Dict[str, Any]],
+    max_chars: int = 1000,
+    meeting_id: Optional[str] = None
+) -> List[TextChunk]:
+    """
+    Group consecutive transcript segments into chunks of ~max_chars
+
+    Segments are never split, so a chunk always starts and ends on a
+    segment boundary and keeps its speaker labels.
+    """
+    chunks: List[TextChunk] = []
+    lines: List[str] = []
+    size = 0
+    start = end = 0.0
+
+    for segment in segments:
+        line = f"{segment.get('speaker', 'Unknown')}: {segment.get('text', '')}"
+        if lines and size + len(line) > max_chars:
+            chunks.append(TextChunk("\n".join(lines), start, end, meeting_id))
+            lines, size = [], 0
+
+        if not lines:
+            start = float(segment.get("start", 0))
+        lines.append(line)
+        size += len(line) + 1
+        end = float(segment.get("end", 0))
+
+    if lines:
+        chunks.append(TextChunk("\n".join(lines), start, end, meeting_id))
+
+    return chunks
+
+
+def top_k(query: np.ndarray, matrix: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Indices and scores of the k rows most similar to ``query``
+
+    Rows and query are expected to be unit vectors (cosine = dot).
+    """
+    if len(matrix) == 0:
+        return np.array([], dtype=np.int64), np.array([], dtype=np.float32)
+
+    scores = matrix @ query.astype(matrix.dtype)
+    k = min(k, len(scores))
+    best = np.argpartition(-scores, k - 1)[:k]
+    best = best[np.argsort(-scores[best])]
+    return best, scores[best].astype(np.float32)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token)"""
+    return (len(text) + 3) // 4
+
+
+def select_context(
+    candidates: List[Tuple[str, float, str]],
+    token_budget: int,
+    max_items: int = 5,
+    min_score: float = 0.0
+) -> List[str]:
+    """
+    Pick the most relevant texts that fit a token budget
+
+    Args:
+        candidates: (id, score, text) tuples
+        token_budget: Maximum total estimated tokens of selected texts
+        max_items: Maximum number of selected texts
+        min_score: Candidates scoring at or below this are skipped
+
+    Returns:
+        Selected ids in descending score order; a candidate that does
+        not fit is skipped so smaller, less relevant ones can still fit
+    """
+    selected = []
+    used = 0
+    for item_id, score, text in sorted(candidates, key=lambda c: -c[1]):
+        if len(selected) >= max_items:
+            break
+        if score <= min_score:
+            continue
+        tokens = estimate_tokens(text)
+        if used + tokens > token_budget:
+            continue
+        selected.append(item_id)
+        used += tokens
+    return selected
+
+
+@dataclass
+class QAResult:
+    """Answer with the spans it was based on and cost/latency metrics"""
+    answer: str
+    sources: List[Dict[str, Any]]
+    retrieval_ms: float
+    llm_ms: float
+    prompt_tokens: int
+
+
+class MeetingQA:
+    """
+    Retrieval-augmented Q&A over meeting transcripts
+
+    Only the top-k retrieved chunks (capped at ``max_context_chars``)
+    are sent to the LLM instead of whole transcripts.
+    """
+
+    def __init__(
+        self,
+        analyzer: MeetingAnalyzer,
+        embedder: Optional[HashingEmbedder] = None,
+        top_k: int = 5,
+        max_context_chars: int = 6000
+    ):
+        self.analyzer = analyzer
+        self.embedder = embedder or HashingEmbedder()
+        self.top_k = top_k
+        self.max_context_chars = max_context_chars
+
+    def retrieve(
+        self,
+        question: str,
+        chunks: List[TextChunk],
+        embeddings: Optional[np.ndarray] = None,
+        k: Optional[int] = None
+    ) -> List[Tuple[TextChunk, float]]:
+        """Top-k chunks for the question (embeds chunks if not given)"""
+        if not chunks:
+            return []
+        if embeddings is None:
+            embeddings = self.embedder.embed([c.text for c in chunks])
+
+        query = self.embedder.embed([question])[0]
+        indices, scores = top_k(query, embeddings, k or self.top_k)
+        return [(chunks[i], float(s)) for i, s in zip(indices, scores) if s > 0]
+
+    def answer(
+        self,
+        question: str,
+        chunks: List[TextChunk],
+        embeddings: Optional[np.ndarray] = None,
+        k: Optional[int] = None,
+        meeting_title: str = ""
+    ) -> QAResult:
+        """
+        Answer a question from retrieved transcript spans
+
+        Args:
+            question: User question
+            chunks: Candidate chunks (one meeting or a whole organization)
+            embeddings: Precomputed chunk embeddings, rows aligned with chunks
+            k: Number of chunks to retrieve (default: self.top_k)
+            meeting_title: Title shown to the LLM for single-meeting questions
+
+        Returns:
+            QAResult
+        """
+        started = time.perf_counter()
+        retrieved = self.retrieve(question, chunks, embeddings, k)
+        retrieval_ms = (time.perf_counter() - started) * 1000
+
+        return self.answer_retrieved(question, retrieved, retrieval_ms, meeting_title)
+
+    def answer_retrieved(
+        self,
+        question: str,
+        retrieved: List[Tuple[TextChunk, float]],
+        retrieval_ms: float = 0.0,
+        meeting_title: str = ""
+    ) -> QAResult:
+        """
+        Answer a question from chunks retrieved elsewhere
+
+        For retrieval served by a search index (e.g. the organization's
+        VectorIndex) instead of an in-memory embedding matrix.
+
+        Args:
+            question: User question
+            retrieved: (chunk, score) pairs in descending score order
+            retrieval_ms: Time the caller spent retrieving them
+            meeting_title: Title shown to the LLM for single-meeting questions
+
+        Returns:
+            QAResult
+        """
+        selected = []
+        size = 0
+        for chunk, score in retrieved:
+            if selected and size + len(chunk.text) > self.max_context_chars:
+                break
+            selected.append((chunk, score))
+            size += len(chunk.text)
+
+        if not selected:
+            answer, llm_ms, prompt_tokens = "No relevant discussion found in the transcripts.", 0.0, 0
+        else:
+            prompt = self._build_prompt(question, selected, meeting_title)
+            self.analyzer.last_usage = {}
+            started = time.perf_counter()
+            answer = self.analyzer._call_llm(prompt).strip()
+            llm_ms = (time.perf_counter() - started) * 1000
+            prompt_tokens = self.analyzer.last_usage.get("prompt_tokens") or estimate_tokens(prompt)
+
+        QA_STATS.update({
+            "questions": 1,
+            "retrieval_ms": round(retrieval_ms),
+            "llm_ms": round(llm_ms),
+            "prompt_tokens": prompt_tokens,
+        })
+
+        return QAResult(
+            answer=answer,
+            sources=[
+                {
+                    "meeting_id": chunk.meeting_id,
+                    "start": chunk.start,
+                    "end": chunk.end,
+                    "text": chunk.text,
+                    "score": round(score, 4),
+                }
+                for chunk, score in selected
+            ],
+            retrieval_ms=round(retrieval_ms, 2),
+            llm_ms=round(llm_ms, 2),
+            prompt_tokens=prompt_tokens,
+        )
+
+    def _build_prompt(
+        self,
+        question: str,
+        selected: List[Tuple[TextChunk, float]],
+        meeting_title: str
+    ) -> str:
+        """Build Q&A prompt from retrieved spans only"""
+        excerpts = "\n\n".join(
+            f"[{i + 1}] ({format_timestamp(chunk.start)}-{format_timestamp(chunk.end)})\n{chunk.text}"
+            for i, (chunk, _) in enumerate(selected)
+        )
+        title = f"Meeting Title: {meeting_title}\n\n" if meeting_title else ""
+
+        return f"""You are answering a question about meetings using only the transcript excerpts below.
+
+{title}=== EXCERPTS ===
+{excerpts}
+=== END EXCERPTS ===
+
+Question: {question}
+
+Answer concisely. Cite excerpts by number like [1]. If the excerpts do not contain the answer, say so."""
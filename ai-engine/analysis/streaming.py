@@ -0,0 +1,128 @@
+"""
+Incremental JSON parsing for streamed LLM output
+Emits top-level fields of the analysis object as soon as they close
+"""
+import json
+from typing import Any, Callable, Dict, Optional
+
+
+FieldCallback = Callable[[str, Any], None]
+
+
+class IncrementalJSONParser:
+    """
+    Single-pass parser for a streamed top-level JSON object
+
+    Token deltas are fed in as they arrive. Whenever a top-level value
+    (string, number, array, object) is complete it is decoded and passed
+    to ``on_field(key, value)``. Text before the first ``{`` (e.g. a
+    markdown fence) and after the closing ``}`` is ignored.
+    """
+
+    def __init__(self, on_field: Optional[FieldCallback] = None):
+        self.on_field = on_field
+        self.fields: Dict[str, Any] = {}
+        self.done = False
+
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._key: Optional[str] = None
+        self._key_start: Optional[int] = None
+        self._value_start: Optional[int] = None
+        self._expect_key = True
+
+    def feed(self, delta: str) -> None:
+        """Consume the next chunk of model output"""
+        if self.done or not delta:
+            return
+
+        self._text += delta
+        text = self._text
+
+        for i in range(self._pos, len(text)):
+            char = text[i]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1:
+                        self._close_string(text, i)
+                continue
+
+            if self._depth == 0:
+                if char == "{":
+                    self._depth = 1
+                    self._expect_key = True
+                continue
+
+            if char == '"':
+                self._in_string = True
+                if self._depth == 1:
+                    if self._expect_key:
+                        self._key_start = i
+                    elif self._value_start is None:
+                        self._value_start = i
+            elif char in "{[":
+                if self._depth == 1 and self._value_start is None:
+                    self._value_start = i
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 1 and self._value_start is not None:
+                    self._emit(text[self._value_start:i + 1])
+                elif self._depth == 0:
+                    self._flush_scalar(text, i)
+                    self.done = True
+                    self._pos = i + 1
+                    return
+            elif self._depth == 1:
+                if char == ":":
+                    self._expect_key = False
+                elif char == ",":
+                    self._flush_scalar(text, i)
+                    self._expect_key = True
+                elif not char.isspace() and self._value_start is None:
+                    self._value_start = i
+
+        self._pos = len(text)
+
+    def result(self) -> Dict[str, Any]:
+        """Fields decoded so far"""
+        return dict(self.fields)
+
+    def _close_string(self, text: str, end: int) -> None:
+        if self._expect_key and self._key_start is not None:
+            self._key = json.loads(text[self._key_start:end + 1])
+            self._key_start = None
+        elif self._value_start is not None:
+            self._emit(text[self._value_start:end + 1])
+
+    def _flush_scalar(self, text: str, end: int) -> None:
+        """Emit a pending number/bool/null value terminated at ``end``"""
+        if self._value_start is not None:
+            self._emit(text[self._value_start:end])
+
+    def _emit(self, raw: str) -> None:
+        key = self._key
+        self._key = None
+        self._value_start = None
+
+        if key is None:
+            return
+
+        try:
+            value = json.loads(raw)
+        except json.JSONDecodeError as e:
+            print(f"Streaming JSON parse error for '{key}': {e}")
+            return
+
+        self.fields[key] = value
+        if self.on_field:
+            self.on_field(key, value)
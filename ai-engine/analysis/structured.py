@@ -0,0 +1,166 @@
+"""
+Structured output support for meeting analysis
+JSON schema generated from AnalysisResult, field validation and counters
+"""
+import typing
+from collections import Counter
+from dataclasses import fields
+from typing import Any, Dict, List, Optional
+
+
+# Parse/repair counters (process-wide)
+ANALYSIS_STATS: Counter = Counter()
+
+# AnalysisResult fields computed locally rather than by the LLM
+COMPUTED_FIELDS = {"talk_time_distribution", "knowledge_graph_updates"}
+
+# Fields the LLM returns nested under a single key
+GROUPED_FIELDS = {
+    "sentiment_score": ("sentiment", "score"),
+    "sentiment_label": ("sentiment", "label"),
+}
+
+# Item shapes for list-of-object fields
+ITEM_SCHEMAS = {
+    "action_items": {
+        "type": "object",
+        "properties": {
+            "task": {"type": "string"},
+            "assignee": {"type": ["string", "null"]},
+            "due_date": {"type": ["string", "null"]},
+            "priority": {"type": "string", "enum": ["high", "medium", "low"]},
+            "timestamp": {"type": ["string", "null"]},
+        },
+        "required": ["task", "assignee", "due_date", "priority", "timestamp"],
+        "additionalProperties": False,
+    },
+    "key_moments": {
+        "type": "object",
+        "properties": {
+            "timestamp": {"type": "string"},
+            "description": {"type": "string"},
+            "importance": {"type": "string", "enum": ["high", "medium", "low"]},
+        },
+        "required": ["timestamp", "description", "importance"],
+        "additionalProperties": False,
+    },
+}
+
+_JSON_TYPES = {
+    "string": str,
+    "number": (int, float),
+    "array": list,
+    "object": dict,
+}
+
+
+def _type_schema(name: str, annotation: Any) -> Dict[str, Any]:
+    """Map a dataclass field annotation to a JSON schema fragment"""
+    origin = typing.get_origin(annotation)
+
+    if origin in (list, List):
+        (item_type,) = typing.get_args(annotation) or (Any,)
+        if name in ITEM_SCHEMAS:
+            return {"type": "array", "items": ITEM_SCHEMAS[name]}
+        return {"type": "array", "items": _type_schema(name, item_type)}
+    if annotation is str:
+        return {"type": "string"}
+    if annotation in (float, int):
+        return {"type": "number"}
+    return {"type": "object"}
+
+
+def analysis_json_schema(
+    only: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Build the JSON schema for the LLM analysis response
+
+    Derived from ``AnalysisResult`` so the schema follows the dataclass;
+    locally computed fields are skipped and grouped fields (sentiment)
+    become nested objects.
+
+    Args:
+        only: Restrict the schema to these top-level response keys
+
+    Returns:
+        JSON schema dict (strict-mode compatible)
+    """
+    from .meeting_analyzer import AnalysisResult
+
+    hints = typing.get_type_hints(AnalysisResult)
+    properties: Dict[str, Any] = {}
+
+    for f in fields(AnalysisResult):
+        if f.name in COMPUTED_FIELDS:
+            continue
+
+        if f.name in GROUPED_FIELDS:
+            group, sub = GROUPED_FIELDS[f.name]
+            node = properties.setdefault(group, {
+                "type": "object",
+                "properties": {},
+                "required": [],
+                "additionalProperties": False,
+            })
+            node["properties"][sub] = _type_schema(f.name, hints[f.name])
+            node["required"].append(sub)
+            continue
+
+        properties[f.name] = _type_schema(f.name, hints[f.name])
+
+    if only is not None:
+        properties = {k: v for k, v in properties.items() if k in only}
+
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False,
+    }
+
+
+def _matches(value: Any, schema: Dict[str, Any]) -> bool:
+    """Shallow type check of a value against a schema fragment"""
+    expected = schema.get("type")
+    if isinstance(expected, list):
+        return any(_matches(value, {"type": t}) for t in expected)
+    if expected == "null":
+        return value is None
+    if expected == "number" and isinstance(value, bool):
+        return False
+    if not isinstance(value, _JSON_TYPES.get(expected, object)):
+        return False
+
+    if expected == "object" and "properties" in schema:
+        return all(
+            key in value and _matches(value[key], sub)
+            for key, sub in schema["properties"].items()
+        )
+    if expected == "array" and "items" in schema:
+        item_type = schema["items"].get("type")
+        return all(
+            _matches(item, {"type": item_type}) for item in value
+        )
+    return True
+
+
+def invalid_fields(
+    data: Dict[str, Any],
+    schema: Optional[Dict[str, Any]] = None
+) -> List[str]:
+    """
+    Top-level response keys that are missing or have the wrong shape
+
+    Args:
+        data: Parsed LLM response
+        schema: Schema to validate against (defaults to the full schema)
+
+    Returns:
+        List of field names needing repair
+    """
+    schema = schema or analysis_json_schema()
+    return [
+        key for key, sub in schema["properties"].items()
+        if key not in data or not _matches(data[key], sub)
+    ]
@@ -0,0 +1,217 @@
+"""
+Template Engine - run custom AI templates over a shared transcript context
+"""
+import json
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass
+
+from .meeting_analyzer import MeetingAnalyzer
+
+
+PLACEHOLDER_PATTERN = re.compile(r"\{(transcript|meeting_title|participants)\}")
+
+
+@dataclass
+class TemplateSpec:
+    """Template definition as stored in ai_templates"""
+    id: str
+    updated_at: Any
+    name: str
+    prompt_template: str
+    output_format: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class CompiledTemplate:
+    """Template pre-split into literal text and placeholder names"""
+    id: str
+    name: str
+    parts: List[Tuple[str, Optional[str]]]
+    format_instructions: str
+    expects_json: bool
+
+    def render(self, values: Dict[str, str]) -> str:
+        body = "".join(
+            literal + (values.get(name, "") if name else "")
+            for literal, name in self.parts
+        )
+        return body + self.format_instructions
+
+
+@dataclass
+class PreparedContext:
+    """Transcript context shared by all templates of a meeting"""
+    meeting_title: str
+    participants: str
+    transcript: str
+
+
+@dataclass
+class TemplateResult:
+    """Output of one template run"""
+    template_id: str
+    name: str
+    raw: str
+    output: Any
+    error: Optional[str] = None
+
+
+class TemplateEngine:
+    """
+    Runs user-defined AI templates against one prepared transcript
+
+    - Templates are compiled once and cached by (id, updated_at), so an
+      edited template is recompiled automatically
+    - The transcript is formatted and compacted once per meeting and
+      sent as the leading block of every prompt (shared prefix)
+    - Templates run in parallel threads (LLM calls are I/O bound)
+
+    Supported placeholders: {meeting_title}, {participants}, {transcript}.
+    """
+
+    def __init__(
+        self,
+        analyzer: MeetingAnalyzer,
+        max_workers: int = 4,
+        max_transcript_chars: int = 60000,
+        cache_size: int = 256
+    ):
+        self.analyzer = analyzer
+        self.max_workers = max_workers
+        self.max_transcript_chars = max_transcript_chars
+        self.cache_size = cache_size
+        self._compiled: "OrderedDict[Tuple[str, str], CompiledTemplate]" = OrderedDict()
+
+    def compile(self, spec: TemplateSpec) -> CompiledTemplate:
+        """Compile template (cached by id + updated_at)"""
+        key = (str(spec.id), str(spec.updated_at))
+        compiled = self._compiled.get(key)
+        if compiled is not None:
+            self._compiled.move_to_end(key)
+            return compiled
+
+        parts: List[Tuple[str, Optional[str]]] = []
+        position = 0
+        for match in PLACEHOLDER_PATTERN.finditer(spec.prompt_template):
+            parts.append((spec.prompt_template[position:match.start()], match.group(1)))
+            position = match.end()
+        parts.append((spec.prompt_template[position:], None))
+
+        expects_json = bool(spec.output_format)
+        format_instructions = ""
+        if expects_json:
+            format_instructions = (
+                "\n\nRespond with valid JSON matching this format:\n"
+                + json.dumps(spec.output_format, indent=2, ensure_ascii=False)
+            )
+
+        compiled = CompiledTemplate(
+            id=str(spec.id),
+            name=spec.name,
+            parts=parts,
+            format_instructions=format_instructions,
+            expects_json=expects_json,
+        )
+
+        self._compiled[key] = compiled
+        if len(self._compiled) > self.cache_size:
+            self._compiled.popitem(last=False)
+
+        return compiled
+
+    def prepare_context(
+        self,
+        transcript: List[Dict[str, Any]],
+        meeting_title: str = "",
+        participants: Optional[List[str]] = None
+    ) -> PreparedContext:
+        """
+        Format and compact the transcript once for all templates
+
+        Consecutive segments of the same speaker are merged and
+        whitespace collapsed; the result is capped at
+        ``max_transcript_chars`` (keeping the beginning and the end).
+        """
+        merged: List[Dict[str, Any]] = []
+        for segment in transcript:
+            text = " ".join((segment.get("text") or "").split())
+            if not text:
+                continue
+            speaker = segment.get("speaker", "Unknown")
+            if merged and merged[-1]["speaker"] == speaker:
+                merged[-1]["text"] += " " + text
+            else:
+                merged.append({"speaker": speaker, "text": text})
+
+        formatted = self.analyzer._format_transcript(merged)
+        if len(formatted) > self.max_transcript_chars:
+            half = self.max_transcript_chars // 2
+            formatted = formatted[:half] + "\n[...]\n" + formatted[-half:]
+
+        if participants is None:
+            participants = list(dict.fromkeys(s["speaker"] for s in merged))
+
+        return PreparedContext(
+            meeting_title=meeting_title,
+            participants=", ".join(p for p in participants if p),
+            transcript=formatted,
+        )
+
+    def build_prompt(
+        self,
+        compiled: CompiledTemplate,
+        context: PreparedContext
+    ) -> str:
+        """Shared transcript block first, then the template instructions"""
+        instructions = compiled.render({
+            "meeting_title": context.meeting_title,
+            "participants": context.participants,
+            "transcript": "(the transcript above)",
+        })
+
+        return f"""Meeting Title: {context.meeting_title}
+Participants: {context.participants}
+
+=== TRANSCRIPT ===
+{context.transcript}
+=== END TRANSCRIPT ===
+
+{instructions}"""
+
+    def run(
+        self,
+        templates: List[TemplateSpec],
+        context: PreparedContext
+    ) -> List[TemplateResult]:
+        """
+        Run all templates against one prepared context in parallel
+
+        Returns:
+            One TemplateResult per template, in input order
+        """
+        compiled = [self.compile(spec) for spec in templates]
+        if not compiled:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(compiled))) as pool:
+            return list(pool.map(lambda c: self._run_one(c, context), compiled))
+
+    def _run_one(
+        self,
+        compiled: CompiledTemplate,
+        context: PreparedContext
+    ) -> TemplateResult:
+        try:
+            raw = self.analyzer._call_llm(self.build_prompt(compiled, context))
+        except Exception as e:
+            print(f"Template '{compiled.name}' error: {e}")
+            return TemplateResult(compiled.id, compiled.name, "", None, error=str(e))
+
+        output: Any = raw
+        if compiled.expects_json:
+            output = self.analyzer._extract_json(raw)
+
+        return TemplateResult(compiled.id, compiled.name, raw, output)
@@ -0,0 +1,398 @@
+"""
+Vector Index - append-only, memory-mapped float16 index per organization
+Brute-force numpy search, IVF (inverted file) search once trained
+"""
+import os
+import fcntl
+import threading
+import uuid
+from contextlib import contextmanager
+from typing import List, Optional, Sequence, Tuple, Union
+from dataclasses import dataclass
+
+import numpy as np
+
+
+# Kinds of indexed rows
+KIND_SUMMARY = 0
+KIND_CHUNK = 1
+KIND_PROFILE = 2  # title, participants and topics
+
+# Per-row metadata stored next to the vectors (26 bytes per row)
+ROW_DTYPE = np.dtype([
+    ("meeting_id", "V16"),
+    ("kind", "u1"),
+    ("chunk_index", "<i4"),
+    ("deleted", "u1"),
+    ("list_id", "<i4"),  # IVF list, -1 until the index is trained
+])
+
+
+@dataclass
+class SearchHit:
+    """One search result"""
+    meeting_id: str
+    kind: int
+    chunk_index: int
+    score: float
+
+
+@dataclass
+class _Mapping:
+    """Files mapped by one ``_map`` call, published to searches as a unit"""
+    key: Tuple[int, ...]
+    vectors: Optional[np.memmap] = None
+    rows: Optional[np.memmap] = None
+    list_ids: Optional[np.ndarray] = None
+    centroids: Optional[np.ndarray] = None
+
+    @property
+    def size(self) -> int:
+        return self.key[0]
+
+
+class VectorIndex:
+    """
+    Append-only float16 vector index backed by flat files
+
+    ``vectors.f16`` holds row-major float16 unit vectors and ``rows.bin``
+    the aligned ROW_DTYPE records. Both are memory-mapped for search and
+    only appended to, so indexing a new meeting never rewrites existing
+    data. Removing a meeting flags its rows as deleted in place; once
+    more than ``max_deleted_ratio`` of the rows are deleted, ``remove``
+    compacts the files, so re-indexing meetings does not grow the index
+    or the rows every search scans.
+
+    Small indexes are searched brute force. Once ``train`` has run
+    (``centroids.npy`` exists) every row belongs to one of ``nlist``
+    spherical k-means lists and a search only scores the rows of the
+    ``nprobe`` lists closest to the query, plus rows not yet assigned.
+
+    Appends, removals and training take an exclusive ``flock`` so
+    several workers can write the same organization safely. Searches
+    re-map the files only when they changed since the previous search,
+    under a shared lock so they never map a half-swapped compaction.
+    The new mapping replaces the old one in a single assignment and each
+    search reads it once, so threads searching while another remaps
+    always see a consistent set of arrays.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        dim: int,
+        block_rows: int = 65536,
+        nprobe: int = 16,
+        max_deleted_ratio: Optional[float] = 0.25
+    ):
+        self.path = path
+        self.dim = dim
+        self.block_rows = block_rows
+        self.nprobe = nprobe
+        self.max_deleted_ratio = max_deleted_ratio
+        self._mapping: Optional[_Mapping] = None
+        self._map_lock = threading.Lock()
+
+    @property
+    def vectors_path(self) -> str:
+        return os.path.join(self.path, "vectors.f16")
+
+    @property
+    def rows_path(self) -> str:
+        return os.path.join(self.path, "rows.bin")
+
+    @property
+    def centroids_path(self) -> str:
+        return os.path.join(self.path, "centroids.npy")
+
+    @property
+    def trained(self) -> bool:
+        return os.path.exists(self.centroids_path)
+
+    def __len__(self) -> int:
+        if not os.path.exists(self.rows_path):
+            return 0
+        return os.path.getsize(self.rows_path) // ROW_DTYPE.itemsize
+
+    @contextmanager
+    def _locked(self, shared: bool = False):
+        os.makedirs(self.path, exist_ok=True)
+        with open(os.path.join(self.path, ".lock"), "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _assign(self, vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        """Nearest centroid per row, computed in blocks"""
+        assignments = np.empty(len(vectors), dtype=np.int32)
+        for start in range(0, len(vectors), self.block_rows):
+            block = np.asarray(vectors[start:start + self.block_rows], dtype=np.float32)
+            assignments[start:start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+        return assignments
+
+    def append(
+        self,
+        meeting_id: str,
+        vectors: np.ndarray,
+        kinds: List[int],
+        chunk_indices: List[int]
+    ) -> None:
+        """
+        Append vectors for one meeting
+
+        Args:
+            meeting_id: UUID of the meeting
+            vectors: (n, dim) unit vectors
+            kinds: KIND_SUMMARY, KIND_CHUNK or KIND_PROFILE per row
+            chunk_indices: Chunk index per row (-1 for summaries)
+        """
+        if len(vectors) == 0:
+            return
+        if vectors.shape[1] != self.dim:
+            raise ValueError(f"Expected dim {self.dim}, got {vectors.shape[1]}")
+
+        rows = np.zeros(len(vectors), dtype=ROW_DTYPE)
+        rows["meeting_id"] = np.void(uuid.UUID(str(meeting_id)).bytes)
+        rows["kind"] = kinds
+        rows["chunk_index"] = chunk_indices
+        rows["list_id"] = -1
+
+        with self._locked():
+            if self.trained:
+                rows["list_id"] = self._assign(vectors, np.load(self.centroids_path))
+
+            # Vectors first: a reader never sees a row without its vector
+            with open(self.vectors_path, "ab") as f:
+                f.write(np.ascontiguousarray(vectors, dtype=np.float16).tobytes())
+            with open(self.rows_path, "ab") as f:
+                f.write(rows.tobytes())
+
+    def remove(self, meeting_id: str) -> int:
+        """
+        Flag all rows of a meeting as deleted, return number of rows
+
+        Compacts the index when deleted rows exceed ``max_deleted_ratio``.
+        """
+        if len(self) == 0:
+            return 0
+
+        key = np.void(uuid.UUID(str(meeting_id)).bytes)
+        with self._locked():
+            rows = np.memmap(self.rows_path, dtype=ROW_DTYPE, mode="r+")
+            matches = np.flatnonzero((rows["meeting_id"] == key) & (rows["deleted"] == 0))
+            rows["deleted"][matches] = 1
+            rows.flush()
+            deleted_ratio = float((rows["deleted"] != 0).mean())
+            del rows
+
+            if self.max_deleted_ratio is not None and deleted_ratio > self.max_deleted_ratio:
+                self._compact()
+
+        return len(matches)
+
+    def train(
+        self,
+        nlist: Optional[int] = None,
+        sample_size: int = 50000,
+        iterations: int = 10,
+        seed: int = 0
+    ) -> int:
+        """
+        Train IVF lists (spherical k-means) and assign every row
+
+        Args:
+            nlist: Number of lists (default: ~sqrt of the row count)
+            sample_size: Rows sampled for k-means
+            iterations: k-means iterations
+
+        Returns:
+            Number of lists
+        """
+        with self._locked():
+            n = len(self)
+            if n == 0:
+                return 0
+
+            nlist = min(nlist or max(1, int(np.sqrt(n))), n)
+            vectors = np.memmap(self.vectors_path, dtype=np.float16, mode="r", shape=(n, self.dim))
+
+            rng = np.random.default_rng(seed)
+            sample = np.sort(rng.choice(n, size=min(n, sample_size), replace=False))
+            data = np.asarray(vectors[sample], dtype=np.float32)
+            centroids = data[rng.choice(len(data), size=nlist, replace=False)].copy()
+
+            for _ in range(iterations):
+                assignments = np.argmax(data @ centroids.T, axis=1)
+                sums = np.zeros_like(centroids)
+                np.add.at(sums, assignments, data)
+                empty = ~sums.any(axis=1)
+                sums[empty] = data[rng.choice(len(data), size=int(empty.sum()))]
+                norms = np.linalg.norm(sums, axis=1, keepdims=True)
+                norms[norms == 0] = 1.0
+                centroids = sums / norms
+
+            rows = np.memmap(self.rows_path, dtype=ROW_DTYPE, mode="r+", shape=(n,))
+            rows["list_id"] = self._assign(vectors, centroids)
+            rows.flush()
+            del rows, vectors
+
+            with open(self.centroids_path + ".tmp", "wb") as f:
+                np.save(f, centroids.astype(np.float32))
+            os.replace(self.centroids_path + ".tmp", self.centroids_path)
+
+        return nlist
+
+    def compact(self) -> int:
+        """Rewrite files without deleted rows, return rows dropped"""
+        with self._locked():
+            return self._compact()
+
+    def _compact(self) -> int:
+        """compact() for a caller holding the exclusive lock"""
+        n = len(self)
+        if n == 0:
+            return 0
+        rows = np.fromfile(self.rows_path, dtype=ROW_DTYPE, count=n)
+        vectors = np.memmap(self.vectors_path, dtype=np.float16, mode="r", shape=(n, self.dim))
+        live = np.flatnonzero(rows["deleted"] == 0)
+
+        with open(self.vectors_path + ".tmp", "wb") as f:
+            for start in range(0, len(live), self.block_rows):
+                f.write(np.ascontiguousarray(vectors[live[start:start + self.block_rows]]).tobytes())
+        rows[live].tofile(self.rows_path + ".tmp")
+        del vectors
+
+        os.replace(self.vectors_path + ".tmp", self.vectors_path)
+        os.replace(self.rows_path + ".tmp", self.rows_path)
+
+        return n - len(live)
+
+    def _file_key(self) -> Tuple[int, ...]:
+        """Row count, rows file inode and centroids mtime - changes on any write"""
+        n = len(self)
+        key = (n,)
+        if n:
+            key = (n, os.stat(self.rows_path).st_ino)
+            if self.trained:
+                key += (os.stat(self.centroids_path).st_mtime_ns,)
+        return key
+
+    def _map(self) -> _Mapping:
+        """Current mapping of the files, remapped if they changed"""
+        mapping = self._mapping
+        key = self._file_key()
+        if mapping is not None and mapping.key == key:
+            return mapping
+
+        with self._map_lock:
+            if self._mapping is not None and self._mapping.key == self._file_key():
+                return self._mapping
+
+            if key[0] == 0:
+                mapping = _Mapping(key)
+            else:
+                # Writers replace both files during compaction; map them as a pair
+                with self._locked(shared=True):
+                    key = self._file_key()
+                    mapping = _Mapping(key)
+                    n = mapping.size
+                    if n:
+                        mapping.rows = np.memmap(self.rows_path, dtype=ROW_DTYPE, mode="r", shape=(n,))
+                        mapping.vectors = np.memmap(
+                            self.vectors_path, dtype=np.float16, mode="r", shape=(n, self.dim)
+                        )
+                        if self.trained:
+                            mapping.centroids = np.load(self.centroids_path)
+                            mapping.list_ids = np.array(mapping.rows["list_id"])
+
+            self._mapping = mapping
+        return mapping
+
+    def _candidates(self, query: np.ndarray, mapping: Optional[_Mapping] = None) -> Optional[np.ndarray]:
+        """Row indices in the probed IVF lists (None = scan everything)"""
+        mapping = mapping or self._map()
+        if mapping.centroids is None or self.nprobe >= len(mapping.centroids):
+            return None
+
+        probes = np.argpartition(-(mapping.centroids @ query), self.nprobe - 1)[:self.nprobe]
+        in_probes = np.zeros(len(mapping.centroids) + 1, dtype=bool)
+        in_probes[probes] = True
+        in_probes[-1] = True  # list_id -1: appended before training
+        return np.flatnonzero(in_probes[mapping.list_ids])
+
+    def search(
+        self,
+        query: np.ndarray,
+        k: int = 10,
+        kind: Optional[Union[int, Sequence[int]]] = None
+    ) -> List[SearchHit]:
+        """
+        Top-k rows by cosine similarity
+
+        Args:
+            query: (dim,) unit vector
+            k: Number of results
+            kind: Restrict to one kind of rows, or to several
+
+        Returns:
+            Hits ordered by descending score
+        """
+        mapping = self._map()
+        n = mapping.size
+        if n == 0 or k <= 0:
+            return []
+
+        query = np.asarray(query, dtype=np.float32)
+        candidates = self._candidates(query, mapping)
+        total = n if candidates is None else len(candidates)
+
+        best_rows = np.empty(0, dtype=np.int64)
+        best_scores = np.empty(0, dtype=np.float32)
+
+        for start in range(0, total, self.block_rows):
+            stop = min(start + self.block_rows, total)
+            if candidates is None:
+                row_ids = np.arange(start, stop)
+                vectors, rows = mapping.vectors[start:stop], mapping.rows[start:stop]
+            else:
+                row_ids = candidates[start:stop]
+                vectors, rows = mapping.vectors[row_ids], mapping.rows[row_ids]
+
+            scores = vectors.astype(np.float32) @ query
+            mask = rows["deleted"] != 0
+            if kind is not None:
+                mask |= ~np.isin(rows["kind"], kind)
+            scores[mask] = -np.inf
+
+            take = min(k, len(scores))
+            top = np.argpartition(-scores, take - 1)[:take]
+            best_rows = np.concatenate([best_rows, row_ids[top]])
+            best_scores = np.concatenate([best_scores, scores[top]])
+
+            if len(best_rows) > k:
+                keep = np.argpartition(-best_scores, k - 1)[:k]
+                best_rows, best_scores = best_rows[keep], best_scores[keep]
+
+        order = np.argsort(-best_scores)
+        hits = []
+        for i in order:
+            score = float(best_scores[i])
+            if not np.isfinite(score) or score <= 0:
+                continue
+            row = mapping.rows[best_rows[i]]
+            hits.append(SearchHit(
+                meeting_id=str(uuid.UUID(bytes=row["meeting_id"].tobytes())),
+                kind=int(row["kind"]),
+                chunk_index=int(row["chunk_index"]),
+                score=round(score, 4),
+            ))
+        return hits
+
+    def stats(self) -> Tuple[int, int]:
+        """(total rows, deleted rows)"""
+        mapping = self._map()
+        if mapping.size == 0:
+            return 0, 0
+        return mapping.size, int((mapping.rows["deleted"] != 0).sum())
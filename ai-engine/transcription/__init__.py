@@ -2,5 +2,6 @@
 Transcription module
 """
 from .whisper_transcriber import WhisperTranscriber, TranscriberConfig
+from .audio import decode_audio_stream, SAMPLE_RATE
 
-__all__ = ["WhisperTranscriber", "TranscriberConfig"]
+__all__ = ["WhisperTranscriber", "TranscriberConfig", "decode_audio_stream", "SAMPLE_RATE"]
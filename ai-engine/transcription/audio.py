@@ -0,0 +1,79 @@
+"""
+Audio decoding - encoded byte streams to Whisper-ready PCM via ffmpeg
+"""
+import subprocess
+import tempfile
+import threading
+from typing import Iterable
+
+import numpy as np
+
+
+SAMPLE_RATE = 16000  # Whisper expects 16 kHz mono
+
+
+def decode_audio_stream(
+    chunks: Iterable[bytes],
+    sample_rate: int = SAMPLE_RATE
+) -> np.ndarray:
+    """
+    Decode an encoded audio stream to mono float32 PCM with ffmpeg
+
+    Chunks are written to ffmpeg's stdin from a thread while PCM is read
+    from its stdout, so decoding runs while the recording is still
+    downloading and nothing is written to disk. The container must be
+    decodable from a pipe (mp3, wav, ogg, webm, ... - not mp4/m4a with
+    the index at the end).
+
+    Args:
+        chunks: Encoded audio bytes in order (e.g. a download iterator)
+        sample_rate: Output sample rate
+
+    Returns:
+        float32 samples in [-1, 1], same format as whisper.load_audio
+    """
+    cmd = [
+        "ffmpeg",
+        "-loglevel", "error",
+        "-threads", "0",
+        "-i", "pipe:0",
+        "-f", "s16le",
+        "-ac", "1",
+        "-acodec", "pcm_s16le",
+        "-ar", str(sample_rate),
+        "pipe:1",
+    ]
+
+    with tempfile.TemporaryFile() as stderr:
+        process = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=stderr)
+        errors = []
+
+        def feed():
+            try:
+                for chunk in chunks:
+                    process.stdin.write(chunk)
+            except BrokenPipeError:
+                pass  # ffmpeg exited early; its return code tells why
+            except Exception as e:
+                errors.append(e)
+            finally:
+                try:
+                    process.stdin.close()
+                except BrokenPipeError:
+                    pass
+
+        feeder = threading.Thread(target=feed, daemon=True)
+        feeder.start()
+
+        pcm = process.stdout.read()
+        process.wait()
+        feeder.join()
+
+        if errors:
+            raise errors[0]
+        if process.returncode != 0:
+            stderr.seek(0)
+            message = stderr.read().decode("utf-8", "replace").strip()
+            raise RuntimeError(f"ffmpeg failed to decode audio: {message}")
+
+    return np.frombuffer(pcm, np.int16).astype(np.float32) / 32768.0
@@ -4,11 +4,14 @@ Supports both OpenAI API and local Whisper models
 """
 import os
 import tempfile
+from contextlib import contextmanager
 from typing import List, Dict, Optional, Generator
 from dataclasses import dataclass
 from pathlib import Path
 import subprocess
 
+from .audio import SAMPLE_RATE
+
 
 @dataclass
 class TranscriberConfig:
@@ -21,6 +24,14 @@ class TranscriberConfig:
     compute_type: str = "int8"  # int8, float16, float32
 
 
+class _NullTimer:
+    """Stage timer stand-in when the caller does not time stages"""
+    
+    @contextmanager
+    def stage(self, name: str):
+        yield {}
+
+
 @dataclass
 class TranscribedSegment:
     """Transcribed segment"""
@@ -78,7 +89,8 @@ class WhisperTranscriber:
     def transcribe_file(
         self,
         audio_path: str,
-        progress_callback: Optional[callable] = None
+        progress_callback: Optional[callable] = None,
+        timer=None
     ) -> List[TranscribedSegment]:
         """
         Transcribe audio file
@@ -86,33 +98,72 @@ class WhisperTranscriber:
         Args:
             audio_path: Path to audio file
             progress_callback: Optional callback for progress updates
+            timer: Optional stage timer; ``timer.stage(name)`` must be a
+                context manager yielding a dict for bytes/audio_seconds
             
         Returns:
             List of transcribed segments with timestamps
         """
+        timer = timer or _NullTimer()
+        
         if self.config.use_local:
-            return self._transcribe_local(audio_path, progress_callback)
+            import whisper
+            
+            # Decode up front so decode and model time are measured apart
+            with timer.stage("decode") as stage:
+                audio = whisper.load_audio(audio_path)
+                stage["bytes"] = os.path.getsize(audio_path)
+                stage["audio_seconds"] = len(audio) / SAMPLE_RATE
+            return self._transcribe_local(audio, progress_callback, timer)
         else:
-            return self._transcribe_api(audio_path)
+            return self._transcribe_api(audio_path, timer)
+    
+    def transcribe_audio(
+        self,
+        audio,
+        progress_callback: Optional[callable] = None,
+        timer=None
+    ) -> List[TranscribedSegment]:
+        """
+        Transcribe decoded audio (local model only)
+        
+        Args:
+            audio: 16 kHz mono float32 samples, e.g. from decode_audio_stream
+            progress_callback: Optional callback for progress updates
+            timer: Optional stage timer (see transcribe_file)
+            
+        Returns:
+            List of transcribed segments with timestamps
+        """
+        if not self.config.use_local:
+            raise RuntimeError("Decoded audio can only be transcribed with the local model")
+        return self._transcribe_local(audio, progress_callback, timer or _NullTimer())
     
     def _transcribe_local(
         self,
-        audio_path: str,
-        progress_callback: Optional[callable] = None
+        audio_path,
+        progress_callback: Optional[callable] = None,
+        timer=None
     ) -> List[TranscribedSegment]:
-        """Transcribe using local Whisper model"""
-        model = self._load_model()
+        """Transcribe using local Whisper model (file path or decoded samples)"""
+        timer = timer or _NullTimer()
+        
+        with timer.stage("model_load"):
+            model = self._load_model()
         
         if model is None:
             raise RuntimeError("Local Whisper model not loaded")
         
         # Run transcription
-        result = model.transcribe(
-            audio_path,
-            language=self.config.language,
-            task="transcribe",
-            verbose=False,
-        )
+        with timer.stage("whisper") as stage:
+            result = model.transcribe(
+                audio_path,
+                language=self.config.language,
+                task="transcribe",
+                verbose=False,
+            )
+            if not isinstance(audio_path, str):
+                stage["audio_seconds"] = len(audio_path) / SAMPLE_RATE
         
         segments = []
         for segment in result["segments"]:
@@ -132,20 +183,22 @@ class WhisperTranscriber:
                 })
         
         # Apply speaker diarization
-        segments = self._apply_diarization(audio_path, segments)
+        with timer.stage("diarization"):
+            segments = self._apply_diarization(audio_path, segments)
         
         return segments
     
     def _transcribe_api(
         self,
-        audio_path: str
+        audio_path: str,
+        timer=None
     ) -> List[TranscribedSegment]:
         """Transcribe using OpenAI Whisper API"""
         from openai import OpenAI
         
         client = OpenAI(api_key=self.config.openai_api_key)
         
-        with open(audio_path, "rb") as audio_file:
+        with (timer or _NullTimer()).stage("whisper") as stage, open(audio_path, "rb") as audio_file:
             # Use verbose_json to get timestamps
             transcript = client.audio.transcriptions.create(
                 model="whisper-1",
@@ -153,6 +206,8 @@ class WhisperTranscriber:
                 response_format="verbose_json",
                 timestamp_granularities=["segment"],
             )
+            stage["bytes"] = os.path.getsize(audio_path)
+            stage["audio_seconds"] = getattr(transcript, "duration", None)
         
         segments = []
         for segment in transcript.segments:
@@ -168,7 +223,7 @@ class WhisperTranscriber:
     
     def _apply_diarization(
         self,
-        audio_path: str,
+        audio_path,
         segments: List[TranscribedSegment]
     ) -> List[TranscribedSegment]:
         """Apply speaker diarization to segments"""
@@ -178,6 +233,14 @@ class WhisperTranscriber:
             return segments
         
         try:
+            if not isinstance(audio_path, str):
+                # Decoded samples: pyannote takes an in-memory waveform
+                import torch
+                audio_path = {
+                    "waveform": torch.from_numpy(audio_path).unsqueeze(0),
+                    "sample_rate": 16000,
+                }
+            
             diarization = diarization_model(audio_path)
             
             # Map segments to speakers
@@ -11,6 +11,7 @@ from ..db.session import get_db
 from ..models.user import User
 from ..models.meeting import Meeting
 from ..models.extra import Note, CalendarEvent, MeetingShare, Comment, AITemplate
+from ..models.analysis import PreMeetingBrief, TemplateOutput
 from ..schemas.extra import (
     NoteCreate,
     NoteResponse,
@@ -21,6 +22,8 @@ from ..schemas.extra import (
     CommentResponse,
     AITemplateCreate,
     AITemplateResponse,
+    PreMeetingBriefResponse,
+    TemplateOutputResponse,
 )
 from ..core.deps import get_current_user
 
@@ -128,6 +131,29 @@ def list_calendar_events(
     return events
 
 
+@router.get("/calendar/events/{event_id}/brief", response_model=PreMeetingBriefResponse)
+def get_pre_meeting_brief(
+    event_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Get precomputed pre-meeting brief for a calendar event
+    
+    Briefs are generated in the background before the event starts;
+    404 means it has not been generated yet.
+    """
+    brief = db.query(PreMeetingBrief).filter(
+        PreMeetingBrief.calendar_event_id == event_id,
+        PreMeetingBrief.user_id == current_user.id
+    ).first()
+    
+    if not brief:
+        raise HTTPException(status_code=404, detail="Brief not ready")
+    
+    return brief
+
+
 @router.post("/calendar/sync", response_model=dict)
 def sync_calendar(
     provider: str = Query(...),  # google, outlook
@@ -317,3 +343,40 @@ def delete_template(
     
     db.delete(template)
     db.commit()
+
+
+@router.get("/meetings/{meeting_id}/template-outputs", response_model=List[TemplateOutputResponse])
+def list_template_outputs(
+    meeting_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """List AI template outputs for a meeting"""
+    outputs = db.query(TemplateOutput).filter(
+        TemplateOutput.meeting_id == meeting_id
+    ).order_by(TemplateOutput.template_name).all()
+    
+    return outputs
+
+
+@router.post("/meetings/{meeting_id}/template-outputs", status_code=status.HTTP_202_ACCEPTED)
+def run_templates(
+    meeting_id: UUID,
+    template_ids: Optional[List[UUID]] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Run AI templates for a meeting (default templates if none given)"""
+    from ..tasks import run_meeting_templates
+    
+    meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
+    
+    if not meeting:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+    
+    run_meeting_templates.delay(
+        str(meeting_id),
+        [str(t) for t in template_ids] if template_ids else None,
+    )
+    
+    return {"status": "queued"}
@@ -42,6 +42,32 @@ def health_check(db: Session = Depends(get_db)):
     }
 
 
+@router.get("/health/queues")
+def queue_health():
+    """
+    Pending tasks per worker lane
+    """
+    from ..celery import queue_depths
+    
+    try:
+        return {"queues": queue_depths()}
+    except Exception as e:
+        return {"queues": {}, "error": str(e)}
+
+
+@router.get("/health/db-pool")
+def db_pool_health():
+    """
+    Connection pool usage and checkout durations of this process
+    """
+    from ..db.session import engine, pool_stats
+    
+    return {
+        "pool": engine.pool.status(),
+        "checkout": pool_stats.snapshot(),
+    }
+
+
 @router.get("/")
 def root():
     """
@@ -20,6 +20,12 @@ from ..schemas.meeting import (
     ActionItemUpdate,
     ActionItemResponse,
     TranscriptResponse,
+    QuestionRequest,
+    AnswerResponse,
+    MeetingSearchHit,
+    MeetingSearchResponse,
+    TranscriptSearchHit,
+    TranscriptSearchResponse,
 )
 from ..core.deps import get_current_user
 
@@ -67,6 +73,220 @@ def create_meeting(
     return meeting
 
 
+@router.get("/search", response_model=MeetingSearchResponse)
+def search_meetings(
+    q: str = Query(..., min_length=1, max_length=500),
+    organization_id: UUID = Query(...),
+    kind: Optional[str] = Query(None, pattern="^(summary|chunk)$"),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Semantic search over meeting summaries and transcript chunks
+    """
+    import time
+    from sqlalchemy import tuple_
+    from ..models.analysis import TranscriptChunk
+    from ..tasks import get_search_embedder, get_vector_index
+    from ai_engine.analysis import KIND_SUMMARY, KIND_CHUNK
+    
+    started = time.perf_counter()
+    
+    # Profile rows serve other lookups; they must not take result slots
+    kinds = {"summary": KIND_SUMMARY, "chunk": KIND_CHUNK}
+    hits = get_vector_index(organization_id).search(
+        get_search_embedder().embed([q])[0],
+        k=limit,
+        kind=kinds.get(kind, (KIND_SUMMARY, KIND_CHUNK)),
+    )
+    
+    meeting_ids = {hit.meeting_id for hit in hits}
+    meetings = {
+        str(m.id): m
+        for m in db.query(Meeting).filter(Meeting.id.in_(meeting_ids)).all()
+    } if meeting_ids else {}
+    
+    chunk_keys = {(UUID(hit.meeting_id), hit.chunk_index) for hit in hits if hit.kind == KIND_CHUNK}
+    chunks = {}
+    if chunk_keys:
+        rows = db.query(TranscriptChunk).filter(
+            tuple_(TranscriptChunk.meeting_id, TranscriptChunk.chunk_index).in_(chunk_keys)
+        ).all()
+        chunks = {(str(c.meeting_id), c.chunk_index): c for c in rows}
+    
+    results = []
+    for hit in hits:
+        meeting = meetings.get(hit.meeting_id)
+        if meeting is None:
+            continue
+        if hit.kind == KIND_SUMMARY:
+            results.append(MeetingSearchHit(
+                meeting_id=meeting.id,
+                meeting_title=meeting.title,
+                kind="summary",
+                text=meeting.summary or "",
+                score=hit.score,
+            ))
+        elif (hit.meeting_id, hit.chunk_index) in chunks:
+            chunk = chunks[(hit.meeting_id, hit.chunk_index)]
+            results.append(MeetingSearchHit(
+                meeting_id=meeting.id,
+                meeting_title=meeting.title,
+                kind="chunk",
+                text=chunk.text,
+                start=float(chunk.start_time),
+                end=float(chunk.end_time),
+                score=hit.score,
+            ))
+    
+    return MeetingSearchResponse(
+        results=results,
+        took_ms=round((time.perf_counter() - started) * 1000, 2),
+    )
+
+
+@router.get("/search/transcripts", response_model=TranscriptSearchResponse)
+def search_transcripts(
+    q: str = Query(..., min_length=1, max_length=500),
+    organization_id: UUID = Query(...),
+    meeting_id: Optional[UUID] = Query(None),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Full-text keyword search over transcript segments
+    
+    Uses the ``search_vector`` GIN index with ``websearch_to_tsquery``
+    syntax ("quoted phrases", OR, -exclude). Results are newest first
+    and paginated by keyset: pass ``next_cursor`` back as ``cursor``.
+    Snippets are built with ``ts_headline`` for the returned page only.
+    """
+    import base64
+    import json
+    from datetime import datetime
+    from sqlalchemy import func, tuple_
+    from ..models.transcript import Transcript
+    
+    ts_query = func.websearch_to_tsquery("simple", q)
+    
+    # Resolve the organization's meetings first: filtering on a list of
+    # ids lets Postgres AND one GIN bitmap with the meeting_id index
+    # instead of re-running the GIN scan per joined meeting
+    meeting_query = db.query(Meeting.id, Meeting.title).filter(
+        Meeting.organization_id == organization_id
+    )
+    if meeting_id is not None:
+        meeting_query = meeting_query.filter(Meeting.id == meeting_id)
+    titles = {row.id: row.title for row in meeting_query.all()}
+    
+    if not titles:
+        return TranscriptSearchResponse()
+    
+    page = (
+        db.query(
+            Transcript.id,
+            Transcript.meeting_id,
+            Transcript.speaker_name,
+            Transcript.start_time,
+            Transcript.end_time,
+            Transcript.text,
+            Transcript.created_at,
+        )
+        .filter(
+            Transcript.meeting_id.in_(list(titles)),
+            Transcript.search_vector.op("@@")(ts_query),
+        )
+    )
+    
+    if cursor:
+        try:
+            created_at, last_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            page = page.filter(
+                tuple_(Transcript.created_at, Transcript.id)
+                < tuple_(datetime.fromisoformat(created_at), UUID(last_id))
+            )
+        except (ValueError, TypeError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor"
+            )
+    
+    page = (
+        page.order_by(Transcript.created_at.desc(), Transcript.id.desc())
+        .limit(limit + 1)
+        .subquery()
+    )
+    
+    rows = db.query(
+        page,
+        func.ts_headline(
+            "simple",
+            page.c.text,
+            ts_query,
+            "StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2",
+        ).label("snippet"),
+    ).order_by(page.c.created_at.desc(), page.c.id.desc()).all()
+    
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = base64.urlsafe_b64encode(
+            json.dumps([last.created_at.isoformat(), str(last.id)]).encode()
+        ).decode()
+    
+    return TranscriptSearchResponse(
+        results=[
+            TranscriptSearchHit(
+                transcript_id=row.id,
+                meeting_id=row.meeting_id,
+                meeting_title=titles.get(row.meeting_id),
+                speaker_name=row.speaker_name,
+                start_time=float(row.start_time),
+                end_time=float(row.end_time),
+                snippet=row.snippet,
+            )
+            for row in rows
+        ],
+        next_cursor=next_cursor,
+    )
+
+
+@router.post("/ask", response_model=AnswerResponse)
+def ask_organization(
+    question: QuestionRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Ask a question across all indexed meetings of an organization
+    
+    Chunks are retrieved from the organization's vector index; only the
+    top-k hits are loaded from the database.
+    """
+    import time
+    from ..tasks import create_analyzer, search_organization_chunks
+    from ai_engine.analysis import MeetingQA
+    
+    if question.organization_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="organization_id is required"
+        )
+    
+    started = time.perf_counter()
+    retrieved = search_organization_chunks(
+        db, question.organization_id, question.question, question.top_k
+    )
+    retrieval_ms = (time.perf_counter() - started) * 1000
+    
+    qa = MeetingQA(create_analyzer(), top_k=question.top_k)
+    return qa.answer_retrieved(question.question, retrieved, retrieval_ms)
+
+
 @router.get("/{meeting_id}", response_model=MeetingDetailResponse)
 def get_meeting(
     meeting_id: UUID,
@@ -138,6 +358,36 @@ def delete_meeting(
     return None
 
 
+@router.post("/{meeting_id}/transcribe", status_code=status.HTTP_202_ACCEPTED)
+def transcribe_recording(
+    meeting_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Queue the meeting recording for transcription (fair-share scheduled)
+    """
+    from ..tasks import schedule_transcription
+    
+    meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
+    
+    if not meeting:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Meeting not found"
+        )
+    
+    if not meeting.recording_url:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Meeting has no recording"
+        )
+    
+    schedule_transcription.delay(str(meeting_id))
+    
+    return {"status": "queued"}
+
+
 @router.post("/{meeting_id}/participants", response_model=MeetingParticipantResponse)
 def add_participant(
     meeting_id: UUID,
@@ -254,3 +504,36 @@ def update_action_item(
     db.refresh(action_item)
     
     return action_item
+
+
+@router.post("/{meeting_id}/ask", response_model=AnswerResponse)
+def ask_meeting(
+    meeting_id: UUID,
+    question: QuestionRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Ask a question about a meeting (answered from retrieved transcript spans)
+    """
+    from ..tasks import create_analyzer, build_meeting_chunks, load_chunk_index
+    from ai_engine.analysis import MeetingQA
+    
+    meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
+    
+    if not meeting:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Meeting not found"
+        )
+    
+    chunks, embeddings = load_chunk_index(db, meeting_ids=[meeting_id])
+    
+    if not chunks:
+        # Meeting transcribed before indexing existed - index it now
+        build_meeting_chunks(db, meeting)
+        db.commit()
+        chunks, embeddings = load_chunk_index(db, meeting_ids=[meeting_id])
+    
+    qa = MeetingQA(create_analyzer(), top_k=question.top_k)
+    return qa.answer(question.question, chunks, embeddings, meeting_title=meeting.title)
@@ -2,13 +2,28 @@
 Celery configuration
 """
 from celery import Celery
+from celery.signals import worker_init, worker_process_shutdown
+from kombu import Queue
+
 from .core.config import settings
 
 
+# Worker lanes: transcription is CPU-bound and long, analysis waits on
+# LLM APIs, graph/index jobs are short database and numpy work. Each
+# lane has its own queue so a worker pool can be sized for it.
+QUEUE_TRANSCRIBE = "transcribe"
+QUEUE_ANALYSIS = "analysis"
+QUEUE_GRAPH = "graph"
+QUEUE_DEFAULT = "celery"
+
+LANES = (QUEUE_TRANSCRIBE, QUEUE_ANALYSIS, QUEUE_GRAPH, QUEUE_DEFAULT)
+
+
 celery_app = Celery(
     "meetingmind",
     broker=settings.CELERY_BROKER_URL,
     backend=settings.CELERY_RESULT_BACKEND,
+    include=["app.tasks"],
 )
 
 celery_app.conf.update(
@@ -20,4 +35,78 @@ celery_app.conf.update(
     task_track_started=True,
     task_time_limit=3600,  # 1 hour max
     worker_prefetch_multiplier=1,
+    task_queues=[Queue(name) for name in LANES],
+    task_default_queue=QUEUE_DEFAULT,
+    task_routes={
+        "app.tasks.transcribe_meeting": {"queue": QUEUE_TRANSCRIBE},
+        "app.tasks.analyze_meeting": {"queue": QUEUE_ANALYSIS},
+        "app.tasks.update_live_analysis": {"queue": QUEUE_ANALYSIS},
+        "app.tasks.submit_analysis_batch": {"queue": QUEUE_ANALYSIS},
+        "app.tasks.generate_pre_meeting_brief": {"queue": QUEUE_ANALYSIS},
+        "app.tasks.run_meeting_templates": {"queue": QUEUE_ANALYSIS},
+        "app.tasks.update_knowledge_graph": {"queue": QUEUE_GRAPH},
+        "app.tasks.index_meeting_chunks": {"queue": QUEUE_GRAPH},
+        "app.tasks.index_meeting_search": {"queue": QUEUE_GRAPH},
+    },
 )
+
+celery_app.conf.beat_schedule = {
+    "refresh-live-analyses": {
+        "task": "app.tasks.refresh_live_analyses",
+        "schedule": float(settings.LIVE_ANALYSIS_INTERVAL_SECONDS),
+    },
+    "poll-analysis-batches": {
+        "task": "app.tasks.poll_analysis_batches",
+        "schedule": 60.0,
+    },
+    "dispatch-transcriptions": {
+        "task": "app.tasks.dispatch_transcriptions",
+        "schedule": 60.0,
+    },
+    "precompute-pre-meeting-briefs": {
+        "task": "app.tasks.precompute_pre_meeting_briefs",
+        "schedule": 900.0,
+    },
+}
+
+
+@worker_init.connect
+def start_worker_metrics(**kwargs):
+    """Stage-timing and queue-depth metrics endpoint of this worker (WORKER_METRICS_PORT, 0 = off)"""
+    if settings.WORKER_METRICS_PORT:
+        from .metrics import QueueDepthCollector, start_metrics_server
+        start_metrics_server(
+            settings.WORKER_METRICS_PORT, collectors=[QueueDepthCollector(queue_depths)]
+        )
+
+
+@worker_process_shutdown.connect
+def release_worker_metrics(pid=None, **kwargs):
+    if settings.WORKER_METRICS_PORT:
+        from .metrics import mark_process_dead
+        mark_process_dead(pid)
+
+
+@worker_init.connect
+def start_worker_tracing(**kwargs):
+    """Continue traces from task headers; spans for tasks, SQL and LLM calls"""
+    from .db.session import engine
+    from .tracing import setup_tracing
+    setup_tracing("meetingmind-worker", engine=engine)
+
+
+@worker_process_shutdown.connect
+def flush_worker_tracing(**kwargs):
+    from .tracing import flush_tracing
+    flush_tracing()
+
+
+def queue_depths() -> dict:
+    """Pending (not yet reserved) messages per lane"""
+    depths = {}
+    with celery_app.connection_for_read() as connection:
+        channel = connection.default_channel
+        for name in LANES:
+            # Same declaration as the workers'; an empty Redis queue has no key
+            _, depths[name], _ = Queue(name, channel=channel).queue_declare()
+    return depths
@@ -17,6 +17,7 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str = "postgresql://meetingmind:meetingmind_password@db:5432/meetingmind"
+    DB_CHECKOUT_WARN_SECONDS: float = 30.0
     
     # Redis
     REDIS_URL: str = "redis://redis:6379/0"
@@ -32,7 +33,37 @@ class Settings(BaseSettings):
     LLM_PROVIDER: str = "openai"
     LLM_API_KEY: str = ""
     LLM_MODEL: str = "gpt-4o-mini"
+    LLM_STRUCTURED_OUTPUT: bool = False
+    LLM_PROMPT_CACHING: bool = True
+    LLM_BASE_URL: str = ""
+    LLM_FALLBACK_PROVIDER: str = ""  # empty = no hedging/failover
+    LLM_FALLBACK_MODEL: str = "gpt-4o-mini"
+    LLM_FALLBACK_API_KEY: str = ""
+    LLM_FALLBACK_BASE_URL: str = ""
+    LLM_HEDGE_QUANTILE: float = 95.0
+    LLM_HEDGE_MIN_DELAY_SECONDS: float = 2.0
+    LLM_HEDGE_MAX_DELAY_SECONDS: float = 60.0
+    LLM_BREAKER_FAILURES: int = 5
+    LLM_BREAKER_RESET_SECONDS: float = 60.0
+    LOCAL_BATCH_DIR: str = ""  # empty = system temp dir
+    LIVE_ANALYSIS_INTERVAL_SECONDS: int = 180
+    PRE_MEETING_BRIEF_HOURS: int = 12
+    TEMPLATE_MAX_WORKERS: int = 4
+    VECTOR_INDEX_DIR: str = "/data/vector_index"
+    SEARCH_EMBEDDING_DIM: int = 384
+    VECTOR_INDEX_TRAIN_ROWS: int = 50000
+    VECTOR_INDEX_MAX_DELETED_RATIO: float = 0.25
+    VECTOR_INDEX_CACHE_SIZE: int = 64
+    PREVIOUS_CONTEXT_TOKENS: int = 1500
+    PREVIOUS_CONTEXT_MAX_MEETINGS: int = 3
+    TRANSCRIPT_WRITE_BATCH_SIZE: int = 5000
+    TRANSCRIBE_SLOTS: int = 2
+    SHORT_MEETING_SECONDS: int = 900
+    TRANSCRIBE_CLAIM_TTL_SECONDS: int = 18000
+    ANALYZE_CLAIM_TTL_SECONDS: int = 1800
+    LIVE_ANALYSIS_CLAIM_TTL_SECONDS: int = 600
     WHISPER_MODEL: str = "base"
+    WHISPER_MODEL_POLICY: str = "adaptive"  # adaptive (per job, see app.scheduler) or fixed
     USE_LOCAL_WHISPER: bool = False
     
     # Storage
@@ -41,6 +72,8 @@ class Settings(BaseSettings):
     S3_SECRET_KEY: str = "minioadmin"
     S3_BUCKET: str = "meetingmind-recordings"
     S3_REGION: str = "us-east-1"
+    S3_DOWNLOAD_CONCURRENCY: int = 8
+    RECORDING_STREAMING: bool = True
     
     # Frontend
     FRONTEND_URL: str = "http://localhost:3000"
@@ -53,12 +86,20 @@ class Settings(BaseSettings):
     # Celery
     CELERY_BROKER_URL: str = "redis://redis:6379/1"
     CELERY_RESULT_BACKEND: str = "redis://redis:6379/2"
+    WORKER_METRICS_PORT: int = 0
+    
+    # Tracing
+    TRACING_EXPORTER: str = "none"  # none, otlp, file, console
+    TRACING_OTLP_ENDPOINT: str = "http://jaeger:4318/v1/traces"
+    TRACING_FILE_PATH: str = "/tmp/meetingmind-traces.jsonl"
+    TRACING_SAMPLE_RATIO: float = 1.0
     
     # Feature Flags
     ENABLE_NOISE_CANCELLATION: bool = True
     ENABLE_ACCENT_SOFTENING: bool = False
     ENABLE_KNOWLEDGE_GRAPH: bool = True
     ENABLE_E2E_ENCRYPTION: bool = True
+    ENABLE_ANALYSIS_STREAMING: bool = True
     
     class Config:
         env_file = ".env"
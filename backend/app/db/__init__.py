@@ -1,4 +1,4 @@
 """Database module"""
-from .session import get_db, engine, SessionLocal, init_db
+from .session import get_db, engine, SessionLocal, init_db, session_scope, pool_stats
 
-__all__ = ["get_db", "engine", "SessionLocal", "init_db"]
+__all__ = ["get_db", "engine", "SessionLocal", "init_db", "session_scope", "pool_stats"]
@@ -0,0 +1,164 @@
+"""
+Bulk row writers - COPY on Postgres, executemany elsewhere, and
+INSERT ... ON CONFLICT upserts
+"""
+from datetime import date, datetime
+from io import StringIO
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Sequence
+
+from sqlalchemy import Row, Table, func, insert
+from sqlalchemy.orm import Session
+
+
+def _csv_string(value: str) -> str:
+    return '"' + value.replace('"', '""') + '"'
+
+
+# Exact-type formatters for the hot loop; anything else goes through str()
+_CSV_FORMATTERS = {
+    type(None): lambda value: "",
+    str: _csv_string,
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+}
+
+
+def _csv_field(value: Any) -> str:
+    """Format one value for COPY ... (FORMAT csv); unquoted empty is NULL"""
+    formatter = _CSV_FORMATTERS.get(type(value))
+    if formatter is None:
+        if isinstance(value, str):
+            return _csv_string(value)
+        return str(value)
+    return formatter(value)
+
+
+def bulk_insert(
+    db: Session,
+    table: Table,
+    rows: Iterable[Dict[str, Any]],
+    batch_size: int = 5000
+) -> int:
+    """
+    Insert rows in bounded batches inside the session's transaction
+
+    On Postgres each batch is streamed with ``COPY ... FROM STDIN``;
+    other databases (SQLite in tests) get one ``executemany`` INSERT per
+    batch. Only one batch is held in memory at a time, so ``rows`` can
+    be a generator. Columns left out of the rows get the database
+    defaults with COPY and the SQLAlchemy column defaults otherwise, so
+    only leave out columns that have both.
+
+    Args:
+        db: Session whose transaction the rows join (not committed here)
+        table: Target table
+        rows: Dicts with the same keys (column names)
+        batch_size: Rows per COPY / executemany round trip
+
+    Returns:
+        Number of rows written
+    """
+    rows = iter(rows)
+    connection = db.connection()
+    use_copy = connection.dialect.name == "postgresql"
+
+    written = 0
+    columns = None
+
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            break
+
+        if columns is None:
+            columns = list(batch[0])
+
+        if use_copy:
+            buffer = StringIO()
+            for row in batch:
+                buffer.write(",".join(_csv_field(row[c]) for c in columns))
+                buffer.write("\n")
+            buffer.seek(0)
+
+            cursor = connection.connection.cursor()
+            try:
+                cursor.copy_expert(
+                    f"COPY {table.fullname} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+                    buffer,
+                )
+            finally:
+                cursor.close()
+        else:
+            connection.execute(insert(table), batch)
+
+        written += len(batch)
+
+    return written
+
+
+def upsert(
+    db: Session,
+    table: Table,
+    rows: Iterable[Dict[str, Any]],
+    conflict_columns: Sequence[str],
+    update_columns: Sequence[str] = (),
+    returning: Sequence[str] = (),
+    batch_size: int = 1000
+) -> List[Row]:
+    """
+    ``INSERT ... ON CONFLICT`` many rows in one statement per batch
+
+    Rows repeating a conflict key are collapsed first (last one wins),
+    since one statement may not update the same row twice. On conflict
+    each of ``update_columns`` takes the new value unless it is NULL;
+    with no update columns conflicting rows are left as they are.
+
+    Args:
+        db: Session whose transaction the rows join (not committed here)
+        table: Target table
+        rows: Dicts with the same keys (column names)
+        conflict_columns: Columns of the unique constraint to resolve on
+        update_columns: Columns refreshed on conflict
+        returning: Columns to return for every input key - inserted and
+            existing rows alike (requires ``update_columns``)
+        batch_size: Rows per statement
+
+    Returns:
+        Rows with the ``returning`` columns (empty list if none requested)
+    """
+    unique = {tuple(row[c] for c in conflict_columns): row for row in rows}
+    if not unique:
+        return []
+
+    dialect = db.connection().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        raise NotImplementedError(f"upsert is not supported on {dialect}")
+
+    values = list(unique.values())
+    result = []
+
+    for start in range(0, len(values), batch_size):
+        stmt = dialect_insert(table).values(values[start:start + batch_size])
+        if update_columns:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(conflict_columns),
+                set_={
+                    c: func.coalesce(stmt.excluded[c], table.c[c])
+                    for c in update_columns
+                },
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=list(conflict_columns))
+
+        if returning:
+            stmt = stmt.returning(*(table.c[c] for c in returning))
+            result.extend(db.execute(stmt).all())
+        else:
+            db.execute(stmt)
+
+    return result
@@ -1,13 +1,101 @@
 """
 Database session management
 """
-from sqlalchemy import create_engine
+import threading
+import time
+from contextlib import contextmanager
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from typing import Dict, Generator, Iterator, Optional, Tuple
 
 from ..core.config import settings
 
 
+# Upper bounds (seconds) of the checkout-duration histogram buckets
+CHECKOUT_BUCKETS = (0.01, 0.1, 1.0, 10.0, 60.0, float("inf"))
+
+
+class PoolCheckoutStats:
+    """
+    How long pooled connections stay checked out, per process
+    
+    A connection is checked out from the first query of a session
+    transaction until commit/rollback/close. Checkouts longer than
+    ``warn_seconds`` are logged, since they usually mean a session was
+    kept open across slow non-database work.
+    """
+    
+    def __init__(
+        self,
+        buckets: Tuple[float, ...] = CHECKOUT_BUCKETS,
+        warn_seconds: Optional[float] = None
+    ):
+        self.buckets = buckets
+        self.warn_seconds = warn_seconds
+        self._lock = threading.Lock()
+        self._open: Dict[int, float] = {}
+        self.reset()
+    
+    def reset(self) -> None:
+        with self._lock:
+            self.count = 0
+            self.total_seconds = 0.0
+            self.max_seconds = 0.0
+            self.bucket_counts = [0] * len(self.buckets)
+    
+    def checkout(self, key: int) -> None:
+        with self._lock:
+            self._open[key] = time.monotonic()
+    
+    def checkin(self, key: int) -> Optional[float]:
+        """Record the end of a checkout; returns its duration in seconds"""
+        with self._lock:
+            started = self._open.pop(key, None)
+            if started is None:
+                return None
+            
+            held = time.monotonic() - started
+            self.count += 1
+            self.total_seconds += held
+            self.max_seconds = max(self.max_seconds, held)
+            self.bucket_counts[next(
+                i for i, bound in enumerate(self.buckets) if held <= bound
+            )] += 1
+        
+        if self.warn_seconds and held > self.warn_seconds:
+            print(f"DB connection held for {held:.1f}s")
+        return held
+    
+    def snapshot(self) -> dict:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                "checkouts": self.count,
+                "total_seconds": round(self.total_seconds, 3),
+                "max_seconds": round(self.max_seconds, 3),
+                "buckets": {
+                    ("+Inf" if bound == float("inf") else f"{bound:g}"): n
+                    for bound, n in zip(self.buckets, self.bucket_counts)
+                },
+                "checked_out": len(self._open),
+                "oldest_open_seconds": round(
+                    max((now - t for t in self._open.values()), default=0.0), 3
+                ),
+            }
+
+
+def instrument_pool(engine, stats: PoolCheckoutStats) -> None:
+    """Feed an engine's pool checkout/checkin events into ``stats``"""
+    
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        stats.checkout(id(connection_record))
+    
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        stats.checkin(id(connection_record))
+
+
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
@@ -15,9 +103,33 @@ engine = create_engine(
     max_overflow=20,
 )
 
+pool_stats = PoolCheckoutStats(warn_seconds=settings.DB_CHECKOUT_WARN_SECONDS)
+instrument_pool(engine, pool_stats)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """
+    Short-lived session for one unit of work
+    
+    Commits on success, rolls back on error and always closes, so the
+    pooled connection goes back as soon as the block ends. Background
+    tasks use one scope per database phase and none around model or LLM
+    calls.
+    """
+    db = SessionLocal()
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
 def get_db() -> Generator[Session, None, None]:
     """
     Get database session
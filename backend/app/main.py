@@ -8,6 +8,7 @@ from contextlib import asynccontextmanager
 from .core.config import settings
 from .db.session import engine
 from .models import Base
+from .tracing import setup_tracing
 from .api import auth_router, meetings_router, health_router, extras_router
 
 
@@ -58,6 +59,9 @@ app.include_router(auth_router, prefix="/api/v1")
 app.include_router(meetings_router, prefix="/api/v1")
 app.include_router(extras_router, prefix="/api/v1")
 
+# Trace requests through the Celery tasks they enqueue (TRACING_EXPORTER)
+setup_tracing("meetingmind-api", app=app, engine=engine)
+
 
 @app.get("/health")
 def health():
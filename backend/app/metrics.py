@@ -0,0 +1,201 @@
+"""
+Pipeline metrics - stage timer, LLM provider metrics, queue depth,
+Prometheus worker endpoint
+"""
+import glob
+import os
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, Optional, Sequence
+
+from opentelemetry import trace
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Histogram, multiprocess, start_http_server
+from prometheus_client.core import GaugeMetricFamily
+
+
+INF = float("inf")
+
+STAGE_SECONDS = Histogram(
+    "meetingmind_stage_duration_seconds",
+    "Wall time of one pipeline stage of a task run",
+    ["task", "stage"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1200, 3600, INF),
+)
+STAGE_BYTES = Histogram(
+    "meetingmind_stage_bytes",
+    "Bytes read by one pipeline stage (recording downloads and decodes)",
+    ["task", "stage"],
+    buckets=(1e5, 1e6, 1e7, 5e7, 1e8, 2.5e8, 5e8, 1e9, 5e9, INF),
+)
+STAGE_AUDIO_SECONDS = Histogram(
+    "meetingmind_stage_audio_seconds",
+    "Seconds of audio handled by one pipeline stage",
+    ["task", "stage"],
+    buckets=(60, 300, 900, 1800, 3600, 7200, 14400, INF),
+)
+
+LLM_SECONDS = Histogram(
+    "meetingmind_llm_request_seconds",
+    "Latency of LLM requests per provider and outcome (ok, error, invalid)",
+    ["provider", "outcome"],
+    buckets=(0.5, 1, 2, 5, 10, 20, 30, 60, 120, INF),
+)
+LLM_EVENTS = Counter(
+    "meetingmind_llm_events",
+    "LLM request outcomes, hedges and circuit-breaker rejections per provider",
+    ["provider", "event"],
+)
+
+tracer = trace.get_tracer(__name__)
+
+
+class StageTimer:
+    """
+    Stage durations and counters of one task run
+
+    Usage:
+        timer = StageTimer("transcribe")
+        with timer.stage("download") as stage:
+            stage["bytes"] = download()
+
+    Each stage's wall time, and the ``bytes`` / ``audio_seconds`` set on
+    the yielded dict, go to the Prometheus histograms when the block
+    ends (also when it raises) and into ``breakdown()`` for the
+    per-meeting timing row. A stage entered twice accumulates. With
+    tracing on, each stage is also a ``<task>.<stage>`` span.
+    """
+
+    def __init__(self, task: str):
+        self.task = task
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str):
+        values: Dict[str, Optional[float]] = {}
+        start = time.perf_counter()
+        with tracer.start_as_current_span(f"{self.task}.{name}") as span:
+            try:
+                yield values
+            finally:
+                self.record(name, time.perf_counter() - start, **values)
+                for key, value in values.items():
+                    if value is not None:
+                        span.set_attribute(f"stage.{key}", value)
+
+    def record(
+        self,
+        name: str,
+        seconds: float,
+        bytes: Optional[float] = None,
+        audio_seconds: Optional[float] = None
+    ) -> None:
+        entry = self.stages.setdefault(name, {"seconds": 0.0})
+        entry["seconds"] += seconds
+        STAGE_SECONDS.labels(self.task, name).observe(seconds)
+
+        if bytes is not None:
+            entry["bytes"] = entry.get("bytes", 0) + int(bytes)
+            STAGE_BYTES.labels(self.task, name).observe(int(bytes))
+        if audio_seconds is not None:
+            entry["audio_seconds"] = entry.get("audio_seconds", 0.0) + float(audio_seconds)
+            STAGE_AUDIO_SECONDS.labels(self.task, name).observe(float(audio_seconds))
+
+    @property
+    def total_seconds(self) -> float:
+        return time.perf_counter() - self.started
+
+    def realtime_factor(self, name: str) -> Optional[float]:
+        """Seconds the stage took per second of audio it handled"""
+        entry = self.stages.get(name, {})
+        if not entry.get("audio_seconds"):
+            return None
+        return entry["seconds"] / entry["audio_seconds"]
+
+    def breakdown(self) -> Dict[str, Dict[str, float]]:
+        """{stage: {"seconds", "bytes"?, "audio_seconds"?}} rounded for storage"""
+        return {
+            name: {key: round(value, 3) for key, value in entry.items()}
+            for name, entry in self.stages.items()
+        }
+
+
+def count_bytes(chunks: Iterable[bytes], stage: dict) -> Iterator[bytes]:
+    """Pass chunks through, adding their size to the stage's ``bytes``"""
+    stage["bytes"] = stage.get("bytes", 0)
+    for chunk in chunks:
+        stage["bytes"] += len(chunk)
+        yield chunk
+
+
+def observe_llm(provider: str, outcome: str, seconds: Optional[float] = None) -> None:
+    """HedgedCaller observer: request latency and hedging events per provider"""
+    LLM_EVENTS.labels(provider, outcome).inc()
+    if seconds is not None:
+        LLM_SECONDS.labels(provider, outcome).observe(seconds)
+
+
+class QueueDepthCollector:
+    """
+    ``meetingmind_queue_depth`` gauge read from the broker at scrape time
+
+    Args:
+        depths: Returns pending messages per queue (app.celery.queue_depths)
+    """
+
+    def __init__(self, depths: Callable[[], Dict[str, int]]):
+        self.depths = depths
+
+    def _family(self) -> GaugeMetricFamily:
+        return GaugeMetricFamily(
+            "meetingmind_queue_depth",
+            "Pending (not yet reserved) messages per Celery queue",
+            labels=["queue"],
+        )
+
+    def describe(self):
+        # Registering must not call the broker
+        yield self._family()
+
+    def collect(self):
+        gauge = self._family()
+        try:
+            depths = self.depths()
+        except Exception as e:
+            print(f"Queue depth error: {e}")
+            depths = {}
+        for queue, depth in depths.items():
+            gauge.add_metric([queue], depth)
+        yield gauge
+
+
+def start_metrics_server(port: int, collectors: Sequence = ()) -> None:
+    """
+    Serve /metrics on ``port`` from a background thread
+
+    With PROMETHEUS_MULTIPROC_DIR set (prefork workers) the samples of all
+    child processes are aggregated; the directory is cleared first so
+    counts from a previous worker run do not leak in. ``collectors`` are
+    registered on the served registry (e.g. a QueueDepthCollector).
+    """
+    multiproc_dir = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+
+    if multiproc_dir:
+        os.makedirs(multiproc_dir, exist_ok=True)
+        for path in glob.glob(os.path.join(multiproc_dir, "*.db")):
+            os.unlink(path)
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+
+    for collector in collectors:
+        registry.register(collector)
+
+    start_http_server(port, registry=registry)
+
+
+def mark_process_dead(pid: int) -> None:
+    """Drop a finished prefork child's live samples (multiprocess mode only)"""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(pid)
@@ -27,6 +27,7 @@ from .extra import (
     Comment,
     AITemplate,
 )
+from .analysis import AnalysisBatch, PreMeetingBrief, TemplateOutput, TranscriptChunk, PipelineTiming
 
 
 __all__ = [
@@ -51,6 +52,11 @@ __all__ = [
     "MeetingShare",
     "Comment",
     "AITemplate",
+    "AnalysisBatch",
+    "PreMeetingBrief",
+    "TemplateOutput",
+    "TranscriptChunk",
+    "PipelineTiming",
 ]
 
 
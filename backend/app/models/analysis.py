@@ -0,0 +1,147 @@
+"""
+Analysis pipeline models
+"""
+from sqlalchemy import Column, String, Integer, Float, DateTime, Text, ForeignKey, UniqueConstraint, LargeBinary, DECIMAL, func
+from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import JSON
+import uuid
+
+from .base import Base, TimestampMixin
+
+
+class AnalysisBatch(Base, TimestampMixin):
+    """Provider batch job re-analyzing many meetings at once"""
+    
+    __tablename__ = "analysis_batches"
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    provider = Column(String(50), nullable=False)
+    external_batch_id = Column(String(255), index=True)
+    model = Column(String(100))
+    status = Column(String(50), default="pending", index=True)  # submitting, pending, completed, failed
+    meeting_ids = Column(JSON, default=list)
+    request_count = Column(Integer, default=0)
+    completed_count = Column(Integer, default=0)
+    failed_count = Column(Integer, default=0)
+    error = Column(Text)
+    completed_at = Column(DateTime(timezone=True))
+    
+    def __repr__(self) -> str:
+        return f"<AnalysisBatch(id={self.id}, provider={self.provider}, status={self.status})>"
+
+
+class PreMeetingBrief(Base, TimestampMixin):
+    """Pre-meeting brief precomputed ahead of a calendar event"""
+    
+    __tablename__ = "pre_meeting_briefs"
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    calendar_event_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("calendar_events.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+        index=True
+    )
+    user_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+    content = Column(Text, nullable=False)
+    source_meeting_ids = Column(JSON, default=list)
+    model = Column(String(100))
+    generated_at = Column(DateTime(timezone=True), default=func.now())
+    
+    # Relationships
+    calendar_event = relationship("CalendarEvent")
+    
+    def __repr__(self) -> str:
+        return f"<PreMeetingBrief(event={self.calendar_event_id})>"
+
+
+class TemplateOutput(Base, TimestampMixin):
+    """Output of an AI template run against a meeting"""
+    
+    __tablename__ = "template_outputs"
+    __table_args__ = (
+        UniqueConstraint("meeting_id", "template_id", name="uq_template_outputs_meeting_template"),
+    )
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    meeting_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("meetings.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+    template_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("ai_templates.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+    template_name = Column(String(255))
+    content = Column(Text)
+    output = Column(JSON)
+    error = Column(Text)
+    model = Column(String(100))
+    
+    # Relationships
+    template = relationship("AITemplate")
+    
+    def __repr__(self) -> str:
+        return f"<TemplateOutput(meeting={self.meeting_id}, template={self.template_id})>"
+
+
+class TranscriptChunk(Base, TimestampMixin):
+    """Embedded span of consecutive transcript segments for retrieval"""
+    
+    __tablename__ = "transcript_chunks"
+    __table_args__ = (
+        UniqueConstraint("meeting_id", "chunk_index", name="uq_transcript_chunks_meeting_index"),
+    )
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    meeting_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("meetings.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+    organization_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("organizations.id", ondelete="CASCADE"),
+        index=True
+    )
+    chunk_index = Column(Integer, nullable=False)
+    text = Column(Text, nullable=False)
+    start_time = Column(DECIMAL(10, 3))
+    end_time = Column(DECIMAL(10, 3))
+    embedding = Column(LargeBinary)  # float16 vector
+    embedding_model = Column(String(50))
+    
+    def __repr__(self) -> str:
+        return f"<TranscriptChunk(meeting={self.meeting_id}, index={self.chunk_index})>"
+
+
+class PipelineTiming(Base, TimestampMixin):
+    """Per-stage timing breakdown of one transcription or analysis run"""
+    
+    __tablename__ = "pipeline_timings"
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    meeting_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("meetings.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+    task = Column(String(50), nullable=False)  # transcribe, analyze
+    total_seconds = Column(Float)
+    stages = Column(JSON, default=dict)  # {stage: {"seconds", "bytes", "audio_seconds"}}
+    
+    def __repr__(self) -> str:
+        return f"<PipelineTiming(meeting={self.meeting_id}, task={self.task})>"
@@ -2,7 +2,7 @@
 Organization and Meeting models
 """
 from sqlalchemy import (
-    Column, String, Boolean, Integer, DateTime,
+    Column, String, Boolean, Integer, Float, DateTime,
     ForeignKey, Text, Enum as SQLEnum, DECIMAL, func, UniqueConstraint
 )
 from sqlalchemy.orm import relationship
@@ -106,6 +106,8 @@ class Meeting(Base, TimestampMixin):
     duration_seconds = Column(Integer)
     recording_url = Column(String)
     transcript_status = Column(String(50), default="pending")
+    transcription_model = Column(String(50))
+    transcription_rtf = Column(Float)  # Whisper seconds per audio second
     analysis_status = Column(String(50), default="pending")
     summary = Column(Text)
     key_topics = Column(JSON, default=list)
@@ -158,6 +160,11 @@ class MeetingParticipant(Base):
     duration_seconds = Column(Integer)
     talk_time_seconds = Column(Integer, default=0)
     is_speaker = Column(Boolean, default=False)
+    turn_count = Column(Integer, default=0)
+    interruption_count = Column(Integer, default=0)
+    overlap_seconds = Column(Integer, default=0)
+    longest_monologue_seconds = Column(Integer, default=0)
+    avg_response_latency = Column(DECIMAL(8, 3))
     
     # Relationships
     meeting = relationship("Meeting", back_populates="participants")
@@ -3,10 +3,11 @@ Transcript, Action Item, and Knowledge Graph models
 """
 from sqlalchemy import (
     Column, String, Boolean, Integer, DateTime, Date,
-    ForeignKey, Text, Enum as SQLEnum, DECIMAL, func, UniqueConstraint
+    ForeignKey, Text, Enum as SQLEnum, DECIMAL, func, UniqueConstraint,
+    Computed, Index
 )
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
 from sqlalchemy import JSON
 import uuid
 from enum import Enum
@@ -25,6 +26,10 @@ class Transcript(Base):
     """Transcript segment model"""
     
     __tablename__ = "transcripts"
+    __table_args__ = (
+        Index("idx_transcripts_search", "search_vector", postgresql_using="gin"),
+        Index("idx_transcripts_created", "created_at", "id"),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     meeting_id = Column(
@@ -46,6 +51,10 @@ class Transcript(Base):
     sentiment = Column(String(20))
     is_key_moment = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), default=func.now())
+    search_vector = Column(
+        TSVECTOR,
+        Computed("to_tsvector('simple', text)", persisted=True)
+    )
     
     # Relationships
     meeting = relationship("Meeting", back_populates="transcripts")
@@ -82,8 +91,10 @@ class ActionItem(Base, TimestampMixin):
     )
     priority = Column(String(20), default="medium")
     due_date = Column(Date)
+    source = Column(String(20), default="manual")  # manual, ai
     completed_at = Column(DateTime(timezone=True))
     transcript_id = Column(
+        "transcript_reference",
         UUID(as_uuid=True),
         ForeignKey("transcripts.id")
     )
@@ -112,7 +123,7 @@ class KnowledgeNode(Base):
     name = Column(String(255), nullable=False)
     node_type = Column(String(50), nullable=False, index=True)
     description = Column(Text)
-    node_metadata = Column(JSON, default=dict)
+    node_metadata = Column("metadata", JSON, default=dict)
     created_at = Column(DateTime(timezone=True), default=func.now())
     
     # Relationships
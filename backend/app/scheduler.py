@@ -0,0 +1,281 @@
+"""
+Transcription scheduler - duration-aware fair share across organizations
+and per-job Whisper model selection
+"""
+import json
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional
+
+
+# Relative share of transcription capacity per organization plan
+PLAN_WEIGHTS = {"free": 1.0, "pro": 2.0, "business": 4.0, "enterprise": 4.0}
+
+# Turnaround target per plan (upload to finished transcript) and the most
+# accurate Whisper model the plan gets when that target allows it
+PLAN_SLA_SECONDS = {"free": 4 * 3600, "pro": 2 * 3600, "business": 3600, "enterprise": 1800}
+PLAN_MAX_MODEL = {"free": "base", "pro": "small", "business": "medium", "enterprise": "medium"}
+
+# Local Whisper models from fastest to most accurate, with their starting
+# real-time factor (Whisper seconds per audio second) on a CPU worker;
+# achieved factors reported by finished jobs replace these over time
+MODEL_RTF = {"tiny": 0.04, "base": 0.08, "small": 0.25, "medium": 0.6}
+
+RTF_SMOOTHING = 0.2
+
+# A run may take at most this share of the SLA, so a job arriving while
+# every slot is busy still has time for its own run
+SLA_RUN_SHARE = 0.5
+
+STATE_KEY = "transcription:scheduler"
+
+
+@dataclass
+class ScheduledJob:
+    """Meeting waiting for, or holding, a transcription slot"""
+    meeting_id: str
+    organization_id: str
+    cost: float
+    short: bool
+    start_tag: float
+    finish_tag: float
+    seq: int
+    enqueued_at: float
+    started_at: Optional[float] = None
+    trace_context: Optional[Dict[str, str]] = None
+    duration_seconds: Optional[int] = None
+    plan: Optional[str] = None
+    model: Optional[str] = None
+
+
+class FairScheduler:
+    """
+    Weighted fair queuing of transcription jobs across organizations
+
+    A job's cost is the expected processing time, estimated from
+    ``Meeting.duration_seconds``. Every organization is a flow: a new
+    job gets the tags
+
+        start = max(virtual_time, organization's last finish tag)
+        finish = start + cost / weight
+
+    and the pending job with the smallest finish tag runs next. An
+    organization that uploads 200 recordings therefore only gets its
+    weighted share while other organizations have work waiting, and
+    cheap jobs go first within that share.
+
+    Meetings up to ``short_seconds`` long form a priority lane that is
+    served first, at most ``short_burst`` jobs in a row while long jobs
+    are waiting.
+
+    Jobs are only released to Celery when one of ``slots`` (the
+    transcription worker concurrency) is free; the queue order is kept
+    here, not in the broker.
+
+    With ``adaptive_models`` each started job also gets the Whisper model
+    to run (see ``choose_model``).
+    """
+
+    def __init__(
+        self,
+        slots: int = 2,
+        short_seconds: int = 900,
+        short_burst: int = 3,
+        seconds_per_audio_second: float = 0.3,
+        overhead_seconds: float = 30.0,
+        default_duration_seconds: int = 3600,
+        stale_after: float = 5 * 3600,
+        adaptive_models: bool = True
+    ):
+        self.slots = slots
+        self.short_seconds = short_seconds
+        self.short_burst = short_burst
+        self.seconds_per_audio_second = seconds_per_audio_second
+        self.overhead_seconds = overhead_seconds
+        self.default_duration_seconds = default_duration_seconds
+        self.stale_after = stale_after
+        self.adaptive_models = adaptive_models
+
+        self.pending: List[ScheduledJob] = []
+        self.running: Dict[str, ScheduledJob] = {}
+        self.org_finish: Dict[str, float] = {}
+        self.virtual_time = 0.0
+        self.short_streak = 0
+        self.seq = 0
+        self.model_rtf: Dict[str, float] = dict(MODEL_RTF)
+
+    def estimate_cost(self, duration_seconds: Optional[int]) -> float:
+        """Expected processing seconds (unknown duration counts as long)"""
+        if not duration_seconds or duration_seconds <= 0:
+            duration_seconds = self.default_duration_seconds
+        return self.overhead_seconds + duration_seconds * self.seconds_per_audio_second
+
+    def submit(
+        self,
+        meeting_id: str,
+        organization_id: str,
+        duration_seconds: Optional[int] = None,
+        weight: float = 1.0,
+        now: Optional[float] = None,
+        trace_context: Optional[Dict[str, str]] = None,
+        plan: Optional[str] = None
+    ) -> ScheduledJob:
+        """
+        Queue a meeting; a meeting already queued or running is kept as is
+
+        ``trace_context`` (W3C trace headers of the submitting request) is
+        kept so the transcription started later joins the same trace.
+        """
+        meeting_id, organization_id = str(meeting_id), str(organization_id)
+
+        existing = self.running.get(meeting_id) or next(
+            (job for job in self.pending if job.meeting_id == meeting_id), None
+        )
+        if existing:
+            return existing
+
+        cost = self.estimate_cost(duration_seconds)
+        start = max(self.virtual_time, self.org_finish.get(organization_id, 0.0))
+        finish = start + cost / max(weight, 0.01)
+        self.org_finish[organization_id] = finish
+
+        self.seq += 1
+        job = ScheduledJob(
+            meeting_id=meeting_id,
+            organization_id=organization_id,
+            cost=cost,
+            short=bool(duration_seconds) and 0 < duration_seconds <= self.short_seconds,
+            start_tag=start,
+            finish_tag=finish,
+            seq=self.seq,
+            enqueued_at=time.time() if now is None else now,
+            trace_context=trace_context,
+            duration_seconds=duration_seconds,
+            plan=plan,
+        )
+        self.pending.append(job)
+        return job
+
+    def _pick(self) -> ScheduledJob:
+        short = [job for job in self.pending if job.short]
+        long = [job for job in self.pending if not job.short]
+
+        lane = short if short and (not long or self.short_streak < self.short_burst) else long
+        job = min(lane, key=lambda j: (j.finish_tag, j.seq))
+
+        self.short_streak = self.short_streak + 1 if job.short else 0
+        return job
+
+    def dispatch(self, now: Optional[float] = None) -> List[ScheduledJob]:
+        """
+        Fill free slots
+
+        Returns:
+            Jobs to start now, in dispatch order
+        """
+        now = time.time() if now is None else now
+
+        # Slots of jobs that never reported back (worker lost) are reclaimed
+        for meeting_id, job in list(self.running.items()):
+            if now - job.started_at > self.stale_after:
+                del self.running[meeting_id]
+
+        started = []
+        while self.pending and len(self.running) < self.slots:
+            job = self._pick()
+            self.pending.remove(job)
+            self.virtual_time = max(self.virtual_time, job.start_tag)
+            job.started_at = now
+            self.running[job.meeting_id] = job
+            started.append(job)
+
+        # Models are picked against what is still queued once slots are full
+        if self.adaptive_models:
+            for job in started:
+                job.model = self.choose_model(job, now)
+
+        # Tags at or below virtual time no longer affect new jobs
+        self.org_finish = {
+            org: finish for org, finish in self.org_finish.items()
+            if finish > self.virtual_time
+        }
+
+        return started
+
+    def choose_model(self, job: ScheduledJob, now: float) -> str:
+        """
+        Most accurate Whisper model that still meets the job's turnaround
+
+        Candidates go up to the plan's PLAN_MAX_MODEL. The time budget is
+        what is left of the plan's SLA since the upload, and at most the
+        job's share of SLA_RUN_SHARE x SLA next to the queued work, so each
+        slot can also work through its part of the backlog in time:
+
+            budget = min(sla - waited, 0.5 * sla * cost / (cost + queued cost per slot))
+
+        A model fits if overhead + audio length x its real-time factor is
+        within budget; the fastest model is used when none does.
+        """
+        models = list(MODEL_RTF)
+        allowed = models[:models.index(PLAN_MAX_MODEL.get(job.plan, models[1])) + 1]
+        sla = PLAN_SLA_SECONDS.get(job.plan, PLAN_SLA_SECONDS["free"])
+
+        backlog = sum(pending.cost for pending in self.pending) / max(self.slots, 1)
+        budget = min(
+            sla - (now - job.enqueued_at),
+            SLA_RUN_SHARE * sla * job.cost / (job.cost + backlog),
+        )
+
+        duration = job.duration_seconds or self.default_duration_seconds
+        for model in reversed(allowed):
+            if self.overhead_seconds + duration * self.model_rtf[model] <= budget:
+                return model
+        return allowed[0]
+
+    def observe_rtf(self, model: Optional[str], rtf: Optional[float]) -> None:
+        """Blend a finished job's achieved real-time factor into the model's estimate"""
+        if model in self.model_rtf and rtf and rtf > 0:
+            self.model_rtf[model] += RTF_SMOOTHING * (rtf - self.model_rtf[model])
+
+    def finish(self, meeting_id: str) -> bool:
+        """Release the slot of a finished (or finally failed) job"""
+        return self.running.pop(str(meeting_id), None) is not None
+
+    def state(self) -> dict:
+        return {
+            "pending": [asdict(job) for job in self.pending],
+            "running": [asdict(job) for job in self.running.values()],
+            "org_finish": self.org_finish,
+            "virtual_time": self.virtual_time,
+            "short_streak": self.short_streak,
+            "seq": self.seq,
+            "model_rtf": self.model_rtf,
+        }
+
+    def load(self, state: dict) -> None:
+        self.pending = [ScheduledJob(**job) for job in state.get("pending", [])]
+        self.running = {job["meeting_id"]: ScheduledJob(**job) for job in state.get("running", [])}
+        self.org_finish = dict(state.get("org_finish", {}))
+        self.virtual_time = state.get("virtual_time", 0.0)
+        self.short_streak = state.get("short_streak", 0)
+        self.seq = state.get("seq", 0)
+        self.model_rtf.update(state.get("model_rtf", {}))
+
+
+@contextmanager
+def locked_scheduler(redis_client, **options):
+    """
+    Shared scheduler state, loaded and saved back under a Redis lock
+
+    The state is not saved if the block raises.
+    """
+    with redis_client.lock(STATE_KEY + ":lock", timeout=30, blocking_timeout=10):
+        scheduler = FairScheduler(**options)
+        raw = redis_client.get(STATE_KEY)
+        if raw:
+            scheduler.load(json.loads(raw))
+
+        yield scheduler
+
+        redis_client.set(STATE_KEY, json.dumps(scheduler.state()))
@@ -33,6 +33,13 @@ from .meeting import (
     KnowledgeEdgeBase,
     KnowledgeEdgeCreate,
     KnowledgeEdgeResponse,
+    QuestionRequest,
+    AnswerSource,
+    AnswerResponse,
+    MeetingSearchHit,
+    MeetingSearchResponse,
+    TranscriptSearchHit,
+    TranscriptSearchResponse,
 )
 
 
@@ -70,4 +77,11 @@ __all__ = [
     "KnowledgeEdgeBase",
     "KnowledgeEdgeCreate",
     "KnowledgeEdgeResponse",
+    "QuestionRequest",
+    "AnswerSource",
+    "AnswerResponse",
+    "MeetingSearchHit",
+    "MeetingSearchResponse",
+    "TranscriptSearchHit",
+    "TranscriptSearchResponse",
 ]
@@ -137,3 +137,32 @@ class AITemplateResponse(AITemplateBase):
     is_default: bool = False
     created_at: datetime
     updated_at: datetime
+
+
+# ===========================================
+# Pre-meeting Briefs
+# ===========================================
+
+class PreMeetingBriefResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: UUID
+    calendar_event_id: UUID
+    content: str
+    source_meeting_ids: List[UUID] = []
+    model: Optional[str] = None
+    generated_at: datetime
+
+
+class TemplateOutputResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: UUID
+    meeting_id: UUID
+    template_id: UUID
+    template_name: Optional[str] = None
+    content: Optional[str] = None
+    output: Optional[dict] = None
+    error: Optional[str] = None
+    model: Optional[str] = None
+    updated_at: datetime
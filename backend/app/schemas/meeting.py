@@ -43,6 +43,11 @@ class MeetingParticipantResponse(MeetingParticipantBase):
     duration_seconds: Optional[int] = None
     talk_time_seconds: int = 0
     is_speaker: bool = False
+    turn_count: int = 0
+    interruption_count: int = 0
+    overlap_seconds: int = 0
+    longest_monologue_seconds: int = 0
+    avg_response_latency: Optional[float] = None
 
 
 # Transcript segment
@@ -140,6 +145,8 @@ class MeetingResponse(MeetingBase):
     duration_seconds: Optional[int] = None
     recording_url: Optional[str] = None
     transcript_status: str
+    transcription_model: Optional[str] = None
+    transcription_rtf: Optional[float] = None
     analysis_status: str
     summary: Optional[str] = None
     key_topics: List[str] = []
@@ -194,3 +201,58 @@ class KnowledgeEdgeResponse(KnowledgeEdgeBase):
     target_node_id: UUID
     meeting_id: Optional[UUID] = None
     created_at: datetime
+
+
+# Retrieval Q&A
+class QuestionRequest(BaseModel):
+    question: str = Field(..., min_length=1, max_length=2000)
+    top_k: int = Field(5, ge=1, le=20)
+    organization_id: Optional[UUID] = None
+
+
+class AnswerSource(BaseModel):
+    meeting_id: UUID
+    start: float
+    end: float
+    text: str
+    score: float
+
+
+class AnswerResponse(BaseModel):
+    answer: str
+    sources: List[AnswerSource] = []
+    retrieval_ms: float
+    llm_ms: float
+    prompt_tokens: int
+
+
+# Semantic search
+class MeetingSearchHit(BaseModel):
+    meeting_id: UUID
+    meeting_title: Optional[str] = None
+    kind: str  # summary, chunk
+    text: str
+    start: Optional[float] = None
+    end: Optional[float] = None
+    score: float
+
+
+class MeetingSearchResponse(BaseModel):
+    results: List[MeetingSearchHit] = []
+    took_ms: float
+
+
+# Full-text transcript search
+class TranscriptSearchHit(BaseModel):
+    transcript_id: UUID
+    meeting_id: UUID
+    meeting_title: Optional[str] = None
+    speaker_name: Optional[str] = None
+    start_time: float
+    end_time: float
+    snippet: str
+
+
+class TranscriptSearchResponse(BaseModel):
+    results: List[TranscriptSearchHit] = []
+    next_cursor: Optional[str] = None
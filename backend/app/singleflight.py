@@ -0,0 +1,60 @@
+"""
+Singleflight guard - at most one in-flight run per meeting, stage and input
+"""
+import hashlib
+import json
+import uuid
+from typing import Any, Optional
+
+
+KEY_PREFIX = "singleflight"
+
+# Delete the key only if it still holds our token (an expired claim may
+# already belong to another run)
+_RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+def input_hash(*parts: Any) -> str:
+    """Stable short digest of a task's inputs (JSON-serialisable parts)"""
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(json.dumps(part, sort_keys=True, default=str).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+
+def flight_key(stage: str, meeting_id: str, inputs: str) -> str:
+    return f"{KEY_PREFIX}:{stage}:{meeting_id}:{inputs}"
+
+
+def claim(redis_client, key: str, ttl: int) -> Optional[str]:
+    """
+    Claim ``key`` for ``ttl`` seconds
+
+    Returns:
+        Token to release the claim with, or None if another run holds
+        it. When Redis is unreachable the claim is granted (fail open) -
+        the idempotent writes behind the guard keep duplicates harmless.
+    """
+    token = uuid.uuid4().hex
+    try:
+        if not redis_client.set(key, token, nx=True, ex=ttl):
+            return None
+    except Exception as e:
+        print(f"Singleflight error: {e}")
+    return token
+
+
+def release(redis_client, key: str, token: Optional[str]) -> None:
+    """Release a claim taken with ``claim`` (no-op without a token)"""
+    if not token:
+        return
+    try:
+        redis_client.eval(_RELEASE_SCRIPT, 1, key, token)
+    except Exception as e:
+        print(f"Singleflight error: {e}")
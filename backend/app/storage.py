@@ -0,0 +1,160 @@
+"""
+Recording storage - pooled S3 client, parallel ranged downloads, streaming
+"""
+import os
+import re
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Iterator, Optional, Tuple
+from urllib.parse import urlparse
+
+
+PART_SIZE = 8 * 1024 * 1024
+# Smaller parts when streaming, so the first bytes reach the decoder early
+STREAM_PART_SIZE = 1024 * 1024
+
+# Containers ffmpeg can decode from a pipe (no seeking back to an index)
+STREAMABLE_SUFFIXES = {".mp3", ".wav", ".ogg", ".oga", ".opus", ".flac", ".aac", ".webm", ".mka", ".mkv"}
+
+S3_HOST_PATTERN = re.compile(r"^(?:(?P<bucket>.+)\.)?s3[.-](?:[a-z0-9-]+\.)*amazonaws\.com$")
+
+_s3_client = None
+_s3_client_lock = threading.Lock()
+
+
+def download_concurrency() -> int:
+    return int(os.environ.get("S3_DOWNLOAD_CONCURRENCY", "8"))
+
+
+def get_s3_client():
+    """Process-wide S3 client; boto3 clients are thread-safe and pool connections"""
+    global _s3_client
+
+    if _s3_client is None:
+        with _s3_client_lock:
+            if _s3_client is None:
+                import boto3
+                from botocore.config import Config
+
+                _s3_client = boto3.client(
+                    "s3",
+                    endpoint_url=os.environ.get("S3_ENDPOINT_URL"),
+                    aws_access_key_id=os.environ.get("S3_ACCESS_KEY"),
+                    aws_secret_access_key=os.environ.get("S3_SECRET_KEY"),
+                    config=Config(
+                        max_pool_connections=max(10, 2 * download_concurrency()),
+                        retries={"max_attempts": 3, "mode": "standard"},
+                    ),
+                )
+    return _s3_client
+
+
+def parse_s3_url(url: str) -> Optional[Tuple[str, str]]:
+    """
+    (bucket, key) for S3 recording URLs, None for plain HTTP URLs
+
+    Accepts s3://bucket/key, path-style URLs on the configured endpoint
+    (http://minio:9000/bucket/key) and AWS path- or virtual-hosted-style
+    URLs.
+    """
+    parsed = urlparse(url)
+    if parsed.scheme == "s3":
+        return parsed.netloc, parsed.path.lstrip("/")
+
+    endpoint = urlparse(os.environ.get("S3_ENDPOINT_URL") or "").netloc
+    match = S3_HOST_PATTERN.match(parsed.hostname or "")
+
+    if parsed.netloc and (parsed.netloc == endpoint or (match and not match.group("bucket"))):
+        bucket, _, key = parsed.path.lstrip("/").partition("/")
+        return bucket, key
+    if match and match.group("bucket"):
+        return match.group("bucket"), parsed.path.lstrip("/")
+
+    return None
+
+
+def recording_suffix(url: str) -> str:
+    """File suffix of the recording (lowercase), '' if the URL has none"""
+    suffix = os.path.splitext(urlparse(url).path)[1].lower()
+    return suffix if re.fullmatch(r"\.[a-z0-9]{1,5}", suffix) else ""
+
+
+def is_streamable(url: str) -> bool:
+    """Whether the recording can be decoded while it downloads"""
+    return recording_suffix(url) in STREAMABLE_SUFFIXES
+
+
+def iter_s3_object(
+    bucket: str,
+    key: str,
+    part_size: int = PART_SIZE,
+    max_workers: Optional[int] = None
+) -> Iterator[bytes]:
+    """
+    Yield an S3 object's bytes in order
+
+    Objects larger than ``part_size`` are fetched as parallel ranged
+    GETs, at most ``max_workers`` parts in flight (bounded memory), and
+    yielded in order as soon as the next part is complete. Every part
+    is pinned to the ETag seen by HEAD, so an object replaced mid-way
+    fails instead of mixing versions.
+    """
+    client = get_s3_client()
+    head = client.head_object(Bucket=bucket, Key=key)
+    size = head["ContentLength"]
+
+    if size <= part_size:
+        body = client.get_object(Bucket=bucket, Key=key)["Body"]
+        yield from body.iter_chunks(1024 * 1024)
+        return
+
+    def fetch(start: int) -> bytes:
+        end = min(start + part_size, size) - 1
+        response = client.get_object(
+            Bucket=bucket, Key=key, Range=f"bytes={start}-{end}", IfMatch=head["ETag"]
+        )
+        return response["Body"].read()
+
+    offsets = iter(range(0, size, part_size))
+    max_workers = max_workers or download_concurrency()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        in_flight = deque(pool.submit(fetch, start) for start in islice(offsets, max_workers))
+        while in_flight:
+            data = in_flight.popleft().result()
+            start = next(offsets, None)
+            if start is not None:
+                in_flight.append(pool.submit(fetch, start))
+            yield data
+
+
+def iter_recording(url: str, part_size: int = PART_SIZE) -> Iterator[bytes]:
+    """Yield a recording's bytes from S3 (ranged parts of ``part_size``) or a plain URL"""
+    location = parse_s3_url(url)
+    if location:
+        yield from iter_s3_object(*location, part_size=part_size)
+        return
+
+    import httpx
+
+    with httpx.stream("GET", url, follow_redirects=True) as response:
+        response.raise_for_status()
+        yield from response.iter_bytes()
+
+
+def download_recording(url: str) -> str:
+    """Download recording from S3 or URL to a temp file with its own suffix"""
+    temp_file = tempfile.NamedTemporaryFile(suffix=recording_suffix(url), delete=False)
+
+    try:
+        with temp_file:
+            for chunk in iter_recording(url):
+                temp_file.write(chunk)
+    except Exception:
+        os.unlink(temp_file.name)
+        raise
+
+    return temp_file.name
@@ -3,189 +3,755 @@ Celery tasks for AI processing
 """
 import os
 import sys
-import tempfile
+import threading
+from collections import OrderedDict
 from datetime import datetime
 
+from opentelemetry import trace
+from sqlalchemy import insert, update
+
 # Add ai-engine to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "ai-engine"))
 
 from app.celery import celery_app
-from app.db.session import SessionLocal
+from app.db.session import SessionLocal, session_scope
 from app.models.meeting import Meeting, MeetingStatus
 from app.models.transcript import Transcript, ActionItem, ActionItemStatus
+from app.metrics import StageTimer, count_bytes
+from app.singleflight import claim, release, flight_key, input_hash
+from app.storage import download_recording, iter_recording, is_streamable, STREAM_PART_SIZE
+from app.tracing import attached_context, current_context
 
 
 @celery_app.task(bind=True, max_retries=3)
-def transcribe_meeting(self, meeting_id: str):
+def transcribe_meeting(self, meeting_id: str, model: str = None):
     """
     Transcribe meeting audio using Whisper
     
+    A run that finds the same meeting and recording already in flight
+    (with any model) exits as a duplicate; a repeated run replaces the meeting's
+    segments instead of adding a second copy. The model used and the
+    achieved real-time factor are stored on the meeting and reported to
+    the scheduler with the freed slot.
+    
     Args:
         meeting_id: UUID of the meeting
+        model: Local Whisper model picked by the scheduler (default: WHISPER_MODEL)
     """
-    from ai_engine.transcription import WhisperTranscriber, TranscriberConfig
+    from redis import Redis
+    from ai_engine.transcription import WhisperTranscriber, TranscriberConfig, decode_audio_stream, SAMPLE_RATE
     
-    db = SessionLocal()
+    redis_client = Redis.from_url(os.environ.get("REDIS_URL", "redis://redis:6379/0"), socket_timeout=5)
+    claim_token = None
+    timer = StageTimer("transcribe")
+    trace.get_current_span().set_attribute("meeting.id", meeting_id)
+    
+    # Create transcriber
+    config = TranscriberConfig(
+        model=model or os.environ.get("WHISPER_MODEL", "base"),
+        use_local=os.environ.get("USE_LOCAL_WHISPER", "false").lower() == "true",
+        openai_api_key=os.environ.get("OPENAI_API_KEY"),
+    )
     
+    # No session is held while downloading or transcribing - each database
+    # phase takes a pooled connection for milliseconds and returns it
     try:
-        meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
-        
-        if not meeting:
-            raise ValueError(f"Meeting {meeting_id} not found")
-        
-        # Update status
-        meeting.transcript_status = "processing"
-        db.commit()
-        
-        # Download recording
-        recording_path = download_recording(meeting.recording_url)
-        
-        # Create transcriber
-        config = TranscriberConfig(
-            model=os.environ.get("WHISPER_MODEL", "base"),
-            use_local=os.environ.get("USE_LOCAL_WHISPER", "false").lower() == "true",
-            openai_api_key=os.environ.get("OPENAI_API_KEY"),
-        )
+        with timer.stage("db_read"), session_scope() as db:
+            meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
+            
+            if not meeting:
+                raise ValueError(f"Meeting {meeting_id} not found")
+            
+            recording_url = meeting.recording_url
+            # Not keyed on the model: a re-dispatch may pick another one
+            # for the same recording and must still count as a duplicate
+            claim_key = flight_key("transcribe", meeting_id, input_hash(recording_url))
+            claim_token = claim(
+                redis_client, claim_key, int(os.environ.get("TRANSCRIBE_CLAIM_TTL_SECONDS", "18000"))
+            )
+            if claim_token is None:
+                return {"status": "duplicate"}
+            
+            # Update status
+            meeting.transcript_status = "processing"
         
         transcriber = WhisperTranscriber(config)
+        progress_callback = lambda data: update_transcription_progress(meeting_id, data)
         
-        # Transcribe with progress callback
-        segments = transcriber.transcribe_file(
-            recording_path,
-            progress_callback=lambda data: update_transcription_progress(
-                meeting_id, data, db
-            )
+        streaming = (
+            config.use_local
+            and os.environ.get("RECORDING_STREAMING", "true").lower() == "true"
+            and is_streamable(recording_url)
         )
         
-        # Save transcripts to database
-        for segment in segments:
-            transcript = Transcript(
-                meeting_id=meeting_id,
-                text=segment.text,
-                start_time=segment.start,
-                end_time=segment.end,
-                speaker_name=segment.speaker or "Unknown",
-                confidence=segment.confidence,
-            )
-            db.add(transcript)
+        if streaming:
+            # Decode while downloading, no temp file (one stage - they overlap)
+            with timer.stage("download_decode") as stage:
+                chunks = iter_recording(recording_url, part_size=STREAM_PART_SIZE)
+                audio = decode_audio_stream(count_bytes(chunks, stage))
+                stage["audio_seconds"] = len(audio) / SAMPLE_RATE
+            segments = transcriber.transcribe_audio(audio, progress_callback=progress_callback, timer=timer)
+        else:
+            # Download recording, then transcribe the file
+            with timer.stage("download") as stage:
+                recording_path = download_recording(recording_url)
+                stage["bytes"] = os.path.getsize(recording_path)
+            segments = transcriber.transcribe_file(recording_path, progress_callback=progress_callback, timer=timer)
         
-        # Update meeting status
-        meeting.transcript_status = "completed"
-        db.commit()
+        used_model = config.model if config.use_local else "whisper-1"
+        rtf = timer.realtime_factor("whisper")
+        
+        with session_scope() as db:
+            # Replace the meeting's transcripts (COPY in bounded batches)
+            with timer.stage("db_write"):
+                replace_transcript_segments(db, meeting_id, segments)
+            
+            # Fast local insights so topics/sentiment show up before the LLM tier
+            with timer.stage("local_analysis"):
+                meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
+                apply_local_analysis(
+                    meeting,
+                    [{"speaker": seg.speaker, "text": seg.text} for seg in segments],
+                )
+            
+            # Update meeting status
+            meeting.transcript_status = "completed"
+            meeting.transcription_model = used_model
+            meeting.transcription_rtf = round(rtf, 4) if rtf is not None else None
+            save_pipeline_timing(db, meeting_id, timer)
         
-        # Trigger analysis task
+        # Trigger analysis and retrieval indexing
         analyze_meeting.delay(meeting_id)
+        index_meeting_chunks.delay(meeting_id)
+        
+        # Free the scheduler slot for the next queued meeting
+        dispatch_transcriptions.delay(meeting_id, used_model, rtf)
         
         return {"status": "completed", "segments_count": len(segments)}
         
     except Exception as e:
-        meeting.transcript_status = "failed"
-        db.commit()
+        set_meeting_status(meeting_id, transcript_status="failed")
+        if self.request.retries >= self.max_retries:
+            dispatch_transcriptions.delay(meeting_id)
         raise self.retry(exc=e, countdown=60)
         
     finally:
-        db.close()
+        if claim_token:
+            release(redis_client, claim_key, claim_token)
         # Cleanup temp file
         if "recording_path" in locals() and os.path.exists(recording_path):
             os.unlink(recording_path)
 
 
+@celery_app.task
+def schedule_transcription(meeting_id: str):
+    """
+    Queue a meeting for transcription through the fair-share scheduler
+    
+    The meeting's duration sets its expected cost and the organization's
+    plan its weight (see app.scheduler). transcribe_meeting is enqueued
+    once a transcription slot is free, with the Whisper model the
+    scheduler picked for the plan's turnaround target.
+    
+    Args:
+        meeting_id: UUID of the meeting
+    """
+    from app.models.meeting import Organization
+    from app.scheduler import PLAN_WEIGHTS
+    
+    db = SessionLocal()
+    
+    try:
+        row = db.query(
+            Meeting.organization_id, Meeting.duration_seconds, Organization.plan_type
+        ).join(
+            Organization, Organization.id == Meeting.organization_id
+        ).filter(Meeting.id == meeting_id).first()
+    finally:
+        db.close()
+    
+    if not row:
+        return {"status": "not_found"}
+    
+    with transcription_scheduler() as scheduler:
+        job = scheduler.submit(
+            meeting_id,
+            row.organization_id,
+            row.duration_seconds,
+            weight=PLAN_WEIGHTS.get(row.plan_type, 1.0),
+            trace_context=current_context(),
+            plan=row.plan_type,
+        )
+        started = scheduler.dispatch()
+    
+    for started_job in started:
+        with attached_context(started_job.trace_context):
+            transcribe_meeting.delay(started_job.meeting_id, started_job.model)
+    
+    return {"status": "running" if job.started_at else "queued", "short": job.short}
+
+
+@celery_app.task
+def dispatch_transcriptions(finished_meeting_id: str = None, model: str = None, rtf: float = None):
+    """
+    Release a finished meeting's slot and start queued transcriptions
+    
+    Also runs periodically to reclaim slots of lost workers.
+    
+    Args:
+        finished_meeting_id: Meeting whose transcription just ended
+        model: Whisper model the finished meeting used
+        rtf: Its achieved real-time factor (updates the model's estimate)
+    """
+    with transcription_scheduler() as scheduler:
+        if finished_meeting_id:
+            scheduler.finish(finished_meeting_id)
+            scheduler.observe_rtf(model, rtf)
+        started = scheduler.dispatch()
+        waiting = len(scheduler.pending)
+    
+    for job in started:
+        # Continue the trace of the request that queued the meeting
+        with attached_context(job.trace_context):
+            transcribe_meeting.delay(job.meeting_id, job.model)
+    
+    return {"started": len(started), "waiting": waiting}
+
+
 @celery_app.task(bind=True, max_retries=3)
 def analyze_meeting(self, meeting_id: str):
     """
     Analyze meeting transcript using LLM
     
+    The transcript and context are loaded in one short session and the
+    results written in another; no connection is held during the LLM call.
+    Key moments and action items are linked to the transcript segment at
+    their timestamp. A run on the same transcript and model as one already
+    in flight exits as a duplicate, and AI action items are replaced, not
+    added again, when a meeting is re-analyzed.
+    
     Args:
         meeting_id: UUID of the meeting
     """
-    from ai_engine.analysis import MeetingAnalyzer
+    from redis import Redis
     
-    db = SessionLocal()
+    redis_client = Redis.from_url(os.environ.get("REDIS_URL", "redis://redis:6379/0"), socket_timeout=5)
+    claim_token = None
+    timer = StageTimer("analyze")
+    trace.get_current_span().set_attribute("meeting.id", meeting_id)
     
     try:
-        meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
+        # Create analyzer
+        analyzer = create_analyzer()
         
-        if not meeting:
-            raise ValueError(f"Meeting {meeting_id} not found")
+        with timer.stage("db_read"), session_scope() as db:
+            meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
+            
+            if not meeting:
+                raise ValueError(f"Meeting {meeting_id} not found")
+            
+            meeting_title = meeting.title
+            
+            # Load transcripts
+            transcripts = (
+                db.query(Transcript)
+                .filter(Transcript.meeting_id == meeting_id)
+                .order_by(Transcript.start_time)
+                .all()
+            )
+            
+            # Format for analyzer
+            transcript_data = [
+                {
+                    "speaker": t.speaker_name,
+                    "text": t.text,
+                    "start": float(t.start_time),
+                    "end": float(t.end_time),
+                }
+                for t in transcripts
+            ]
+            segment_ids = [t.id for t in transcripts]
+            
+            claim_key = flight_key("analyze", meeting_id, input_hash(
+                [(str(t.id), t.text) for t in transcripts], analyzer.llm_provider, analyzer.model
+            ))
+            claim_token = claim(
+                redis_client, claim_key, int(os.environ.get("ANALYZE_CLAIM_TTL_SECONDS", "1800"))
+            )
+            if claim_token is None:
+                return {"status": "duplicate"}
+            
+            # Update status
+            meeting.analysis_status = "processing"
+            
+            # Per-speaker talk time, turns, interruptions, latency
+            save_participant_dynamics(db, meeting_id, transcript_data)
+            
+            # Get previous meetings for context
+            previous_meetings = get_previous_meeting_summaries(db, meeting)
         
-        # Update status
-        meeting.analysis_status = "processing"
-        db.commit()
+        # Analyze (streaming publishes each field as soon as it is ready)
+        with timer.stage("llm"):
+            if os.environ.get("ENABLE_ANALYSIS_STREAMING", "true").lower() == "true":
+                result = analyzer.analyze_meeting_stream(
+                    transcript=transcript_data,
+                    meeting_title=meeting_title,
+                    previous_meetings=previous_meetings,
+                    on_field=analysis_field_publisher(meeting_id),
+                )
+            else:
+                result = analyzer.analyze_meeting(
+                    transcript=transcript_data,
+                    meeting_title=meeting_title,
+                    previous_meetings=previous_meetings,
+                )
         
-        # Load transcripts
-        transcripts = (
-            db.query(Transcript)
-            .filter(Transcript.meeting_id == meeting_id)
-            .order_by(Transcript.start_time)
-            .all()
+        with session_scope() as db:
+            with timer.stage("db_write"):
+                save_analysis_result(db, meeting_id, result, transcript_data, segment_ids)
+            
+            save_pipeline_timing(db, meeting_id, timer)
+        
+        enqueue_analysis_followups(meeting_id, result)
+        
+        return {
+            "status": "completed",
+            "summary_length": len(result.summary),
+            "usage": analyzer.last_usage,
+            "provider": analyzer.last_provider,
+        }
+        
+    except Exception as e:
+        set_meeting_status(meeting_id, analysis_status="failed")
+        raise self.retry(exc=e, countdown=60)
+        
+    finally:
+        if claim_token:
+            release(redis_client, claim_key, claim_token)
+
+
+@celery_app.task(bind=True, max_retries=1)
+def update_live_analysis(self, meeting_id: str):
+    """
+    Fold new transcript segments of an in-progress meeting into its
+    rolling analysis
+    
+    Only segments after the last processed one are loaded and sent to
+    the LLM together with the compact state kept in Redis, so the cost
+    of each update does not grow with meeting length. No connection is
+    held during the LLM call. An update that finds another one for the
+    meeting still running is skipped, so a slow call overtaken by the
+    next beat cannot overwrite a newer result.
+    
+    Args:
+        meeting_id: UUID of the meeting
+    """
+    import json
+    from redis import Redis
+    from ai_engine.analysis import IncrementalAnalyzer, RollingState
+    
+    redis_client = Redis.from_url(os.environ.get("REDIS_URL", "redis://redis:6379/0"))
+    state_key = f"meeting:{meeting_id}:rolling_state"
+    claim_key = flight_key("live_analysis", meeting_id, "rolling")
+    claim_token = claim(
+        redis_client, claim_key, int(os.environ.get("LIVE_ANALYSIS_CLAIM_TTL_SECONDS", "600"))
+    )
+    if claim_token is None:
+        return {"status": "duplicate"}
+    
+    # Read new segments, run the LLM without a session, then write back
+    try:
+        raw_state = redis_client.get(state_key)
+        state = RollingState.from_dict(json.loads(raw_state) if raw_state else None)
+        
+        with session_scope() as db:
+            meeting = db.query(Meeting.title).filter(Meeting.id == meeting_id).first()
+            
+            if not meeting:
+                return
+            
+            meeting_title = meeting.title
+            
+            new_segments = [
+                {
+                    "speaker": t.speaker_name,
+                    "text": t.text,
+                    "start": float(t.start_time),
+                    "end": float(t.end_time),
+                }
+                for t in db.query(Transcript)
+                .filter(
+                    Transcript.meeting_id == meeting_id,
+                    Transcript.end_time > state.last_segment_end,
+                )
+                .order_by(Transcript.start_time)
+                .all()
+            ]
+        
+        if not new_segments:
+            return {"status": "unchanged", "updates": state.updates}
+        
+        analyzer = create_analyzer()
+        
+        state = IncrementalAnalyzer(analyzer).update(
+            state, new_segments, meeting_title=meeting_title
         )
         
-        # Format for analyzer
-        transcript_data = [
-            {
-                "speaker": t.speaker_name,
-                "text": t.text,
-                "start": float(t.start_time),
-                "end": float(t.end_time),
-            }
-            for t in transcripts
+        redis_client.set(state_key, json.dumps(state.to_dict()), ex=24 * 3600)
+        
+        with session_scope() as db:
+            db.query(Meeting).filter(Meeting.id == meeting_id).update({
+                "summary": state.summary,
+                "key_topics": state.key_topics,
+            }, synchronize_session=False)
+        
+        return {"status": "updated", "updates": state.updates, "new_segments": len(new_segments)}
+        
+    except Exception as e:
+        raise self.retry(exc=e, countdown=30)
+        
+    finally:
+        release(redis_client, claim_key, claim_token)
+
+
+@celery_app.task
+def refresh_live_analyses():
+    """Periodic: enqueue rolling analysis updates for in-progress meetings"""
+    db = SessionLocal()
+    
+    try:
+        meeting_ids = [
+            str(row.id)
+            for row in db.query(Meeting.id)
+            .filter(Meeting.status == MeetingStatus.IN_PROGRESS)
+            .all()
         ]
+    finally:
+        db.close()
+    
+    for meeting_id in meeting_ids:
+        update_live_analysis.delay(meeting_id)
+    
+    return {"enqueued": len(meeting_ids)}
+
+
+@celery_app.task(bind=True, max_retries=3)
+def submit_analysis_batch(self, meeting_ids: list, provider: str = None):
+    """
+    Submit re-analysis of many meetings as one provider batch job
+    
+    Transcripts are loaded in a single query and prompts, with the same
+    previous-meeting context as ``analyze_meeting``, are packed into one
+    batch submission; ``poll_analysis_batches`` writes the results back
+    when it finishes. No session is held during the submission. The
+    ``analysis_batches`` row is written before submitting, so a failure
+    after the provider accepted the batch is never retried into a second
+    provider batch.
+    
+    Args:
+        meeting_ids: UUIDs of meetings to analyze
+        provider: Batch provider (openai, anthropic, local); defaults to LLM_PROVIDER
+    """
+    from ai_engine.analysis.batch import build_batch_request
+    from app.models.analysis import AnalysisBatch
+    
+    analyzer = create_analyzer()
+    backend = create_batch_backend(analyzer, provider)
+    
+    with session_scope() as db:
+        meetings = db.query(Meeting).filter(Meeting.id.in_(meeting_ids)).all()
+        transcripts = load_transcripts_bulk(db, [m.id for m in meetings])
         
-        # Get previous meetings for context
-        previous_meetings = get_previous_meeting_summaries(db, meeting)
+        requests = [
+            build_batch_request(
+                analyzer,
+                custom_id=str(m.id),
+                transcript=transcripts.get(str(m.id), []),
+                meeting_title=m.title,
+                previous_meetings=get_previous_meeting_summaries(db, m),
+            )
+            for m in meetings
+            if transcripts.get(str(m.id))
+        ]
         
-        # Create analyzer
-        analyzer = MeetingAnalyzer(
-            llm_provider=os.environ.get("LLM_PROVIDER", "openai"),
-            api_key=os.environ.get("LLM_API_KEY"),
-            model=os.environ.get("LLM_MODEL", "gpt-4o-mini"),
-        )
+        if not requests:
+            return {"status": "empty"}
         
-        # Analyze
-        result = analyzer.analyze_meeting(
-            transcript=transcript_data,
-            meeting_title=meeting.title,
-            previous_meetings=previous_meetings,
+        batch = AnalysisBatch(
+            provider=provider or analyzer.llm_provider,
+            model=analyzer.model,
+            status="submitting",
+            meeting_ids=[r.custom_id for r in requests],
+            request_count=len(requests),
         )
-        
-        # Save results
-        meeting.summary = result.summary
-        meeting.key_topics = result.key_topics
-        meeting.sentiment_score = result.sentiment_score
-        meeting.analysis_status = "completed"
-        
-        # Mark key moments in transcripts
-        for moment in result.key_moments:
-            # Find closest transcript segment
-            # (simplified - in production would match by timestamp)
-            pass
-        
-        # Create action items
-        for item in result.action_items:
-            action_item = ActionItem(
-                meeting_id=meeting_id,
-                task=item.get("task", ""),
-                assignee_name=item.get("assignee"),
-                priority=item.get("priority", "medium"),
-                status=ActionItemStatus.PENDING,
+        db.add(batch)
+        db.flush()
+        batch_id = batch.id
+    
+    try:
+        external_id = backend.submit(requests)
+    except Exception as e:
+        with session_scope() as db:
+            db.query(AnalysisBatch).filter(AnalysisBatch.id == batch_id).update(
+                {AnalysisBatch.status: "failed", AnalysisBatch.error: str(e)[:1000]},
+                synchronize_session=False,
+            )
+        raise self.retry(exc=e, countdown=300)
+    
+    # The provider has the batch now: failing here must not submit it again
+    try:
+        with session_scope() as db:
+            db.query(AnalysisBatch).filter(AnalysisBatch.id == batch_id).update(
+                {AnalysisBatch.status: "pending", AnalysisBatch.external_batch_id: external_id},
+                synchronize_session=False,
             )
-            db.add(action_item)
+            db.query(Meeting).filter(
+                Meeting.id.in_([r.custom_id for r in requests])
+            ).update({Meeting.analysis_status: "queued"}, synchronize_session=False)
+    except Exception as e:
+        print(f"Batch {external_id} submitted but not recorded (analysis batch {batch_id}): {e}")
+        raise
+    
+    return {"status": "submitted", "batch_id": str(batch_id), "requests": len(requests)}
+
+
+@celery_app.task
+def poll_analysis_batches():
+    """
+    Periodic: collect finished provider batches and bulk-write results
+    
+    Each batch is handled on its own: a provider error is logged and the
+    batch stays pending for the next poll. Provider calls and result
+    parsing (which may make repair LLM calls) run without a DB session.
+    Each re-analyzed meeting gets the same follow-up tasks (knowledge
+    graph, templates, search index) as an online analysis.
+    """
+    from ai_engine.analysis.batch import (
+        parse_batch_result,
+        BATCH_COMPLETED,
+        BATCH_FAILED,
+    )
+    from app.models.analysis import AnalysisBatch
+    
+    with session_scope() as db:
+        pending = [
+            (batch.id, batch.provider, batch.external_batch_id, list(batch.meeting_ids), batch.request_count)
+            for batch in db.query(AnalysisBatch).filter(AnalysisBatch.status == "pending")
+        ]
+    
+    analyzer = create_analyzer()
+    finished = 0
+    
+    for batch_id, provider, external_batch_id, meeting_ids, request_count in pending:
+        try:
+            backend = create_batch_backend(analyzer, provider)
+            state = backend.status(external_batch_id)
+            
+            if state == BATCH_FAILED:
+                with session_scope() as db:
+                    db.query(AnalysisBatch).filter(AnalysisBatch.id == batch_id).update(
+                        {AnalysisBatch.status: "failed", AnalysisBatch.failed_count: request_count},
+                        synchronize_session=False,
+                    )
+                    db.query(Meeting).filter(Meeting.id.in_(meeting_ids)).update(
+                        {Meeting.analysis_status: "failed"}, synchronize_session=False
+                    )
+                finished += 1
+                continue
+            
+            if state != BATCH_COMPLETED:
+                continue
+            
+            raw_results = backend.results(external_batch_id)
+            with session_scope() as db:
+                transcripts = load_transcripts_bulk(db, list(raw_results), with_ids=True)
+            
+            results = {
+                meeting_id: parse_batch_result(analyzer, text, transcripts.get(meeting_id, []))
+                for meeting_id, text in raw_results.items()
+            }
+            failed = [m for m in meeting_ids if m not in results]
+            
+            with session_scope() as db:
+                save_analysis_results(db, results, transcripts)
+                
+                if failed:
+                    db.query(Meeting).filter(Meeting.id.in_(failed)).update(
+                        {Meeting.analysis_status: "failed"}, synchronize_session=False
+                    )
+                
+                db.query(AnalysisBatch).filter(AnalysisBatch.id == batch_id).update(
+                    {
+                        AnalysisBatch.status: "completed",
+                        AnalysisBatch.completed_count: len(results),
+                        AnalysisBatch.failed_count: len(failed),
+                        AnalysisBatch.completed_at: datetime.utcnow(),
+                    },
+                    synchronize_session=False,
+                )
+            
+            for meeting_id, result in results.items():
+                enqueue_analysis_followups(meeting_id, result)
+            finished += 1
+            
+        except Exception as e:
+            print(f"Batch poll error ({external_batch_id}): {e}")
+    
+    return {"pending": len(pending), "finished": finished}
+
+
+@celery_app.task
+def precompute_pre_meeting_briefs():
+    """
+    Periodic: generate briefs for calendar events starting soon
+    
+    Scans events starting within PRE_MEETING_BRIEF_HOURS that have no
+    brief yet and enqueues generation, so the brief endpoint can serve
+    them without any LLM call at read time.
+    """
+    from datetime import timedelta
+    from app.models.extra import CalendarEvent
+    from app.models.analysis import PreMeetingBrief
+    
+    hours = int(os.environ.get("PRE_MEETING_BRIEF_HOURS", "12"))
+    now = datetime.utcnow()
+    
+    db = SessionLocal()
+    
+    try:
+        event_ids = [
+            str(row.id)
+            for row in db.query(CalendarEvent.id)
+            .outerjoin(PreMeetingBrief, PreMeetingBrief.calendar_event_id == CalendarEvent.id)
+            .filter(
+                CalendarEvent.start_time >= now,
+                CalendarEvent.start_time <= now + timedelta(hours=hours),
+                PreMeetingBrief.id.is_(None),
+            )
+            .all()
+        ]
+    finally:
+        db.close()
+    
+    for event_id in event_ids:
+        generate_pre_meeting_brief.delay(event_id)
+    
+    return {"enqueued": len(event_ids)}
+
+
+@celery_app.task(bind=True, max_retries=3)
+def generate_pre_meeting_brief(self, event_id: str):
+    """
+    Generate and store the pre-meeting brief for a calendar event
+    
+    Built from stored analyses (summary, topics, AI action items) of
+    previous meetings in the same organization, preferring meetings
+    with the same title. No connection is held during the LLM call.
+    Events that already have a brief are skipped, and a run for an event
+    whose brief is still being generated exits as a duplicate.
+    
+    Args:
+        event_id: UUID of the calendar event
+    """
+    from redis import Redis
+    from app.db.bulk import upsert
+    from app.models.extra import CalendarEvent
+    from app.models.meeting import OrganizationMember
+    from app.models.analysis import PreMeetingBrief
+    
+    redis_client = Redis.from_url(os.environ.get("REDIS_URL", "redis://redis:6379/0"), socket_timeout=5)
+    claim_token = None
+    
+    # Read the stored analyses, generate without a session, then write
+    try:
+        with session_scope() as db:
+            event = db.query(CalendarEvent).filter(CalendarEvent.id == event_id).first()
+            
+            if not event:
+                return
+            
+            if db.query(PreMeetingBrief.id).filter(PreMeetingBrief.calendar_event_id == event.id).first():
+                return {"status": "exists"}
+            
+            if event.meeting is not None:
+                organization_id = event.meeting.organization_id
+            else:
+                membership = (
+                    db.query(OrganizationMember.organization_id)
+                    .filter(OrganizationMember.user_id == event.user_id)
+                    .first()
+                )
+                organization_id = membership.organization_id if membership else None
+            
+            if organization_id is None:
+                return {"status": "skipped", "reason": "no organization"}
+            
+            previous = (
+                db.query(Meeting)
+                .filter(
+                    Meeting.organization_id == organization_id,
+                    Meeting.status == MeetingStatus.COMPLETED,
+                    Meeting.summary.isnot(None),
+                )
+                .order_by((Meeting.title == event.title).desc(), Meeting.created_at.desc())
+                .limit(3)
+                .all()
+            )
+            
+            if not previous:
+                return {"status": "skipped", "reason": "no previous meetings"}
+            
+            # Oldest first - generate_pre_meeting_brief reads them chronologically
+            previous = list(reversed(previous))
+            analyses = load_stored_analyses(db, previous)
+            source_ids = [str(m.id) for m in previous]
+            
+            event_key, event_title, user_id = event.id, event.title, event.user_id
+            participants = [
+                a.get("name") or a.get("email", "")
+                for a in (event.attendees or [])
+                if isinstance(a, dict)
+            ]
+            
+            claim_key = flight_key("brief", event_id, "event")
+            claim_token = claim(
+                redis_client, claim_key, int(os.environ.get("ANALYZE_CLAIM_TTL_SECONDS", "1800"))
+            )
+            if claim_token is None:
+                return {"status": "duplicate"}
         
-        db.commit()
+        analyzer = create_analyzer()
+        content = analyzer.generate_pre_meeting_brief(
+            meeting_title=event_title,
+            participants=participants,
+            previous_meetings=analyses,
+        )
         
-        # Update knowledge graph
-        if os.environ.get("ENABLE_KNOWLEDGE_GRAPH", "true").lower() == "true":
-            update_knowledge_graph.delay(meeting_id, result.knowledge_graph_updates)
+        # A brief written meanwhile (claim expired) is replaced, not a conflict
+        with session_scope() as db:
+            upsert(
+                db,
+                PreMeetingBrief.__table__,
+                [{
+                    "calendar_event_id": event_key,
+                    "user_id": user_id,
+                    "content": content,
+                    "source_meeting_ids": source_ids,
+                    "model": analyzer.model,
+                    "generated_at": datetime.utcnow(),
+                }],
+                conflict_columns=["calendar_event_id"],
+                update_columns=["content", "source_meeting_ids", "model", "generated_at"],
+            )
         
-        return {"status": "completed", "summary_length": len(result.summary)}
+        return {"status": "completed", "sources": len(source_ids)}
         
     except Exception as e:
-        meeting.analysis_status = "failed"
-        db.commit()
-        raise self.retry(exc=e, countdown=60)
+        raise self.retry(exc=e, countdown=120)
         
     finally:
-        db.close()
+        if claim_token:
+            release(redis_client, claim_key, claim_token)
 
 
 @celery_app.task
@@ -193,41 +759,104 @@ def update_knowledge_graph(meeting_id: str, updates: dict):
     """
     Update knowledge graph with new entities and relationships
     
+    Nodes and edges are upserted in bulk (INSERT ... ON CONFLICT), so a
+    meeting costs the same few queries however many entities it has.
+    Relationship ends are entity names from the same update (optionally
+    narrowed by "source_type"/"target_type") or ids of existing nodes of
+    the meeting's organization; other ends drop the relationship.
+    
     Args:
         meeting_id: UUID of the meeting
         updates: Knowledge graph updates from analysis
     """
+    import uuid
+    from app.db.bulk import upsert
     from app.models.transcript import KnowledgeNode, KnowledgeEdge
     
     db = SessionLocal()
     
     try:
-        meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
+        organization_id = db.query(Meeting.organization_id).filter(
+            Meeting.id == meeting_id
+        ).scalar()
         
-        if not meeting:
+        if not organization_id:
             return
         
-        # Add new entities
-        for entity in updates.get("entities", []):
-            node = KnowledgeNode(
-                organization_id=meeting.organization_id,
-                name=entity["name"],
-                node_type=entity["type"],
-                description=entity.get("description"),
-                metadata=entity.get("metadata", {}),
-            )
-            db.merge(node)  # Use merge to avoid duplicates
+        # Upsert entities, getting ids of new and existing nodes back
+        nodes = upsert(
+            db,
+            KnowledgeNode.__table__,
+            (
+                {
+                    "organization_id": organization_id,
+                    "name": entity["name"][:255],
+                    "node_type": entity["type"][:50],
+                    "description": entity.get("description"),
+                    "metadata": entity.get("metadata", {}),
+                }
+                for entity in updates.get("entities", [])
+                if entity.get("name") and entity.get("type")
+            ),
+            conflict_columns=("organization_id", "name", "node_type"),
+            update_columns=("description",),
+            returning=("id", "name", "node_type"),
+        )
         
-        # Add relationships
+        node_ids = {}
+        for node in nodes:
+            node_ids[(node.name, node.node_type)] = node.id
+            node_ids.setdefault(node.name, node.id)
+        
+        # Ends given as node ids must name a node of this organization
+        # (an invented id would fail the foreign key, another
+        # organization's would link across organizations)
+        referenced = set()
         for rel in updates.get("relationships", []):
-            edge = KnowledgeEdge(
-                source_node_id=rel["source"],
-                target_node_id=rel["target"],
-                edge_type=rel["type"],
-                strength=rel.get("strength", 1.0),
-                meeting_id=meeting_id,
-            )
-            db.add(edge)
+            for end in (rel.get("source"), rel.get("target")):
+                try:
+                    referenced.add(uuid.UUID(str(end)))
+                except ValueError:
+                    pass
+        if referenced:
+            for row in db.query(KnowledgeNode.id).filter(
+                KnowledgeNode.organization_id == organization_id,
+                KnowledgeNode.id.in_(referenced),
+            ):
+                node_ids[str(row.id)] = row.id
+        
+        def resolve(end, end_type=None):
+            end = str(end)
+            key = (end[:255], end_type) if end_type else end[:255]
+            if key in node_ids:
+                return node_ids[key]
+            try:
+                return node_ids.get(str(uuid.UUID(end)))
+            except ValueError:
+                return None
+        
+        # Upsert relationships between resolved nodes
+        edges = []
+        for rel in updates.get("relationships", []):
+            source = resolve(rel["source"], rel.get("source_type"))
+            target = resolve(rel["target"], rel.get("target_type"))
+            if source is None or target is None:
+                continue
+            edges.append({
+                "source_node_id": source,
+                "target_node_id": target,
+                "edge_type": rel["type"],
+                "strength": rel.get("strength", 1.0),
+                "meeting_id": meeting_id,
+            })
+        
+        upsert(
+            db,
+            KnowledgeEdge.__table__,
+            edges,
+            conflict_columns=("source_node_id", "target_node_id", "edge_type"),
+            update_columns=("strength", "meeting_id"),
+        )
         
         db.commit()
         
@@ -239,71 +868,991 @@ def update_knowledge_graph(meeting_id: str, updates: dict):
         db.close()
 
 
-def download_recording(url: str) -> str:
-    """Download recording from S3 or URL"""
-    import boto3
-    from urllib.parse import urlparse
+@celery_app.task(bind=True, max_retries=2)
+def run_meeting_templates(self, meeting_id: str, template_ids: list = None):
+    """
+    Run AI templates against a meeting transcript and store outputs
+    
+    The transcript is prepared once and shared by all templates; the
+    templates run in parallel with no connection held. Existing outputs
+    are replaced.
     
-    # Check if S3 URL
-    if "s3" in url or urlparse(url).netloc:
-        # Download from S3
-        s3_client = boto3.client(
-            "s3",
-            endpoint_url=os.environ.get("S3_ENDPOINT_URL"),
-            aws_access_key_id=os.environ.get("S3_ACCESS_KEY"),
-            aws_secret_access_key=os.environ.get("S3_SECRET_KEY"),
+    Args:
+        meeting_id: UUID of the meeting
+        template_ids: Templates to run (default: organization defaults)
+    """
+    from ai_engine.analysis import TemplateSpec
+    from app.models.extra import AITemplate
+    from app.models.analysis import TemplateOutput
+    
+    # Read templates and transcript, run the LLM calls without a session,
+    # then replace the outputs
+    try:
+        with session_scope() as db:
+            meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
+            
+            if not meeting:
+                return
+            
+            query = db.query(AITemplate).filter(
+                AITemplate.organization_id == meeting.organization_id
+            )
+            if template_ids:
+                query = query.filter(AITemplate.id.in_(template_ids))
+            else:
+                query = query.filter(AITemplate.is_default.is_(True))
+            templates = query.order_by(AITemplate.name).all()
+            template_keys = [t.id for t in templates]
+            specs = [
+                TemplateSpec(
+                    id=str(t.id),
+                    updated_at=t.updated_at,
+                    name=t.name,
+                    prompt_template=t.prompt_template,
+                    output_format=t.output_format,
+                )
+                for t in templates
+            ]
+            
+            if not specs:
+                return {"status": "skipped", "reason": "no templates"}
+            
+            transcript_data = load_transcripts_bulk(db, [meeting.id]).get(str(meeting.id), [])
+            if not transcript_data:
+                return {"status": "skipped", "reason": "no transcript"}
+            
+            meeting_key, meeting_title = meeting.id, meeting.title
+            participants = [p.name or p.email for p in meeting.participants if p.name or p.email]
+        
+        engine = get_template_engine()
+        context = engine.prepare_context(
+            transcript_data,
+            meeting_title=meeting_title,
+            participants=participants or None,
         )
+        results = engine.run(specs, context)
         
-        # Parse bucket and key
-        # Format: s3://bucket/key or http://minio:9000/bucket/key
-        if "s3://" in url:
-            parts = url.replace("s3://", "").split("/")
-            bucket = parts[0]
-            key = "/".join(parts[1:])
-        else:
-            parts = urlparse(url).path.strip("/").split("/")
-            bucket = parts[0]
-            key = "/".join(parts[1:])
+        with session_scope() as db:
+            db.query(TemplateOutput).filter(
+                TemplateOutput.meeting_id == meeting_key,
+                TemplateOutput.template_id.in_(template_keys),
+            ).delete(synchronize_session=False)
+            
+            for template_key, result in zip(template_keys, results):
+                db.add(TemplateOutput(
+                    meeting_id=meeting_key,
+                    template_id=template_key,
+                    template_name=result.name,
+                    content=result.raw,
+                    output=result.output if isinstance(result.output, dict) else None,
+                    error=result.error,
+                    model=engine.analyzer.model,
+                ))
+        
+        return {
+            "status": "completed",
+            "templates": len(results),
+            "failed": sum(1 for r in results if r.error),
+        }
         
-        # Download to temp file
-        temp_file = tempfile.NamedTemporaryFile(suffix=".mp3", delete=False)
-        s3_client.download_file(bucket, key, temp_file.name)
-        temp_file.close()
+    except Exception as e:
+        raise self.retry(exc=e, countdown=60)
+
+
+@celery_app.task(bind=True, max_retries=2)
+def index_meeting_chunks(self, meeting_id: str):
+    """
+    Chunk and embed a meeting transcript for retrieval (Q&A)
+    
+    Embedding runs between two short sessions (read, replace chunks).
+    
+    Args:
+        meeting_id: UUID of the meeting
+    """
+    try:
+        with session_scope() as db:
+            meeting = db.query(Meeting.id, Meeting.organization_id).filter(
+                Meeting.id == meeting_id
+            ).first()
+            
+            if not meeting:
+                return
+            
+            transcript_data = load_transcripts_bulk(db, [meeting.id]).get(str(meeting.id), [])
+        
+        rows = embed_meeting_chunks(meeting.id, meeting.organization_id, transcript_data)
+        
+        with session_scope() as db:
+            replace_meeting_chunks(db, meeting.id, rows)
+        
+        return {"status": "completed", "chunks": len(rows)}
+        
+    except Exception as e:
+        raise self.retry(exc=e, countdown=60)
+
+
+@celery_app.task(bind=True, max_retries=2)
+def index_meeting_search(self, meeting_id: str):
+    """
+    Add a meeting's profile, summary and transcript chunks to its
+    organization's vector index (previous rows of the meeting are replaced)
+    
+    Args:
+        meeting_id: UUID of the meeting
+    """
+    from ai_engine.analysis import KIND_SUMMARY, KIND_CHUNK, KIND_PROFILE
+    from app.models.analysis import TranscriptChunk
+    
+    # Read texts in a short session; embedding, index writes and IVF
+    # training run without one
+    try:
+        with session_scope() as db:
+            meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
+            
+            if not meeting or meeting.organization_id is None:
+                return
+            
+            organization_id = meeting.organization_id
+            texts, kinds, indices = [meeting_profile_text(meeting)], [KIND_PROFILE], [-1]
+            if meeting.summary:
+                texts.append(f"{meeting.title}\n{meeting.summary}")
+                kinds.append(KIND_SUMMARY)
+                indices.append(-1)
+            
+            chunks = [
+                (row.chunk_index, row.text)
+                for row in db.query(TranscriptChunk.chunk_index, TranscriptChunk.text)
+                .filter(TranscriptChunk.meeting_id == meeting.id)
+                .order_by(TranscriptChunk.chunk_index)
+            ]
+            if not chunks:
+                transcript_data = load_transcripts_bulk(db, [meeting.id]).get(str(meeting.id), [])
+        
+        if not chunks:
+            rows = embed_meeting_chunks(meeting_id, organization_id, transcript_data)
+            with session_scope() as db:
+                replace_meeting_chunks(db, meeting_id, rows)
+            chunks = [(row.chunk_index, row.text) for row in rows]
+        
+        for chunk_index, text in chunks:
+            texts.append(text)
+            kinds.append(KIND_CHUNK)
+            indices.append(chunk_index)
+        
+        index = get_vector_index(organization_id)
+        index.remove(meeting_id)
+        index.append(meeting_id, get_search_embedder().embed(texts), kinds, indices)
+        
+        # Switch from brute force to IVF search once the index is large
+        if not index.trained and len(index) >= int(os.environ.get("VECTOR_INDEX_TRAIN_ROWS", "50000")):
+            index.train()
+        
+        return {"status": "completed", "vectors": len(texts)}
+        
+    except Exception as e:
+        raise self.retry(exc=e, countdown=60)
+
+
+def create_analyzer():
+    """
+    MeetingAnalyzer configured from the environment
+    
+    With LLM_FALLBACK_PROVIDER set, requests are hedged to and fail over
+    to the fallback provider. All analyzers of a worker share one hedger,
+    so circuit breakers and latency percentiles see every call.
+    """
+    from ai_engine.analysis import MeetingAnalyzer
+    
+    options = dict(
+        structured_output=os.environ.get("LLM_STRUCTURED_OUTPUT", "false").lower() == "true",
+        prompt_caching=os.environ.get("LLM_PROMPT_CACHING", "true").lower() == "true",
+    )
+    
+    fallback = None
+    if os.environ.get("LLM_FALLBACK_PROVIDER"):
+        fallback = MeetingAnalyzer(
+            llm_provider=os.environ["LLM_FALLBACK_PROVIDER"],
+            api_key=os.environ.get("LLM_FALLBACK_API_KEY") or None,
+            model=os.environ.get("LLM_FALLBACK_MODEL", "gpt-4o-mini"),
+            base_url=os.environ.get("LLM_FALLBACK_BASE_URL") or None,
+            **options,
+        )
+    
+    # Primary last: its key is the one exported for SDK clients built elsewhere
+    return MeetingAnalyzer(
+        llm_provider=os.environ.get("LLM_PROVIDER", "openai"),
+        api_key=os.environ.get("LLM_API_KEY"),
+        model=os.environ.get("LLM_MODEL", "gpt-4o-mini"),
+        base_url=os.environ.get("LLM_BASE_URL") or None,
+        fallback=fallback,
+        hedger=get_llm_hedger(),
+        **options,
+    )
+
+
+def create_batch_backend(analyzer, provider=None):
+    """Batch backend for ``provider``; the local one keeps its state in LOCAL_BATCH_DIR"""
+    from ai_engine.analysis.batch import get_batch_backend
+    
+    provider = provider or analyzer.llm_provider
+    options = {}
+    if provider == "local":
+        options["state_dir"] = os.environ.get("LOCAL_BATCH_DIR") or None
+    
+    return get_batch_backend(analyzer, provider, **options)
+
+
+_llm_hedger = None
+_llm_hedger_lock = threading.Lock()
+
+
+def get_llm_hedger():
+    """Per-worker HedgedCaller (circuit breakers, latency stats, Prometheus metrics)"""
+    global _llm_hedger
+    
+    # Built once even when pool threads ask at the same time
+    if _llm_hedger is None:
+        with _llm_hedger_lock:
+            if _llm_hedger is None:
+                from ai_engine.analysis import HedgedCaller
+                from app.metrics import observe_llm
+                
+                _llm_hedger = HedgedCaller(
+                    quantile=float(os.environ.get("LLM_HEDGE_QUANTILE", "95")),
+                    min_delay=float(os.environ.get("LLM_HEDGE_MIN_DELAY_SECONDS", "2")),
+                    max_delay=float(os.environ.get("LLM_HEDGE_MAX_DELAY_SECONDS", "60")),
+                    failure_threshold=int(os.environ.get("LLM_BREAKER_FAILURES", "5")),
+                    reset_seconds=float(os.environ.get("LLM_BREAKER_RESET_SECONDS", "60")),
+                    observer=observe_llm,
+                )
+    
+    return _llm_hedger
+
+
+_template_engine = None
+_template_engine_lock = threading.Lock()
+
+
+def get_template_engine():
+    """Per-worker TemplateEngine (keeps compiled templates between tasks)"""
+    global _template_engine
+    
+    if _template_engine is None:
+        with _template_engine_lock:
+            if _template_engine is None:
+                from ai_engine.analysis import TemplateEngine
+                
+                _template_engine = TemplateEngine(
+                    create_analyzer(),
+                    max_workers=int(os.environ.get("TEMPLATE_MAX_WORKERS", "4")),
+                )
+    
+    return _template_engine
+
+
+_vector_indexes = OrderedDict()
+_vector_indexes_lock = threading.Lock()
+
+
+def get_search_embedder():
+    """Embedder used for the semantic search index"""
+    from ai_engine.analysis import HashingEmbedder
+    
+    return HashingEmbedder(dim=int(os.environ.get("SEARCH_EMBEDDING_DIM", "384")))
+
+
+def get_vector_index(organization_id):
+    """
+    Per-process VectorIndex for an organization (kept mapped between calls)
+    
+    The least recently used indexes are dropped beyond
+    VECTOR_INDEX_CACHE_SIZE organizations. The directory is only created
+    when something is written to the index.
+    """
+    import uuid
+    from ai_engine.analysis import VectorIndex
+    
+    key = str(uuid.UUID(str(organization_id)))
+    with _vector_indexes_lock:
+        if key in _vector_indexes:
+            _vector_indexes.move_to_end(key)
+        else:
+            _vector_indexes[key] = VectorIndex(
+                os.path.join(os.environ.get("VECTOR_INDEX_DIR", "/data/vector_index"), key),
+                dim=get_search_embedder().dim,
+                max_deleted_ratio=float(os.environ.get("VECTOR_INDEX_MAX_DELETED_RATIO", "0.25")),
+            )
+            while len(_vector_indexes) > int(os.environ.get("VECTOR_INDEX_CACHE_SIZE", "64")):
+                _vector_indexes.popitem(last=False)
         
-        return temp_file.name
+        return _vector_indexes[key]
+
+
+def transcription_scheduler():
+    """Shared fair-share transcription scheduler (state kept in Redis)"""
+    from redis import Redis
+    from app.scheduler import locked_scheduler
     
-    # Regular URL download
-    import httpx
+    redis_client = Redis.from_url(
+        os.environ.get("REDIS_URL", "redis://redis:6379/0"), socket_timeout=1
+    )
+    return locked_scheduler(
+        redis_client,
+        slots=int(os.environ.get("TRANSCRIBE_SLOTS", "2")),
+        short_seconds=int(os.environ.get("SHORT_MEETING_SECONDS", "900")),
+        adaptive_models=os.environ.get("WHISPER_MODEL_POLICY", "adaptive") == "adaptive",
+    )
+
+
+def save_transcript_segments(db, meeting_id: str, segments) -> int:
+    """
+    Write transcription segments with the bulk writer
+    
+    id, created_at and is_key_moment come from column defaults.
     
-    temp_file = tempfile.NamedTemporaryFile(suffix=".mp4", delete=False)
+    Returns:
+        Number of rows written (not committed)
+    """
+    from app.db.bulk import bulk_insert
     
-    with httpx.stream("GET", url, follow_redirects=True) as response:
-        response.raise_for_status()
-        for chunk in response.iter_bytes():
-            temp_file.write(chunk)
+    return bulk_insert(
+        db,
+        Transcript.__table__,
+        (
+            {
+                "meeting_id": meeting_id,
+                "speaker_name": segment.speaker or "Unknown",
+                "text": segment.text,
+                "start_time": segment.start,
+                "end_time": segment.end,
+                "confidence": segment.confidence,
+            }
+            for segment in segments
+        ),
+        batch_size=int(os.environ.get("TRANSCRIPT_WRITE_BATCH_SIZE", "5000")),
+    )
+
+
+def save_pipeline_timing(db, meeting_id: str, timer) -> None:
+    """Store a run's per-stage timing breakdown (not committed)"""
+    from app.models.analysis import PipelineTiming
     
-    temp_file.close()
-    return temp_file.name
+    db.add(PipelineTiming(
+        meeting_id=meeting_id,
+        task=timer.task,
+        total_seconds=round(timer.total_seconds, 3),
+        stages=timer.breakdown(),
+    ))
+
+
+def lock_meeting(db, meeting_id: str) -> None:
+    """Row-lock the meeting until commit; serializes writers of its derived rows"""
+    db.query(Meeting.id).filter(Meeting.id == meeting_id).with_for_update().first()
 
 
-def update_transcription_progress(meeting_id: str, data: dict, db):
+def replace_transcript_segments(db, meeting_id: str, segments) -> int:
+    """
+    Replace a meeting's transcript segments in the session's transaction
+    
+    The meeting row is locked first, so concurrent runs apply one after
+    the other and never leave two copies. Comments and action items
+    pointing at old segments are moved to the new segment at the same
+    time instead of being deleted (comments cascade) or blocking the
+    delete (action items).
+    
+    Returns:
+        Number of segments written (not committed)
+    """
+    from ai_engine.analysis import SegmentIndex
+    from app.models.extra import Comment
+    
+    lock_meeting(db, meeting_id)
+    
+    # Where references to the old segments pointed, by start time
+    references = {}
+    for model in (Comment, ActionItem):
+        rows = (
+            db.query(model.id, Transcript.start_time)
+            .join(Transcript, Transcript.id == model.transcript_id)
+            .filter(Transcript.meeting_id == meeting_id)
+            .all()
+        )
+        if rows:
+            references[model] = rows
+            db.query(model).filter(model.id.in_([row.id for row in rows])).update(
+                {"transcript_id": None}, synchronize_session=False
+            )
+    
+    db.query(Transcript).filter(Transcript.meeting_id == meeting_id).delete(synchronize_session=False)
+    written = save_transcript_segments(db, meeting_id, segments)
+    
+    if references:
+        new_segments = (
+            db.query(Transcript.id, Transcript.start_time, Transcript.end_time)
+            .filter(Transcript.meeting_id == meeting_id)
+            .order_by(Transcript.start_time)
+            .all()
+        )
+        index = SegmentIndex(
+            [row.start_time for row in new_segments], [row.end_time for row in new_segments]
+        )
+        for model, rows in references.items():
+            relinked = []
+            for row in rows:
+                i = index.locate(float(row.start_time))
+                if i is not None:
+                    relinked.append({"id": row.id, "transcript_id": new_segments[i].id})
+            if relinked:
+                db.execute(update(model), relinked)
+    
+    return written
+
+
+def build_meeting_chunks(db, meeting) -> list:
+    """
+    Replace a meeting's transcript chunks with freshly embedded ones
+    
+    Returns:
+        List of TranscriptChunk rows (added to the session, not committed)
+    """
+    transcript_data = load_transcripts_bulk(db, [meeting.id]).get(str(meeting.id), [])
+    return replace_meeting_chunks(
+        db, meeting.id, embed_meeting_chunks(meeting.id, meeting.organization_id, transcript_data)
+    )
+
+
+def embed_meeting_chunks(meeting_id, organization_id, transcript_data: list) -> list:
+    """
+    Chunk and embed a transcript (no database access)
+    
+    Returns:
+        TranscriptChunk rows, not yet added to a session
+    """
+    from ai_engine.analysis import HashingEmbedder, chunk_transcript
+    from app.models.analysis import TranscriptChunk
+    
+    chunks = chunk_transcript(transcript_data, meeting_id=str(meeting_id))
+    
+    embedder = HashingEmbedder()
+    embeddings = embedder.embed([c.text for c in chunks]).astype("float16")
+    
+    return [
+        TranscriptChunk(
+            meeting_id=meeting_id,
+            organization_id=organization_id,
+            chunk_index=i,
+            text=chunk.text,
+            start_time=chunk.start,
+            end_time=chunk.end,
+            embedding=embeddings[i].tobytes(),
+            embedding_model=embedder.name,
+        )
+        for i, chunk in enumerate(chunks)
+    ]
+
+
+def replace_meeting_chunks(db, meeting_id, rows: list) -> list:
+    """Swap a meeting's stored chunks for ``rows`` (not committed)"""
+    from app.models.analysis import TranscriptChunk
+    
+    # Concurrent rebuilds apply one after the other, never both sets
+    lock_meeting(db, meeting_id)
+    db.query(TranscriptChunk).filter(
+        TranscriptChunk.meeting_id == meeting_id
+    ).delete(synchronize_session=False)
+    db.add_all(rows)
+    
+    return rows
+
+
+def load_chunk_index(db, meeting_ids: list) -> tuple:
+    """
+    Load stored chunks of some meetings and their embeddings as one matrix
+    
+    For single-meeting questions; organization-wide retrieval goes
+    through search_organization_chunks.
+    
+    Returns:
+        (list of TextChunk, float32 embedding matrix with aligned rows)
+    """
+    import numpy as np
+    from ai_engine.analysis import HashingEmbedder
+    from ai_engine.analysis.retrieval import TextChunk
+    from app.models.analysis import TranscriptChunk
+    
+    query = db.query(
+        TranscriptChunk.meeting_id,
+        TranscriptChunk.text,
+        TranscriptChunk.start_time,
+        TranscriptChunk.end_time,
+        TranscriptChunk.embedding,
+    ).filter(
+        TranscriptChunk.embedding_model == HashingEmbedder.name,
+        TranscriptChunk.meeting_id.in_(meeting_ids),
+    )
+    
+    rows = query.order_by(TranscriptChunk.meeting_id, TranscriptChunk.chunk_index).all()
+    
+    chunks = [
+        TextChunk(row.text, float(row.start_time), float(row.end_time), str(row.meeting_id))
+        for row in rows
+    ]
+    if not rows:
+        return chunks, np.zeros((0, HashingEmbedder().dim), dtype=np.float32)
+    
+    embeddings = np.frombuffer(
+        b"".join(row.embedding for row in rows), dtype=np.float16
+    ).reshape(len(rows), -1).astype(np.float32)
+    
+    return chunks, embeddings
+
+
+def search_organization_chunks(db, organization_id, question: str, k: int) -> list:
+    """
+    Top-k transcript chunks of an organization for a question
+    
+    Ranked in the organization's vector index (mapped once per process,
+    IVF lists once trained); only the text of the hits is read from
+    Postgres, so a question costs the same however much meeting history
+    the organization has. Meetings are searchable once
+    index_meeting_search has run for them.
+    
+    Returns:
+        (TextChunk, score) pairs in descending score order
+    """
+    import uuid
+    from sqlalchemy import tuple_
+    from ai_engine.analysis import KIND_CHUNK
+    from ai_engine.analysis.retrieval import TextChunk
+    from app.models.analysis import TranscriptChunk
+    
+    hits = get_vector_index(organization_id).search(
+        get_search_embedder().embed([question])[0], k=k, kind=KIND_CHUNK
+    )
+    if not hits:
+        return []
+    
+    rows = db.query(
+        TranscriptChunk.meeting_id,
+        TranscriptChunk.chunk_index,
+        TranscriptChunk.text,
+        TranscriptChunk.start_time,
+        TranscriptChunk.end_time,
+    ).filter(
+        TranscriptChunk.organization_id == organization_id,
+        tuple_(TranscriptChunk.meeting_id, TranscriptChunk.chunk_index).in_(
+            [(uuid.UUID(hit.meeting_id), hit.chunk_index) for hit in hits]
+        ),
+    ).all()
+    chunks = {
+        (str(row.meeting_id), row.chunk_index): TextChunk(
+            row.text, float(row.start_time), float(row.end_time), str(row.meeting_id)
+        )
+        for row in rows
+    }
+    
+    # Hits of meetings deleted or re-chunked since indexing have no row
+    return [
+        (chunks[(hit.meeting_id, hit.chunk_index)], hit.score)
+        for hit in hits
+        if (hit.meeting_id, hit.chunk_index) in chunks
+    ]
+
+
+def load_stored_analyses(db, meetings: list) -> list:
+    """
+    Rebuild AnalysisResults from stored meeting analysis
+    
+    Uses the persisted summary, topics, sentiment and pending AI action
+    items (one query for all meetings) instead of re-running the LLM.
+    """
+    from ai_engine.analysis import AnalysisResult
+    
+    items = {}
+    for item in (
+        db.query(ActionItem)
+        .filter(
+            ActionItem.meeting_id.in_([m.id for m in meetings]),
+            ActionItem.status == ActionItemStatus.PENDING,
+        )
+        .order_by(ActionItem.created_at)
+        .all()
+    ):
+        items.setdefault(item.meeting_id, []).append({
+            "task": item.task,
+            "assignee": item.assignee_name,
+            "priority": item.priority,
+        })
+    
+    return [
+        AnalysisResult(
+            summary=m.summary or "",
+            key_topics=m.key_topics or [],
+            action_items=items.get(m.id, []),
+            sentiment_score=float(m.sentiment_score) if m.sentiment_score is not None else 0.5,
+            sentiment_label="neutral",
+            talk_time_distribution={},
+            key_moments=[],
+            follow_up_questions=[],
+            decisions_made=[],
+            risks_identified=[],
+            knowledge_graph_updates={},
+        )
+        for m in meetings
+    ]
+
+
+def load_transcripts_bulk(db, meeting_ids: list, with_ids: bool = False) -> dict:
+    """
+    Load analyzer-formatted transcripts for many meetings in one query
+    
+    With ``with_ids`` each segment also carries its transcript row "id".
+    """
+    transcripts = {}
+    if not meeting_ids:
+        return transcripts
+    
+    rows = (
+        db.query(
+            Transcript.id,
+            Transcript.meeting_id,
+            Transcript.speaker_name,
+            Transcript.text,
+            Transcript.start_time,
+            Transcript.end_time,
+        )
+        .filter(Transcript.meeting_id.in_(meeting_ids))
+        .order_by(Transcript.meeting_id, Transcript.start_time)
+        .all()
+    )
+    
+    for row in rows:
+        segment = {
+            "speaker": row.speaker_name,
+            "text": row.text,
+            "start": float(row.start_time),
+            "end": float(row.end_time),
+        }
+        if with_ids:
+            segment["id"] = row.id
+        transcripts.setdefault(str(row.meeting_id), []).append(segment)
+    
+    return transcripts
+
+
+def enqueue_analysis_followups(meeting_id: str, result) -> None:
+    """Tasks that build on a stored analysis (online and batch runs alike)"""
+    # Update knowledge graph
+    if os.environ.get("ENABLE_KNOWLEDGE_GRAPH", "true").lower() == "true":
+        update_knowledge_graph.delay(meeting_id, result.knowledge_graph_updates)
+    
+    # Organization default AI templates
+    run_meeting_templates.delay(meeting_id)
+    
+    # Semantic search index (summary + transcript chunks)
+    index_meeting_search.delay(meeting_id)
+
+
+def save_analysis_results(db, results: dict, transcripts: dict) -> None:
+    """
+    Write analysis results for many meetings (batch jobs)
+    
+    Same write as an interactive run (see save_analysis_result), so a
+    batch re-analysis keeps action items users already work on.
+    
+    Args:
+        db: Database session (caller commits)
+        results: Dict of meeting_id -> AnalysisResult
+        transcripts: Dict of meeting_id -> segments the results were
+            parsed against, as from load_transcripts_bulk(..., with_ids=True)
+    """
+    for meeting_id, result in results.items():
+        transcript_data = transcripts.get(meeting_id, [])
+        save_analysis_result(
+            db, meeting_id, result, transcript_data, [seg["id"] for seg in transcript_data]
+        )
+
+
+def save_analysis_result(db, meeting_id: str, result, transcript_data: list, segment_ids: list) -> None:
+    """
+    Write one meeting's analysis in the session's transaction
+    
+    The meeting row is locked first, so concurrent writers apply one
+    after the other. Key moments and action items are linked to the
+    transcript segment at their timestamp (segments replaced by a
+    re-transcription meanwhile stay unlinked). AI action items nobody
+    has picked up yet are replaced; ones already in progress or done are
+    kept and not created again.
+    
+    Args:
+        db: Database session (caller commits)
+        meeting_id: UUID of the meeting
+        result: AnalysisResult
+        transcript_data: Analyzed segments ("start"/"end" in seconds)
+        segment_ids: Transcript row id of each analyzed segment
+    """
+    from ai_engine.analysis import SegmentIndex, link_to_segments
+    
+    # Serialize writers of this meeting's derived rows
+    lock_meeting(db, meeting_id)
+    
+    db.query(Meeting).filter(Meeting.id == meeting_id).update({
+        "summary": result.summary,
+        "key_topics": result.key_topics,
+        "sentiment_score": result.sentiment_score,
+        "analysis_status": "completed",
+    }, synchronize_session=False)
+    
+    index = SegmentIndex.from_segments(transcript_data)
+    current_ids = {
+        row.id for row in db.query(Transcript.id).filter(Transcript.meeting_id == meeting_id)
+    }
+    segment_ids = [sid if sid in current_ids else None for sid in segment_ids]
+    
+    # Mark key moments in transcripts (one UPDATE for the meeting)
+    moment_ids = {
+        segment_ids[i]
+        for i in link_to_segments(result.key_moments, index)
+        if i is not None and segment_ids[i] is not None
+    }
+    db.query(Transcript).filter(Transcript.meeting_id == meeting_id).update(
+        {"is_key_moment": Transcript.id.in_(moment_ids)},
+        synchronize_session=False,
+    )
+    
+    db.query(ActionItem).filter(
+        ActionItem.meeting_id == meeting_id,
+        ActionItem.source == "ai",
+        ActionItem.status == ActionItemStatus.PENDING,
+    ).delete(synchronize_session=False)
+    kept_tasks = {
+        row.task.strip().lower()
+        for row in db.query(ActionItem.task).filter(
+            ActionItem.meeting_id == meeting_id, ActionItem.source == "ai"
+        )
+    }
+    
+    # Create action items (one executemany INSERT)
+    action_items = [
+        {
+            "meeting_id": meeting_id,
+            "task": item.get("task", ""),
+            "assignee_name": item.get("assignee"),
+            "priority": item.get("priority", "medium"),
+            "status": ActionItemStatus.PENDING,
+            "source": "ai",
+            "transcript_id": segment_ids[i] if i is not None else None,
+        }
+        for item, i in zip(result.action_items, link_to_segments(result.action_items, index))
+        if item.get("task", "").strip().lower() not in kept_tasks
+    ]
+    if action_items:
+        db.execute(insert(ActionItem), action_items)
+
+
+def apply_local_analysis(meeting, transcript_data: list) -> None:
+    """
+    Populate key topics and sentiment with the local (no-LLM) analyzer
+    
+    Takes milliseconds; the LLM analysis overwrites these fields later.
+    Failures are logged and never block transcription.
+    """
+    from ai_engine.analysis import LocalAnalyzer
+    
+    try:
+        result = LocalAnalyzer().analyze(transcript_data)
+    except Exception as e:
+        print(f"Local analysis error: {e}")
+        return
+    
+    meeting.key_topics = result.key_topics
+    meeting.sentiment_score = result.sentiment_score
+
+
+def save_participant_dynamics(db, meeting_id: str, transcript_data: list) -> None:
+    """
+    Persist conversation dynamics to meeting_participants in bulk
+    
+    Existing participants are matched by name and updated; speakers not
+    yet registered are inserted. One SELECT plus one bulk UPDATE and one
+    bulk INSERT regardless of speaker count.
+    """
+    from ai_engine.analysis import compute_dynamics
+    from app.models.meeting import MeetingParticipant
+    
+    dynamics = compute_dynamics(transcript_data)
+    if not dynamics:
+        return
+    
+    existing = {
+        p.name: p.id
+        for p in db.query(MeetingParticipant.id, MeetingParticipant.name)
+        .filter(MeetingParticipant.meeting_id == meeting_id)
+        .all()
+    }
+    
+    updates, inserts = [], []
+    for speaker, d in dynamics.items():
+        row = {
+            "talk_time_seconds": int(round(d.talk_time_seconds)),
+            "is_speaker": d.talk_time_seconds > 0,
+            "turn_count": d.turn_count,
+            "interruption_count": d.interruption_count,
+            "overlap_seconds": int(round(d.overlap_seconds)),
+            "longest_monologue_seconds": int(round(d.longest_monologue_seconds)),
+            "avg_response_latency": d.avg_response_latency,
+        }
+        if speaker in existing:
+            updates.append({"id": existing[speaker], **row})
+        else:
+            inserts.append({"meeting_id": meeting_id, "name": speaker, **row})
+    
+    if updates:
+        db.bulk_update_mappings(MeetingParticipant, updates)
+    if inserts:
+        db.bulk_insert_mappings(MeetingParticipant, inserts)
+
+
+def set_meeting_status(meeting_id: str, **statuses) -> None:
+    """
+    Set status columns of a meeting in a session of its own
+    
+    Used on task failure paths; errors are logged so they never hide the
+    original exception.
+    """
+    try:
+        with session_scope() as db:
+            db.query(Meeting).filter(Meeting.id == meeting_id).update(
+                statuses, synchronize_session=False
+            )
+    except Exception as e:
+        print(f"Status update error: {e}")
+
+
+def update_transcription_progress(meeting_id: str, data: dict):
     """Update transcription progress (for WebSocket updates)"""
     # This would send progress via WebSocket in production
     pass
 
 
+def analysis_field_publisher(meeting_id: str):
+    """
+    Build a callback publishing streamed analysis fields to Redis
+    
+    Messages go to channel ``meeting:<id>:analysis`` as JSON
+    ``{"field": ..., "value": ...}`` so the API/WebSocket layer can show
+    the summary before the rest of the analysis is finished.
+    """
+    import json
+    from redis import Redis
+    
+    redis_client = Redis.from_url(
+        os.environ.get("REDIS_URL", "redis://redis:6379/0"),
+        socket_timeout=1,
+    )
+    channel = f"meeting:{meeting_id}:analysis"
+    
+    def publish(field_name: str, value):
+        try:
+            redis_client.publish(
+                channel,
+                json.dumps({"field": field_name, "value": value}, default=str),
+            )
+        except Exception as e:
+            print(f"Analysis stream publish error: {e}")
+    
+    return publish
+
+
+def meeting_profile_text(meeting) -> str:
+    """Title, participants and topics - what makes meetings related"""
+    participants = [p.name or p.email for p in meeting.participants if p.name or p.email]
+    return "\n".join([
+        meeting.title or "",
+        ", ".join(participants),
+        ", ".join(meeting.key_topics or []),
+    ])
+
+
 def get_previous_meeting_summaries(db, meeting) -> list:
-    """Get summaries of previous meetings for context"""
-    previous = (
-        db.query(Meeting)
-        .filter(
-            Meeting.organization_id == meeting.organization_id,
-            Meeting.id != meeting.id,
-            Meeting.status == MeetingStatus.COMPLETED,
-        )
-        .order_by(Meeting.created_at.desc())
-        .limit(3)
-        .all()
+    """
+    Get summaries of the most relevant earlier meetings for context
+    
+    Earlier meetings of the organization are ranked by similarity of
+    their profile (title, participants, topics) in the organization's
+    vector index and selected within PREVIOUS_CONTEXT_TOKENS. Falls back
+    to the most recent meetings when the index has no match. The
+    selection is cached in Redis per meeting, so retries and
+    re-analysis reuse it.
+    """
+    import json
+    from redis import Redis
+    from ai_engine.analysis import KIND_PROFILE, select_context
+    
+    token_budget = int(os.environ.get("PREVIOUS_CONTEXT_TOKENS", "1500"))
+    max_meetings = int(os.environ.get("PREVIOUS_CONTEXT_MAX_MEETINGS", "3"))
+    cache_key = f"meeting:{meeting.id}:context"
+    
+    earlier = db.query(Meeting.id, Meeting.summary, Meeting.created_at).filter(
+        Meeting.organization_id == meeting.organization_id,
+        Meeting.id != meeting.id,
+        Meeting.status == MeetingStatus.COMPLETED,
+        Meeting.summary.isnot(None),
     )
+    if meeting.created_at is not None:
+        earlier = earlier.filter(Meeting.created_at < meeting.created_at)
+    
+    redis_client = None
+    try:
+        redis_client = Redis.from_url(
+            os.environ.get("REDIS_URL", "redis://redis:6379/0"),
+            socket_timeout=1,
+        )
+        cached = redis_client.get(cache_key)
+    except Exception as e:
+        print(f"Context cache error: {e}")
+        cached = None
+    
+    if cached is not None:
+        selected_ids = json.loads(cached)
+        rows = earlier.filter(Meeting.id.in_(selected_ids)).order_by(Meeting.created_at).all()
+        return [row.summary for row in rows]
+    
+    rows = []
+    if meeting.organization_id is not None:
+        try:
+            index = get_vector_index(meeting.organization_id)
+            hits = index.search(
+                get_search_embedder().embed([meeting_profile_text(meeting)])[0],
+                k=max_meetings * 5,
+                kind=KIND_PROFILE,
+            )
+        except Exception as e:
+            print(f"Context index error: {e}")
+            hits = []
+        
+        scores = {hit.meeting_id: hit.score for hit in hits}
+        if scores:
+            rows = earlier.filter(Meeting.id.in_(list(scores))).all()
+    
+    if rows:
+        candidates = [(str(row.id), scores[str(row.id)], row.summary) for row in rows]
+    else:
+        # No indexed match - most recent meetings, newest first
+        rows = earlier.order_by(Meeting.created_at.desc()).limit(max_meetings).all()
+        candidates = [(str(row.id), 1.0 - i * 0.01, row.summary) for i, row in enumerate(rows)]
+    
+    selected_ids = select_context(candidates, token_budget, max_items=max_meetings)
+    
+    if redis_client is not None:
+        try:
+            redis_client.set(cache_key, json.dumps(selected_ids), ex=7 * 24 * 3600)
+        except Exception as e:
+            print(f"Context cache error: {e}")
     
-    return [m.summary for m in previous if m.summary]
+    selected = set(selected_ids)
+    return [
+        row.summary
+        for row in sorted(rows, key=lambda r: r.created_at)
+        if str(row.id) in selected
+    ]
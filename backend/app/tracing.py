@@ -0,0 +1,135 @@
+"""
+Distributed tracing - OpenTelemetry setup for the API and Celery workers
+"""
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from opentelemetry import context, propagate, trace
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter, SpanExporter
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+from .core.config import settings
+
+
+EXPORTERS = ("none", "otlp", "file", "console")
+
+_provider: Optional[TracerProvider] = None
+
+
+def create_exporter(
+    kind: str,
+    otlp_endpoint: Optional[str] = None,
+    file_path: Optional[str] = None
+) -> Optional[SpanExporter]:
+    """
+    Span exporter for TRACING_EXPORTER
+
+    ``otlp`` posts to a collector (Jaeger, Tempo, otel-collector) over
+    OTLP/HTTP, ``file`` appends one JSON span per line - enough to follow
+    a meeting through the pipeline locally without a collector.
+    """
+    if kind == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        return OTLPSpanExporter(endpoint=otlp_endpoint)
+    if kind == "file":
+        return ConsoleSpanExporter(
+            out=open(file_path, "a", buffering=1),
+            formatter=lambda span: span.to_json(indent=None) + "\n",
+        )
+    if kind == "console":
+        return ConsoleSpanExporter()
+    if kind != "none":
+        raise ValueError(f"Unsupported tracing exporter: {kind} (one of {', '.join(EXPORTERS)})")
+    return None
+
+
+def setup_tracing(
+    service_name: str,
+    exporter: Optional[SpanExporter] = None,
+    app=None,
+    engine=None
+) -> bool:
+    """
+    Install the tracer provider and instrument Celery, SQLAlchemy, FastAPI
+
+    Celery instrumentation carries the trace context in task headers, so
+    an upload request, the tasks it enqueues and the tasks those enqueue
+    share one trace. Call once per process before the app or worker
+    starts; prefork children inherit the setup (the batch exporter
+    restarts its thread after fork).
+
+    Args:
+        service_name: service.name resource attribute
+        exporter: Span exporter (default: from TRACING_EXPORTER)
+        app: FastAPI application to instrument
+        engine: SQLAlchemy engine to instrument
+
+    Returns:
+        Whether tracing is on (False with TRACING_EXPORTER=none)
+    """
+    global _provider
+
+    if _provider is not None:
+        return True
+
+    exporter = exporter or create_exporter(
+        settings.TRACING_EXPORTER,
+        otlp_endpoint=settings.TRACING_OTLP_ENDPOINT,
+        file_path=settings.TRACING_FILE_PATH,
+    )
+    if exporter is None:
+        return False
+
+    from opentelemetry.instrumentation.celery import CeleryInstrumentor
+    from opentelemetry.instrumentation.sqlalchemy import SQLAlchemyInstrumentor
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": service_name}),
+        sampler=ParentBased(TraceIdRatioBased(settings.TRACING_SAMPLE_RATIO)),
+    )
+    provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+    _provider = provider
+
+    CeleryInstrumentor().instrument(tracer_provider=provider)
+    if engine is not None:
+        SQLAlchemyInstrumentor().instrument(engine=engine, tracer_provider=provider)
+    if app is not None:
+        from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+        FastAPIInstrumentor.instrument_app(app, tracer_provider=provider)
+
+    return True
+
+
+def flush_tracing(timeout_millis: int = 5000) -> None:
+    """Export buffered spans now (prefork children exit without atexit hooks)"""
+    if _provider is not None:
+        _provider.force_flush(timeout_millis)
+
+
+def current_context() -> Dict[str, str]:
+    """W3C trace headers of the active span (empty when tracing is off)"""
+    carrier: Dict[str, str] = {}
+    propagate.inject(carrier)
+    return carrier
+
+
+@contextmanager
+def attached_context(carrier: Optional[Dict[str, str]]):
+    """
+    Continue a trace captured with ``current_context()``
+
+    For work started outside the request that asked for it, e.g. a
+    transcription the fair-share scheduler dispatches minutes later.
+    """
+    if not carrier:
+        yield
+        return
+
+    token = context.attach(propagate.extract(carrier))
+    try:
+        yield
+    finally:
+        context.detach(token)
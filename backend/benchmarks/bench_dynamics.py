@@ -0,0 +1,65 @@
+"""
+Benchmark conversation dynamics on large transcripts
+
+Usage:
+    python benchmarks/bench_dynamics.py [n_segments]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "ai-engine"))
+
+from analysis.dynamics import compute_dynamics
+
+
+def make_transcript(n_segments: int, n_speakers: int = 8, seed: int = 0) -> list:
+    """Synthetic transcript with gaps, overlaps and monologues"""
+    rng = np.random.default_rng(seed)
+    durations = rng.uniform(0.5, 12.0, n_segments)
+    gaps = rng.normal(0.4, 0.8, n_segments)
+    starts = np.cumsum(np.maximum(durations + gaps, 0.1))
+    speakers = rng.integers(0, n_speakers, n_segments)
+
+    return [
+        {
+            "speaker": f"Speaker {speakers[i]}",
+            "text": "",
+            "start": float(starts[i]),
+            "end": float(starts[i] + durations[i]),
+        }
+        for i in range(n_segments)
+    ]
+
+
+def talk_time_loop(transcript: list) -> dict:
+    """Reference: previous dict-loop talk time calculation"""
+    speaker_times = {}
+    for segment in transcript:
+        speaker = segment.get("speaker", "Unknown")
+        duration = segment.get("end", 0) - segment.get("start", 0)
+        speaker_times[speaker] = speaker_times.get(speaker, 0) + duration
+    return speaker_times
+
+
+def bench(fn, transcript: list, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(transcript)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    transcript = make_transcript(n)
+
+    loop_time = bench(talk_time_loop, transcript)
+    dynamics_time = bench(compute_dynamics, transcript)
+
+    print(f"segments:                 {n}")
+    print(f"talk time (dict loop):    {loop_time * 1000:8.1f} ms")
+    print(f"full dynamics (numpy):    {dynamics_time * 1000:8.1f} ms")
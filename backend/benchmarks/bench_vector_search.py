@@ -0,0 +1,95 @@
+"""
+Benchmark semantic search latency on a memory-mapped float16 index
+
+Synthetic clustered vectors (topics with noise) are appended meeting by
+meeting, then searched brute force and with the trained IVF lists.
+
+Usage:
+    python benchmarks/bench_vector_search.py [n_chunks] [dim] [p95_target_ms]
+"""
+import os
+import sys
+import time
+import uuid
+import shutil
+import tempfile
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "ai-engine"))
+
+from analysis.vector_index import VectorIndex, KIND_CHUNK
+
+
+def unit(vectors: np.ndarray) -> np.ndarray:
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def build_index(path: str, n_chunks: int, dim: int, topics: np.ndarray,
+                per_meeting: int = 200, seed: int = 0) -> float:
+    """Append synthetic meetings of ``per_meeting`` chunks each"""
+    rng = np.random.default_rng(seed)
+    index = VectorIndex(path, dim)
+
+    started = time.perf_counter()
+    for start in range(0, n_chunks, per_meeting):
+        count = min(per_meeting, n_chunks - start)
+        centers = topics[rng.integers(0, len(topics), count)]
+        vectors = unit(centers + 0.03 * rng.standard_normal((count, dim), dtype=np.float32))
+        index.append(str(uuid.uuid4()), vectors, [KIND_CHUNK] * count, list(range(count)))
+    return time.perf_counter() - started
+
+
+def measure(index: VectorIndex, queries: np.ndarray, k: int = 20):
+    index.search(queries[0], k=k)  # warm page cache and mapping
+
+    latencies, results = [], []
+    for query in queries[1:]:
+        started = time.perf_counter()
+        hits = index.search(query, k=k)
+        latencies.append((time.perf_counter() - started) * 1000)
+        results.append({(h.meeting_id, h.chunk_index) for h in hits})
+    return np.percentile(latencies, [50, 95, 99]), results
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    dim = int(sys.argv[2]) if len(sys.argv) > 2 else 384
+    target_ms = float(sys.argv[3]) if len(sys.argv) > 3 else 100.0
+    n_queries = 50
+
+    rng = np.random.default_rng(1)
+    topics = unit(rng.standard_normal((2000, dim), dtype=np.float32))
+    queries = unit(
+        topics[rng.integers(0, len(topics), n_queries + 1)]
+        + 0.03 * rng.standard_normal((n_queries + 1, dim), dtype=np.float32)
+    )
+
+    path = tempfile.mkdtemp(prefix="vector-index-")
+    try:
+        build_time = build_index(path, n, dim, topics)
+        size_mb = os.path.getsize(os.path.join(path, "vectors.f16")) / 1e6
+
+        brute = VectorIndex(path, dim)
+        (b50, b95, _), exact = measure(brute, queries)
+
+        started = time.perf_counter()
+        nlist = VectorIndex(path, dim).train()
+        train_time = time.perf_counter() - started
+
+        ivf = VectorIndex(path, dim)
+        (p50, p95, p99), approx = measure(ivf, queries)
+        recall = np.mean([len(a & e) / max(len(e), 1) for a, e in zip(approx, exact)])
+
+        print(f"chunks:              {n}")
+        print(f"dim:                 {dim}")
+        print(f"index size:          {size_mb:8.1f} MB (float16)")
+        print(f"build (append):      {build_time:8.2f} s")
+        print(f"brute force p50/p95: {b50:8.1f} / {b95:.1f} ms")
+        print(f"train ({nlist} lists): {train_time:8.2f} s")
+        print(f"ivf p50:             {p50:8.1f} ms  (nprobe={ivf.nprobe})")
+        print(f"ivf p95:             {p95:8.1f} ms  (target {target_ms:.0f} ms: {'OK' if p95 <= target_ms else 'MISSED'})")
+        print(f"ivf p99:             {p99:8.1f} ms")
+        print(f"recall@20 vs brute:  {recall:8.3f}")
+    finally:
+        shutil.rmtree(path)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Re-analyze meetings in provider batches
+
+Selects completed meetings by organization and date range, splits them
+into batches and enqueues ``submit_analysis_batch`` for each, spacing
+submissions to throttle throughput.
+
+Examples:
+    python reanalyze_meetings.py --org <uuid> --since 2026-01-01
+    python reanalyze_meetings.py --since 2026-06-01 --batch-size 500 --interval 120
+    python reanalyze_meetings.py --org <uuid> --provider local --sync
+"""
+import argparse
+import time
+from datetime import datetime
+
+from app.db.session import SessionLocal
+from app.models.meeting import Meeting, MeetingStatus
+from app.tasks import submit_analysis_batch
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Batch re-analysis of meetings")
+    parser.add_argument("--org", action="append", dest="orgs", help="Organization UUID (repeatable)")
+    parser.add_argument("--since", type=datetime.fromisoformat, help="Created at or after (YYYY-MM-DD)")
+    parser.add_argument("--until", type=datetime.fromisoformat, help="Created before (YYYY-MM-DD)")
+    parser.add_argument("--limit", type=int, help="Maximum number of meetings")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Requests per provider batch")
+    parser.add_argument("--interval", type=int, default=60, help="Seconds between batch submissions")
+    parser.add_argument("--provider", help="openai, anthropic or local (default: LLM_PROVIDER)")
+    parser.add_argument("--sync", action="store_true", help="Submit in-process instead of via Celery")
+    parser.add_argument("--dry-run", action="store_true", help="Only print what would be submitted")
+    return parser.parse_args()
+
+
+def select_meeting_ids(args) -> list:
+    db = SessionLocal()
+    try:
+        query = db.query(Meeting.id).filter(
+            Meeting.status == MeetingStatus.COMPLETED,
+            Meeting.transcript_status == "completed",
+        )
+        if args.orgs:
+            query = query.filter(Meeting.organization_id.in_(args.orgs))
+        if args.since:
+            query = query.filter(Meeting.created_at >= args.since)
+        if args.until:
+            query = query.filter(Meeting.created_at < args.until)
+        query = query.order_by(Meeting.created_at)
+        if args.limit:
+            query = query.limit(args.limit)
+        return [str(row.id) for row in query.all()]
+    finally:
+        db.close()
+
+
+def main():
+    args = parse_args()
+    meeting_ids = select_meeting_ids(args)
+    batches = [
+        meeting_ids[i:i + args.batch_size]
+        for i in range(0, len(meeting_ids), args.batch_size)
+    ]
+
+    print(f"📋 {len(meeting_ids)} meetings → {len(batches)} batches")
+
+    if args.dry_run:
+        return
+
+    for i, batch in enumerate(batches):
+        if args.sync:
+            if i:
+                time.sleep(args.interval)
+            result = submit_analysis_batch.apply(args=(batch, args.provider)).get()
+            print(f"✅ Batch {i + 1}/{len(batches)}: {result}")
+        else:
+            submit_analysis_batch.apply_async(
+                args=(batch, args.provider),
+                countdown=i * args.interval,
+            )
+            print(f"⏳ Batch {i + 1}/{len(batches)} queued (starts in {i * args.interval}s)")
+
+
+if __name__ == "__main__":
+    main()
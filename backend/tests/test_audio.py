@@ -0,0 +1,50 @@
+"""
+Tests for streaming audio decoding (requires ffmpeg)
+"""
+import io
+import os
+import shutil
+import sys
+import wave
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "ai-engine"))
+
+from transcription import decode_audio_stream, SAMPLE_RATE
+
+
+pytestmark = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+
+
+def wav_bytes(seconds: float, rate: int = 8000) -> bytes:
+    t = np.arange(int(seconds * rate)) / rate
+    tone = (0.5 * np.sin(2 * np.pi * 440 * t) * 32767).astype(np.int16)
+    stereo = np.repeat(tone[:, None], 2, axis=1)
+
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(2)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(stereo.tobytes())
+    return buffer.getvalue()
+
+
+def test_decode_stream_resamples_to_whisper_format():
+    """Test chunked input decodes to 16 kHz mono float32"""
+    data = wav_bytes(2.0)
+    chunks = (data[i:i + 4096] for i in range(0, len(data), 4096))
+
+    audio = decode_audio_stream(chunks)
+
+    assert audio.dtype == np.float32
+    assert abs(len(audio) - 2 * SAMPLE_RATE) < SAMPLE_RATE // 100
+    assert 0.45 < np.abs(audio).max() < 0.55
+
+
+def test_decode_stream_reports_ffmpeg_errors():
+    """Test undecodable input raises with ffmpeg's message"""
+    with pytest.raises(RuntimeError, match="ffmpeg"):
+        decode_audio_stream([b"not audio at all" * 100])
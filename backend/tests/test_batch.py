@@ -0,0 +1,161 @@
+"""
+Tests for batch analysis backends
+"""
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "ai-engine"))
+
+from analysis import MeetingAnalyzer
+from analysis.batch import (
+    BatchRequest,
+    LocalBatchBackend,
+    get_batch_backend,
+    build_batch_request,
+    parse_batch_result,
+    BATCH_COMPLETED,
+    BATCH_FAILED,
+)
+
+
+def test_local_batch_round_trip(tmp_path):
+    """Test requests are packed, run and parsed per custom_id"""
+    analyzer = MeetingAnalyzer()
+    transcripts = {
+        "m1": [{"speaker": "Ann", "text": "Budget review", "start": 0.0, "end": 4.0}],
+        "m2": [{"speaker": "Bob", "text": "Hiring plan", "start": 0.0, "end": 2.0}],
+    }
+
+    def fake_llm(prompt, **kwargs):
+        topic = "budget" if "Budget review" in prompt else "hiring"
+        return json.dumps({"summary": f"About {topic}", "key_topics": [topic]})
+
+    analyzer._call_llm = fake_llm  # field repair calls
+    backend = LocalBatchBackend(analyzer, call_llm=fake_llm, state_dir=str(tmp_path))
+    requests = [
+        build_batch_request(analyzer, meeting_id, transcript, meeting_title=meeting_id)
+        for meeting_id, transcript in transcripts.items()
+    ]
+
+    batch_id = backend.submit(requests)
+    # Another worker process polls the batch
+    backend = get_batch_backend(analyzer, "local", state_dir=str(tmp_path))
+    assert backend.status(batch_id) == BATCH_COMPLETED
+    assert backend.status("local-unknown") == BATCH_FAILED
+
+    results = {
+        meeting_id: parse_batch_result(analyzer, text, transcripts[meeting_id])
+        for meeting_id, text in backend.results(batch_id).items()
+    }
+
+    assert results["m1"].key_topics == ["budget"]
+    assert results["m2"].summary == "About hiring"
+    assert results["m2"].talk_time_distribution == {"Bob": 100.0}
+    # Fields the batch reply left out are repaired / defaulted as online
+    assert results["m1"].action_items == [] and results["m1"].sentiment_label == "neutral"
+
+
+def test_batch_request_matches_online_prompt_and_params():
+    """Test batch prompts reuse the online prompt and request body"""
+    analyzer = MeetingAnalyzer(model="gpt-4o-mini")
+    transcript = [{"speaker": "Ann", "text": "Hello", "start": 0.0, "end": 1.0}]
+
+    request = build_batch_request(analyzer, "m1", transcript, meeting_title="Sync")
+
+    assert request.prompt == analyzer._build_analysis_prompt("[00:00] [Ann]: Hello", "Sync", None)
+    assert analyzer._openai_params(request.prompt)["model"] == "gpt-4o-mini"
+    assert type(get_batch_backend(analyzer, "anthropic")).__name__ == "AnthropicBatchBackend"
+
+
+class BatchStandIn:
+    """OpenAI /files + /batches and Anthropic /v1/messages/batches over HTTP"""
+
+    def __init__(self):
+        self.headers = []
+        self.uploads = []
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def reply(self, body, content_type="application/json"):
+                data = body.encode() if isinstance(body, str) else json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                stand_in.headers.append(dict(self.headers))
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                if self.path == "/v1/files":
+                    stand_in.uploads.append(body)
+                    return self.reply({"id": "file-in"})
+                if self.path == "/v1/batches":
+                    assert json.loads(body)["input_file_id"] == "file-in"
+                    return self.reply({"id": "batch-1", "status": "validating"})
+                if self.path == "/v1/messages/batches":
+                    stand_in.uploads.append(body)
+                    return self.reply({"id": "msgbatch-1", "processing_status": "in_progress"})
+
+            def do_GET(self):
+                stand_in.headers.append(dict(self.headers))
+                base = f"http://127.0.0.1:{stand_in.server.server_port}"
+                if self.path == "/v1/batches/batch-1":
+                    return self.reply({"id": "batch-1", "status": "completed", "output_file_id": "file-out"})
+                if self.path == "/v1/files/file-out/content":
+                    return self.reply("\n".join([
+                        json.dumps({"custom_id": "m1", "response": {
+                            "status_code": 200,
+                            "body": {"choices": [{"message": {"content": '{"summary": "ok"}'}}]},
+                        }}),
+                        json.dumps({"custom_id": "m2", "response": {"status_code": 500, "body": {}}}),
+                    ]), "application/jsonl")
+                if self.path == "/v1/messages/batches/msgbatch-1":
+                    return self.reply({
+                        "id": "msgbatch-1",
+                        "processing_status": "ended",
+                        "results_url": f"{base}/v1/messages/batches/msgbatch-1/results",
+                    })
+                if self.path == "/v1/messages/batches/msgbatch-1/results":
+                    return self.reply("\n".join([
+                        json.dumps({"custom_id": "m1", "result": {
+                            "type": "succeeded",
+                            "message": {"content": [{"type": "text", "text": '{"summary": "ok"}'}]},
+                        }}),
+                        json.dumps({"custom_id": "m2", "result": {"type": "errored"}}),
+                    ]), "application/jsonl")
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+
+
+def test_provider_batches_use_the_analyzer_key_and_url():
+    """Test OpenAI and Anthropic batches round-trip over HTTP with the analyzer's credentials"""
+    stand_in = BatchStandIn()
+    requests = [BatchRequest("m1", "Transcript one"), BatchRequest("m2", "Transcript two")]
+
+    try:
+        openai = get_batch_backend(MeetingAnalyzer(api_key="sk-test", base_url=f"{stand_in.url}/v1"), "openai")
+        batch_id = openai.submit(requests)
+        assert batch_id == "batch-1"
+        assert b'"custom_id": "m2"' in stand_in.uploads[0]
+        assert openai.status(batch_id) == BATCH_COMPLETED
+        assert openai.results(batch_id) == {"m1": '{"summary": "ok"}'}
+        assert stand_in.headers[0]["Authorization"] == "Bearer sk-test"
+
+        analyzer = MeetingAnalyzer(llm_provider="anthropic", api_key="ak-test", base_url=stand_in.url)
+        anthropic = get_batch_backend(analyzer, "anthropic")
+        batch_id = anthropic.submit(requests)
+        assert json.loads(stand_in.uploads[-1])["requests"][0]["params"]["model"] == analyzer.model
+        assert anthropic.status(batch_id) == BATCH_COMPLETED
+        assert anthropic.results(batch_id) == {"m1": '{"summary": "ok"}'}
+        assert stand_in.headers[-1]["x-api-key"] == "ak-test"
+    finally:
+        stand_in.server.shutdown()
@@ -0,0 +1,133 @@
+"""
+Tests for the bulk row writer
+"""
+from datetime import datetime
+
+from sqlalchemy import (
+    Column, DateTime, Float, Integer, MetaData, String, Table, UniqueConstraint, create_engine, select
+)
+from sqlalchemy.orm import Session
+
+import app.core  # noqa: F401 - app.core must be imported before app.db
+from app.db.bulk import bulk_insert, upsert, _csv_field
+
+
+metadata = MetaData()
+segments = Table(
+    "bulk_segments",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("speaker_name", String),
+    Column("text", String),
+    Column("start_time", Float),
+    Column("created_at", DateTime),
+)
+nodes = Table(
+    "bulk_nodes",
+    metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("name", String, nullable=False),
+    Column("node_type", String, nullable=False),
+    Column("description", String),
+    UniqueConstraint("name", "node_type"),
+)
+
+
+def test_bulk_insert_writes_all_rows_in_batches():
+    """Test rows from a generator are written in batches inside the session transaction"""
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    created_at = datetime(2024, 1, 1, 12, 0)
+
+    rows = (
+        {"id": i, "speaker_name": None if i % 3 == 0 else f"Speaker {i}",
+         "text": f"Segment {i}", "start_time": i * 2.5, "created_at": created_at}
+        for i in range(25)
+    )
+
+    with Session(engine) as db:
+        assert bulk_insert(db, segments, rows, batch_size=10) == 25
+        db.commit()
+
+        stored = db.execute(select(segments).order_by(segments.c.id)).all()
+
+    assert len(stored) == 25
+    assert stored[0].speaker_name is None
+    assert stored[7].speaker_name == "Speaker 7"
+    assert stored[24].start_time == 60.0
+    assert stored[24].created_at == created_at
+
+
+def test_bulk_insert_empty_rows():
+    """Test nothing is written for an empty input"""
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+
+    with Session(engine) as db:
+        assert bulk_insert(db, segments, []) == 0
+
+
+def test_csv_field_distinguishes_null_and_empty_string():
+    """Test COPY csv encoding: None is unquoted empty, strings are quoted and escaped"""
+    assert _csv_field(None) == ""
+    assert _csv_field("") == '""'
+    assert _csv_field('say "hi", ok') == '"say ""hi"", ok"'
+    assert _csv_field(1.5) == "1.5"
+    assert _csv_field(datetime(2024, 1, 1, 9, 30)) == "2024-01-01T09:30:00"
+
+
+def test_upsert_returns_ids_of_new_and_existing_rows():
+    """Test upsert resolves every key in one pass and keeps values not given"""
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+
+    with Session(engine) as db:
+        first = upsert(
+            db, nodes,
+            [
+                {"name": "Budget", "node_type": "topic", "description": "Q3 budget"},
+                {"name": "Hiring", "node_type": "topic", "description": None},
+            ],
+            conflict_columns=("name", "node_type"),
+            update_columns=("description",),
+            returning=("id", "name", "node_type"),
+        )
+        db.commit()
+        ids = {row.name: row.id for row in first}
+
+        second = upsert(
+            db, nodes,
+            [
+                {"name": "Budget", "node_type": "topic", "description": None},
+                {"name": "Hiring", "node_type": "topic", "description": "Two engineers"},
+                {"name": "Hiring", "node_type": "topic", "description": "Three engineers"},
+                {"name": "Budget", "node_type": "decision", "description": None},
+            ],
+            conflict_columns=("name", "node_type"),
+            update_columns=("description",),
+            returning=("id", "name", "node_type"),
+            batch_size=2,
+        )
+        db.commit()
+
+        stored = {(r.name, r.node_type): r for r in db.execute(select(nodes)).all()}
+
+    assert len(second) == 3
+    assert {(r.name, r.node_type): r.id for r in second}[("Budget", "topic")] == ids["Budget"]
+    assert len(stored) == 3
+    assert stored[("Budget", "topic")].description == "Q3 budget"
+    assert stored[("Hiring", "topic")].description == "Three engineers"
+
+
+def test_upsert_without_update_columns_keeps_existing_rows():
+    """Test conflicting rows are skipped when nothing is to be updated"""
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+
+    with Session(engine) as db:
+        upsert(db, nodes, [{"name": "Budget", "node_type": "topic", "description": "old"}], ("name", "node_type"))
+        upsert(db, nodes, [{"name": "Budget", "node_type": "topic", "description": "new"}], ("name", "node_type"))
+        db.commit()
+
+        assert db.execute(select(nodes.c.description)).scalars().all() == ["old"]
+        assert upsert(db, nodes, [], ("name", "node_type")) == []
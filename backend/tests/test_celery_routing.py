@@ -0,0 +1,39 @@
+"""
+Tests for worker lane routing and queue depth metrics
+"""
+from kombu import Queue
+
+from app.celery import celery_app, queue_depths, LANES
+
+
+def route(task_name: str) -> str:
+    return celery_app.amqp.router.route({}, task_name)["queue"].name
+
+
+def test_tasks_are_routed_to_their_lanes():
+    """Test CPU, LLM and graph tasks land on separate queues"""
+    assert route("app.tasks.transcribe_meeting") == "transcribe"
+    assert route("app.tasks.analyze_meeting") == "analysis"
+    assert route("app.tasks.run_meeting_templates") == "analysis"
+    assert route("app.tasks.update_knowledge_graph") == "graph"
+    assert route("app.tasks.index_meeting_search") == "graph"
+    assert route("app.tasks.poll_analysis_batches") == "celery"
+
+
+def test_queue_depths_counts_pending_messages_per_lane(monkeypatch):
+    """Test queue depth is reported for every lane"""
+    monkeypatch.setattr(celery_app.conf, "broker_url", "memory://")
+    monkeypatch.setattr(celery_app.conf, "broker_read_url", None)
+    monkeypatch.setattr(celery_app.conf, "broker_write_url", None)
+
+    with celery_app.connection_for_write() as connection:
+        producer = connection.Producer()
+        for queue in ("transcribe", "transcribe", "analysis"):
+            producer.publish({}, routing_key=queue, declare=[Queue(queue)])
+
+    depths = queue_depths()
+
+    assert set(depths) == set(LANES)
+    assert depths["transcribe"] == 2
+    assert depths["analysis"] == 1
+    assert depths["graph"] == 0
@@ -0,0 +1,53 @@
+"""
+Tests for connection pool checkout metrics
+"""
+import time
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+import app.core  # noqa: F401 - app.core must be imported before app.db
+from app.db.session import PoolCheckoutStats, instrument_pool
+
+
+def instrumented_sessions(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}")
+    stats = PoolCheckoutStats()
+    instrument_pool(engine, stats)
+    return sessionmaker(bind=engine), stats
+
+
+def test_session_held_across_slow_work_shows_long_checkout(tmp_path):
+    """Test a session kept open around slow work holds its connection throughout"""
+    Session, stats = instrumented_sessions(tmp_path)
+
+    db = Session()
+    db.execute(text("SELECT 1"))
+    assert stats.snapshot()["checked_out"] == 1
+    time.sleep(0.2)
+    db.execute(text("SELECT 1"))
+    db.close()
+
+    snapshot = stats.snapshot()
+    assert snapshot["checkouts"] == 1
+    assert snapshot["max_seconds"] >= 0.2
+    assert snapshot["buckets"]["1"] == 1
+    assert snapshot["checked_out"] == 0
+
+
+def test_short_phases_return_connection_during_slow_work(tmp_path):
+    """Test committing before slow work returns the connection, also with a live session"""
+    Session, stats = instrumented_sessions(tmp_path)
+
+    db = Session()
+    db.execute(text("SELECT 1"))
+    db.commit()
+    assert stats.snapshot()["checked_out"] == 0
+    time.sleep(0.2)
+    db.execute(text("SELECT 1"))
+    db.close()
+
+    snapshot = stats.snapshot()
+    assert snapshot["checkouts"] == 2
+    assert snapshot["max_seconds"] < 0.1
+    assert sum(snapshot["buckets"].values()) == 2
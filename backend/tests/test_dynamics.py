@@ -0,0 +1,51 @@
+"""
+Tests for conversation dynamics
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "ai-engine"))
+
+from analysis import MeetingAnalyzer, compute_dynamics
+
+
+TRANSCRIPT = [
+    {"speaker": "Ann", "start": 0.0, "end": 10.0},
+    {"speaker": "Ann", "start": 10.5, "end": 20.0},
+    {"speaker": "Bob", "start": 21.0, "end": 25.0},   # responds after 1s
+    {"speaker": "Ann", "start": 24.0, "end": 30.0},   # interrupts Bob, 1s overlap
+    {"speaker": "Bob", "start": 32.0, "end": 34.0},   # responds after 2s
+]
+
+
+def test_dynamics_per_speaker():
+    """Test turns, interruptions, overlaps, monologue and latency"""
+    dynamics = compute_dynamics(TRANSCRIPT)
+    ann, bob = dynamics["Ann"], dynamics["Bob"]
+
+    assert ann.talk_time_seconds == 25.5
+    assert bob.talk_time_seconds == 6.0
+    assert ann.turn_count == 2
+    assert bob.turn_count == 2
+    assert ann.interruption_count == 1
+    assert bob.interrupted_count == 1
+    assert ann.overlap_seconds == 1.0
+    assert ann.longest_monologue_seconds == 20.0
+    assert bob.avg_response_latency == 1.5
+
+
+def test_unsorted_input_and_talk_time_percentages():
+    """Test segments are sorted and percentages match the analyzer"""
+    dynamics = compute_dynamics(list(reversed(TRANSCRIPT)))
+
+    assert dynamics["Ann"].turn_count == 2
+    assert MeetingAnalyzer()._calculate_talk_time(TRANSCRIPT) == {
+        "Ann": 80.95,
+        "Bob": 19.05,
+    }
+
+
+def test_empty_transcript():
+    """Test empty transcript"""
+    assert compute_dynamics([]) == {}
+    assert MeetingAnalyzer()._calculate_talk_time([]) == {}
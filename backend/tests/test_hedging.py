@@ -0,0 +1,239 @@
+"""
+Tests for hedged LLM requests, failover and circuit breakers
+(local stand-in servers speaking the OpenAI chat completions API)
+"""
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "ai-engine"))
+
+from analysis import MeetingAnalyzer, HedgedCaller, CircuitBreaker, LLM_STATS
+
+
+class StandIn:
+    """OpenAI-compatible /v1/chat/completions with a set delay, status and reply"""
+
+    def __init__(self, delay=0.0, status=200, content='{"summary": "ok"}'):
+        self.delay, self.status, self.content = delay, status, content
+        self.requests = 0
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                stand_in.requests += 1
+                time.sleep(stand_in.delay)
+                if request.get("stream"):
+                    return self.stream()
+                body = json.dumps({
+                    "id": "chatcmpl-1",
+                    "object": "chat.completion",
+                    "created": 0,
+                    "model": "stand-in",
+                    "choices": [{
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": stand_in.content},
+                    }],
+                    "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+                }).encode()
+                self.send_response(stand_in.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def stream(self):
+                chunks = [
+                    {"choices": [{"index": 0, "delta": {"content": stand_in.content}}]},
+                    {"choices": [], "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}},
+                ]
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.end_headers()
+                for chunk in chunks:
+                    chunk.update(id="chatcmpl-1", object="chat.completion.chunk", created=0, model="stand-in")
+                    self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+                self.wfile.write(b"data: [DONE]\n\n")
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/v1"
+
+    def close(self):
+        self.server.shutdown()
+
+
+@pytest.fixture
+def servers():
+    started = []
+
+    def start(**kwargs):
+        started.append(StandIn(**kwargs))
+        return started[-1]
+
+    yield start
+    for server in started:
+        server.close()
+
+
+def analyzer_for(primary, alternate, hedger):
+    fallback = MeetingAnalyzer(model="alternate", api_key="test", base_url=alternate.url)
+    return MeetingAnalyzer(
+        model="primary", api_key="test", base_url=primary.url, fallback=fallback, hedger=hedger
+    )
+
+
+def test_slow_provider_is_hedged_to_the_alternate(servers):
+    """Test the alternate's answer wins once the primary exceeds its hedge delay"""
+    events = []
+    hedger = HedgedCaller(default_delay=0.2, observer=lambda *event: events.append(event))
+    analyzer = analyzer_for(servers(delay=3.0), servers(), hedger)
+
+    start = time.perf_counter()
+    text = analyzer._call_llm("Transcript", validate=analyzer._is_complete_json)
+
+    assert time.perf_counter() - start < 2.0
+    assert json.loads(text) == {"summary": "ok"}
+    assert analyzer.last_provider == "openai:alternate"
+    assert analyzer.last_usage["prompt_tokens"] == 10
+    assert ("openai:alternate", "hedged", None) in events
+
+
+def test_invalid_and_failing_providers_fail_over(servers):
+    """Test truncated JSON and server errors move to the alternate without waiting"""
+    hedger = HedgedCaller(default_delay=30)
+    truncated = analyzer_for(servers(content='{"summary": "cut'), servers(), hedger)
+
+    start = time.perf_counter()
+    assert json.loads(truncated._call_llm("x", validate=truncated._is_complete_json)) == {"summary": "ok"}
+    assert time.perf_counter() - start < 5
+
+    broken_primary = servers(status=503)
+    failing = analyzer_for(broken_primary, servers(), hedger)
+    assert failing.analyze_meeting([{"speaker": "Ann", "text": "hi"}]).summary == "ok"
+    assert failing.last_provider == "openai:alternate"
+
+    # Every provider answering badly: the last answer goes to the caller's repair
+    both_bad = analyzer_for(servers(content="no json"), servers(content="nope"), HedgedCaller())
+    assert both_bad._call_llm("x", validate=both_bad._is_complete_json) in ("no json", "nope")
+
+
+def test_open_breaker_skips_the_provider(servers):
+    """Test a tripped provider gets no traffic until its reset time"""
+    hedger = HedgedCaller(default_delay=30, failure_threshold=2, reset_seconds=60)
+    primary = servers(status=400)
+    analyzer = analyzer_for(primary, servers(), hedger)
+    rejected_before = LLM_STATS["openai:primary.rejected"]
+
+    for _ in range(4):
+        assert analyzer._call_llm("x") == '{"summary": "ok"}'
+
+    assert primary.requests == 2
+    assert hedger.breaker("openai:primary").state == "open"
+    assert LLM_STATS["openai:primary.rejected"] - rejected_before == 2
+
+
+def test_circuit_breaker_half_open_trial():
+    """Test one trial call after the reset time closes or re-opens the breaker"""
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=10, clock=lambda: now[0])
+    breaker.record(False)
+    breaker.record(False)
+    assert breaker.state == "open" and not breaker.allow()
+
+    now[0] = 11
+    assert breaker.allow()
+    assert not breaker.allow()  # only one trial in flight
+    breaker.record(False)
+    assert breaker.state == "open"
+
+    now[0] = 22
+    assert breaker.allow()
+    breaker.record(True)
+    assert breaker.state == "closed" and breaker.allow()
+
+
+def test_hedge_delay_follows_observed_p95():
+    """Test the delay is the provider's latency quantile within bounds"""
+    hedger = HedgedCaller(min_delay=0.5, max_delay=5, default_delay=3)
+    assert hedger.hedge_delay("p") == 3
+
+    for seconds in [1.0] * 18 + [2.0] * 2:
+        hedger.latencies["p"].add(seconds)
+    assert hedger.hedge_delay("p") == 2.0
+
+    for _ in range(200):
+        hedger.latencies["p"].add(0.01)
+    assert hedger.hedge_delay("p") == 0.5
+
+
+def test_stream_fails_over_before_first_delta():
+    """Test streaming switches provider only while nothing was yielded"""
+    hedger = HedgedCaller()
+
+    def broken():
+        raise ConnectionError("down")
+        yield
+
+    def working():
+        yield from ["a", "b"]
+
+    assert list(hedger.stream([("p1", broken), ("p2", working)])) == ["a", "b"]
+
+    def dies_midway():
+        yield "a"
+        raise ConnectionError("reset")
+
+    with pytest.raises(ConnectionError):
+        list(hedger.stream([("p3", dies_midway), ("p2", working)]))
+
+
+def test_slow_stream_is_hedged_on_first_delta():
+    """Test the fallback stream wins when the primary's first delta is late"""
+    events = []
+    hedger = HedgedCaller(default_delay=0.1, observer=lambda *event: events.append(event))
+    late_closed = threading.Event()
+
+    def late():
+        try:
+            time.sleep(0.5)
+            yield "late"
+        finally:
+            late_closed.set()
+
+    def quick():
+        yield from ["a", "b"]
+
+    start = time.perf_counter()
+    assert list(hedger.stream([("slow", late), ("quick", quick)])) == ["a", "b"]
+    assert time.perf_counter() - start < 0.4
+
+    assert late_closed.wait(2)
+    assert ("quick", "hedged", None) in events
+    assert ("slow", "cancelled", None) in events
+    assert hedger.breaker("slow").state == "closed"
+    assert len(hedger.first_chunk_latencies["quick"].samples) == 1
+
+
+def test_analysis_stream_hedges_to_the_alternate(servers):
+    """Test streamed analysis takes the alternate's stream and usage"""
+    hedger = HedgedCaller(default_delay=0.2)
+    analyzer = analyzer_for(servers(delay=3.0), servers(), hedger)
+
+    start = time.perf_counter()
+    result = analyzer.analyze_meeting_stream([{"speaker": "Ann", "text": "hi"}])
+
+    assert time.perf_counter() - start < 2.0
+    assert result.summary == "ok"
+    assert analyzer.last_provider == "openai:alternate"
+    assert analyzer.last_usage["prompt_tokens"] == 10
@@ -0,0 +1,56 @@
+"""
+Tests for rolling analysis of live meetings
+"""
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "ai-engine"))
+
+from analysis import MeetingAnalyzer, IncrementalAnalyzer, RollingState
+
+
+def segments(start, count):
+    return [
+        {"speaker": "Ann", "text": f"point number {i}", "start": float(i), "end": float(i) + 0.9}
+        for i in range(start, start + count)
+    ]
+
+
+def test_update_sends_only_new_segments():
+    """Test each update prompt carries new segments and the compact state only"""
+    analyzer = MeetingAnalyzer()
+    prompts = []
+
+    def fake_llm(prompt):
+        prompts.append(prompt)
+        return json.dumps({
+            "summary": f"Summary after {len(prompts)} updates",
+            "open_action_items": [{"task": "Follow up", "assignee": "Ann"}],
+            "key_topics": ["points"],
+            "decisions_made": [],
+        })
+
+    analyzer._call_llm = fake_llm
+    incremental = IncrementalAnalyzer(analyzer)
+
+    state = incremental.update(RollingState(), segments(0, 50))
+    state = incremental.update(state, segments(50, 50))
+
+    assert "point number 10" in prompts[0]
+    assert "point number 10\n" not in prompts[1]
+    assert "point number 60" in prompts[1]
+    assert "Summary after 1 updates" in prompts[1]
+    assert state.summary == "Summary after 2 updates"
+    assert state.last_segment_end == 99.9
+    assert state.segments_processed == 100
+    assert state.updates == 2
+
+
+def test_state_round_trip_and_no_op():
+    """Test state serializes and empty updates skip the LLM"""
+    state = RollingState(summary="s", key_topics=["a"], last_segment_end=5.0)
+    restored = RollingState.from_dict(json.loads(json.dumps(state.to_dict())))
+
+    assert restored == state
+    assert IncrementalAnalyzer(MeetingAnalyzer()).update(restored, []) is restored
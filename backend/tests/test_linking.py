@@ -0,0 +1,62 @@
+"""
+Tests for linking key moments and action items to transcript segments
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "ai-engine"))
+
+from analysis import MeetingAnalyzer, SegmentIndex, link_to_segments, parse_timestamp
+
+
+SEGMENTS = [
+    {"speaker": "Ann", "text": "Welcome", "start": 0.0, "end": 8.0},
+    {"speaker": "Bob", "text": "Status", "start": 8.5, "end": 60.0},
+    {"speaker": "Ann", "text": "Budget", "start": 90.0, "end": 125.0},
+    {"speaker": "Bob", "text": "Deal", "start": 3700.0, "end": 3720.0},
+]
+
+
+def test_parse_timestamp():
+    """Test clock times inside LLM strings and plain seconds"""
+    assert parse_timestamp("01:30") == 90
+    assert parse_timestamp("[1:02:03]") == 3723
+    assert parse_timestamp("around 12:05 when Bob joined") == 725
+    assert parse_timestamp(42) == 42.0
+    assert parse_timestamp("near the end") is None
+    assert parse_timestamp("12:75") is None
+    assert parse_timestamp(None) is None
+    assert parse_timestamp(True) is None
+
+
+def test_segment_index_locates_covering_or_nearest_segment():
+    """Test inside a segment, in a silence gap and outside the transcript"""
+    index = SegmentIndex.from_segments(SEGMENTS)
+
+    assert index.locate(0) == 0
+    assert index.locate(8.2) == 0      # gap, closer to the end of segment 0
+    assert index.locate(30) == 1
+    assert index.locate(70) == 1       # gap 60..90, closer to segment 1
+    assert index.locate(85) == 2       # gap 60..90, closer to segment 2
+    assert index.locate(3710) == 3
+    assert index.locate(3800) is None  # past the end beyond tolerance
+    assert index.locate(None) is None
+    assert SegmentIndex([], []).locate(10) is None
+
+
+def test_link_to_segments_and_timestamped_prompt():
+    """Test items map to segment positions and the LLM sees the same clock"""
+    index = SegmentIndex.from_segments(SEGMENTS)
+    items = [
+        {"task": "Send budget", "timestamp": "01:35"},
+        {"task": "Close the deal", "timestamp": "1:01:45"},
+        {"task": "Follow up", "timestamp": None},
+        "not a dict",
+    ]
+
+    assert link_to_segments(items, index) == [2, 3, None, None]
+
+    formatted = MeetingAnalyzer()._format_transcript(SEGMENTS)
+    assert formatted.splitlines()[2] == "[01:30] [Ann]: Budget"
+    assert formatted.splitlines()[3] == "[1:01:40] [Bob]: Deal"
+    assert MeetingAnalyzer()._format_transcript([{"speaker": "Ann", "text": "hi"}]) == "[Ann]: hi"
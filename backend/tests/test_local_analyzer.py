@@ -0,0 +1,45 @@
+"""
+Tests for the local (no-LLM) analysis tier
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "ai-engine"))
+
+from analysis import LocalAnalyzer
+
+
+TRANSCRIPT = [
+    {"speaker": "Ann", "text": "Let's review the pricing page redesign."},
+    {"speaker": "Bob", "text": "The pricing page conversion is great, really good progress."},
+    {"speaker": "Ann", "text": "Can we ship the pricing page next week?"},
+    {"speaker": "Bob", "text": "We decided to go with the annual plan toggle."},
+    {"speaker": "Cid", "text": "Onboarding emails still have a bug."},
+]
+
+
+def test_topics_prefer_repeated_phrases():
+    """Test repeated bigrams rank as topics without duplicate unigrams"""
+    result = LocalAnalyzer().analyze(TRANSCRIPT)
+
+    assert result.key_topics[0] == "pricing page"
+    assert "pricing" not in result.key_topics
+    assert "page" not in result.key_topics
+
+
+def test_sentiment_and_heuristics():
+    """Test lexicon sentiment and question/decision detection"""
+    result = LocalAnalyzer().analyze(TRANSCRIPT)
+
+    assert 0.5 < result.sentiment_score <= 1.0
+    assert result.questions == ["Can we ship the pricing page next week?"]
+    assert result.decisions == ["We decided to go with the annual plan toggle."]
+
+
+def test_empty_transcript():
+    """Test empty transcript yields neutral defaults"""
+    result = LocalAnalyzer().analyze([])
+
+    assert result.key_topics == []
+    assert result.sentiment_score == 0.5
+    assert result.sentiment_label == "neutral"
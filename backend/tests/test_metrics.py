@@ -0,0 +1,94 @@
+"""
+Tests for pipeline stage timing and metrics
+"""
+import os
+import sys
+import time
+
+import numpy as np
+from prometheus_client import REGISTRY, CollectorRegistry
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "ai-engine"))
+
+from app.metrics import QueueDepthCollector, StageTimer, count_bytes
+from transcription import WhisperTranscriber, TranscriberConfig
+
+
+def sample(name, task, stage):
+    return REGISTRY.get_sample_value(name, {"task": task, "stage": stage}) or 0.0
+
+
+def test_stage_timer_records_breakdown_and_histograms():
+    """Test durations, bytes and audio seconds reach the breakdown and Prometheus"""
+    timer = StageTimer("test-timer")
+    count_before = sample("meetingmind_stage_duration_seconds_count", "test-timer", "download")
+
+    with timer.stage("download") as stage:
+        data = b"".join(count_bytes([b"x" * 1000, b"y" * 500], stage))
+        time.sleep(0.02)
+    with timer.stage("whisper") as stage:
+        stage["audio_seconds"] = 120
+    try:
+        with timer.stage("db_write"):
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+
+    breakdown = timer.breakdown()
+    assert len(data) == 1500
+    assert breakdown["download"]["bytes"] == 1500
+    assert breakdown["download"]["seconds"] >= 0.02
+    assert breakdown["whisper"]["audio_seconds"] == 120
+    assert "db_write" in breakdown  # failing stages are timed too
+    assert timer.total_seconds >= breakdown["download"]["seconds"]
+
+    assert sample("meetingmind_stage_duration_seconds_count", "test-timer", "download") == count_before + 1
+    assert sample("meetingmind_stage_bytes_sum", "test-timer", "download") >= 1500
+    assert sample("meetingmind_stage_audio_seconds_sum", "test-timer", "whisper") >= 120
+
+
+class FakeWhisperModel:
+    def transcribe(self, audio, **kwargs):
+        return {"segments": [{"text": " hello ", "start": 0.0, "end": 2.0}]}
+
+
+def test_transcriber_reports_its_stages():
+    """Test the ai-engine transcriber times model load, Whisper and diarization"""
+    transcriber = WhisperTranscriber(TranscriberConfig(use_local=True))
+    transcriber._model = FakeWhisperModel()
+    transcriber._load_diarization_model = lambda: None
+    timer = StageTimer("test-transcriber")
+
+    segments = transcriber.transcribe_audio(np.zeros(16000 * 5, dtype=np.float32), timer=timer)
+
+    assert [s.text for s in segments] == ["hello"]
+    assert set(timer.breakdown()) == {"model_load", "whisper", "diarization"}
+    assert timer.breakdown()["whisper"]["audio_seconds"] == 5.0
+    assert 0 < timer.realtime_factor("whisper") < 1
+    assert timer.realtime_factor("model_load") is None
+
+    # No timer passed: same result, nothing recorded
+    assert transcriber.transcribe_audio(np.zeros(16000, dtype=np.float32))[0].text == "hello"
+
+
+def test_queue_depth_is_read_at_scrape_time():
+    """Test the queue depth gauge asks the broker on every scrape, not at registration"""
+    calls = []
+
+    def depths():
+        calls.append(1)
+        return {"transcribe": 3 * len(calls), "analysis": 0}
+
+    registry = CollectorRegistry()
+    registry.register(QueueDepthCollector(depths))
+    assert calls == []
+
+    assert registry.get_sample_value("meetingmind_queue_depth", {"queue": "transcribe"}) == 3
+    assert registry.get_sample_value("meetingmind_queue_depth", {"queue": "transcribe"}) == 6
+
+    def broker_down():
+        raise ConnectionError("down")
+
+    registry = CollectorRegistry()
+    registry.register(QueueDepthCollector(broker_down))
+    assert registry.get_sample_value("meetingmind_queue_depth", {"queue": "transcribe"}) is None
@@ -0,0 +1,79 @@
+"""
+Tests for cacheable prompt assembly and cached-token accounting
+"""
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "ai-engine"))
+
+from analysis import MeetingAnalyzer, ANALYSIS_STATS
+from analysis.retrieval import estimate_tokens
+from analysis.meeting_analyzer import ANALYSIS_INSTRUCTIONS
+
+
+def test_prompts_share_static_prefix():
+    """Test meeting-specific text comes after the static instructions"""
+    analyzer = MeetingAnalyzer()
+
+    first = analyzer._build_analysis_prompt("[Ann]: hi", "Standup", ["Earlier summary"])
+    second = analyzer._build_analysis_prompt("[Bob]: yo", "Retro", None)
+
+    assert first.startswith(ANALYSIS_INSTRUCTIONS)
+    assert second.startswith(ANALYSIS_INSTRUCTIONS)
+
+
+def test_static_prefix_reaches_cache_minimum():
+    """Test the shared prefix is long enough to be cached at all"""
+    # Anthropic and OpenAI only cache prefixes of 1024+ tokens; the
+    # 4-characters-per-token estimate is kept well above that
+    assert estimate_tokens(ANALYSIS_INSTRUCTIONS) >= 1200
+
+
+def test_anthropic_cache_breakpoint():
+    """Test the static prefix gets a cache_control block"""
+    analyzer = MeetingAnalyzer(llm_provider="anthropic")
+    prompt = analyzer._build_analysis_prompt("[Ann]: hi", "Standup")
+
+    content = analyzer._anthropic_params(prompt)["messages"][0]["content"]
+
+    assert content[0]["text"] == ANALYSIS_INSTRUCTIONS
+    assert content[0]["cache_control"] == {"type": "ephemeral"}
+    assert "Standup" in content[1]["text"]
+
+    analyzer.prompt_caching = False
+    assert analyzer._anthropic_params(prompt)["messages"][0]["content"] == prompt
+
+
+def test_usage_normalization():
+    """Test cached tokens are recorded for both providers"""
+    analyzer = MeetingAnalyzer()
+    before = ANALYSIS_STATS["cached_tokens"]
+
+    openai_usage = SimpleNamespace(
+        prompt_tokens=1500,
+        completion_tokens=300,
+        prompt_tokens_details=SimpleNamespace(cached_tokens=1024),
+    )
+    assert analyzer._record_usage(openai_usage)["cached_tokens"] == 1024
+
+    anthropic_usage = SimpleNamespace(
+        input_tokens=200,
+        output_tokens=300,
+        cache_read_input_tokens=1200,
+        cache_creation_input_tokens=0,
+    )
+    usage = analyzer._record_usage(anthropic_usage)
+
+    assert usage["prompt_tokens"] == 1400
+    assert analyzer.last_usage == usage
+    assert ANALYSIS_STATS["cached_tokens"] - before == 2224
+
+
+def test_stream_usage_as_plain_dict():
+    """Test usage from stream chunks the SDK does not model is normalized too"""
+    usage = MeetingAnalyzer()._record_usage(
+        {"prompt_tokens": 1500, "completion_tokens": 20, "prompt_tokens_details": {"cached_tokens": 1024}}
+    )
+
+    assert (usage["prompt_tokens"], usage["cached_tokens"]) == (1500, 1024)
@@ -0,0 +1,113 @@
+"""
+Tests for retrieval-augmented meeting Q&A
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "ai-engine"))
+
+from analysis import MeetingAnalyzer, MeetingQA, HashingEmbedder, QA_STATS, chunk_transcript, select_context
+
+
+TRANSCRIPT = [
+    {"speaker": "Ann", "text": "The database migration is scheduled for Friday night.", "start": 0.0, "end": 4.0},
+    {"speaker": "Bob", "text": "Marketing wants a new landing page for the spring campaign.", "start": 4.0, "end": 9.0},
+    {"speaker": "Ann", "text": "Budget for the campaign is twenty thousand dollars.", "start": 9.0, "end": 13.0},
+    {"speaker": "Bob", "text": "Lunch options near the office are limited.", "start": 13.0, "end": 16.0},
+]
+
+
+class RecordingAnalyzer(MeetingAnalyzer):
+    """Analyzer that records prompts instead of calling an LLM"""
+
+    def __init__(self):
+        super().__init__()
+        self.prompts = []
+
+    def _call_llm(self, prompt: str) -> str:
+        self.prompts.append(prompt)
+        return "Friday night [1]"
+
+
+def test_embeddings_are_unit_vectors_and_rank_related_text():
+    """Test hashing embeddings are normalized and similarity is meaningful"""
+    embedder = HashingEmbedder(dim=512)
+    vectors = embedder.embed([
+        "database migration on friday",
+        "when is the database migration",
+        "lunch near the office",
+        "",
+    ])
+
+    assert vectors.shape == (4, 512)
+    assert np.allclose(np.linalg.norm(vectors[:3], axis=1), 1.0)
+    assert not vectors[3].any()
+    assert vectors[0] @ vectors[1] > vectors[0] @ vectors[2]
+
+
+def test_chunks_keep_segment_boundaries():
+    """Test chunking groups whole segments up to max_chars"""
+    chunks = chunk_transcript(TRANSCRIPT, max_chars=70, meeting_id="m1")
+
+    assert len(chunks) == 4
+    assert chunks[0].text.startswith("Ann: The database migration")
+    assert (chunks[1].start, chunks[1].end) == (4.0, 9.0)
+    assert all(c.meeting_id == "m1" for c in chunks)
+    assert len(chunk_transcript(TRANSCRIPT, max_chars=10000)) == 1
+
+
+def test_answer_sends_only_retrieved_spans():
+    """Test only top-k chunks reach the LLM and metrics are reported"""
+    analyzer = RecordingAnalyzer()
+    qa = MeetingQA(analyzer, top_k=1)
+    chunks = chunk_transcript(TRANSCRIPT, max_chars=70)
+    questions_before = QA_STATS["questions"]
+
+    result = qa.answer("When is the database migration?", chunks)
+
+    assert result.answer == "Friday night [1]"
+    assert len(result.sources) == 1
+    assert "database migration" in result.sources[0]["text"]
+    assert "Lunch" not in analyzer.prompts[0]
+    assert "landing page" not in analyzer.prompts[0]
+    assert result.prompt_tokens > 0
+    assert QA_STATS["questions"] == questions_before + 1
+
+
+def test_answer_from_index_hits():
+    """Test chunks retrieved by a search index are answered the same way"""
+    analyzer = RecordingAnalyzer()
+    chunks = chunk_transcript(TRANSCRIPT, max_chars=70, meeting_id="m1")
+
+    result = MeetingQA(analyzer).answer_retrieved("When?", [(chunks[0], 0.8)], retrieval_ms=3.0)
+
+    assert result.retrieval_ms == 3.0
+    assert [(s["meeting_id"], s["score"]) for s in result.sources] == [("m1", 0.8)]
+    assert "(00:00-00:04)" in analyzer.prompts[0]
+
+
+def test_no_relevant_chunks_skips_llm():
+    """Test no LLM call is made when nothing matches"""
+    analyzer = RecordingAnalyzer()
+    result = MeetingQA(analyzer).answer("anything", [])
+
+    assert result.sources == []
+    assert analyzer.prompts == []
+
+
+def test_select_context_ranks_and_respects_budget():
+    """Test context selection by score within a token budget"""
+    candidates = [
+        ("recent", 0.10, "x" * 400),
+        ("related", 0.90, "x" * 2000),
+        ("long", 0.80, "x" * 8000),
+        ("unrelated", 0.0, "x" * 40),
+        ("small", 0.50, "x" * 400),
+    ]
+
+    # 500 + 100 tokens fit; "long" (2000 tokens) is skipped, "recent" exceeds max_items
+    assert select_context(candidates, token_budget=1000, max_items=2) == ["related", "small"]
+    assert select_context(candidates, token_budget=50) == []
+    assert select_context([], token_budget=1000) == []
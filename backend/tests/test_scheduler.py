@@ -0,0 +1,187 @@
+"""
+Tests for the fair-share transcription scheduler (simulated load)
+"""
+import heapq
+import random
+
+from app.scheduler import FairScheduler
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q / 100 * (len(values) - 1))))]
+
+
+def simulate(arrivals, slots=2, fifo=False):
+    """
+    Run arrivals (time, meeting_id, organization_id, duration_seconds)
+    through the scheduler; processing time equals the cost estimate.
+
+    Returns:
+        {meeting_id: turnaround seconds}
+    """
+    scheduler = FairScheduler(slots=slots)
+    if fifo:
+        scheduler._pick = lambda: min(scheduler.pending, key=lambda job: job.seq)
+
+    arrivals = sorted(arrivals)
+    arrived = {meeting_id: at for at, meeting_id, _, _ in arrivals}
+    turnaround = {}
+    running = []
+    i = 0
+
+    while i < len(arrivals) or running:
+        next_arrival = arrivals[i][0] if i < len(arrivals) else float("inf")
+        if running and running[0][0] < next_arrival:
+            now, meeting_id = heapq.heappop(running)
+            scheduler.finish(meeting_id)
+            turnaround[meeting_id] = now - arrived[meeting_id]
+        else:
+            now, meeting_id, organization_id, duration = arrivals[i]
+            scheduler.submit(meeting_id, organization_id, duration, now=now)
+            i += 1
+
+        for job in scheduler.dispatch(now=now):
+            heapq.heappush(running, (now + job.cost, job.meeting_id))
+
+    return turnaround
+
+
+def bulk_upload_load(seed=0):
+    """One organization uploads 200 recordings while ten others keep working"""
+    rng = random.Random(seed)
+    arrivals = [
+        (0.0, f"bulk-{i}", "bulk", rng.randint(30, 90) * 60)
+        for i in range(200)
+    ]
+    for i in range(120):
+        arrivals.append((
+            rng.uniform(0, 8 * 3600),
+            f"team-{i}",
+            f"org-{i % 10}",
+            rng.choice([5, 10, 15, 30, 45, 60]) * 60,
+        ))
+    return arrivals
+
+
+def test_bulk_upload_does_not_starve_other_organizations():
+    """Test p95 turnaround of other organizations drops sharply vs FIFO"""
+    arrivals = bulk_upload_load()
+
+    fifo = simulate(arrivals, fifo=True)
+    fair = simulate(arrivals)
+
+    others_fifo = [t for m, t in fifo.items() if m.startswith("team-")]
+    others_fair = [t for m, t in fair.items() if m.startswith("team-")]
+
+    assert percentile(others_fair, 95) < 0.1 * percentile(others_fifo, 95)
+    assert percentile(others_fair, 50) < 0.1 * percentile(others_fifo, 50)
+
+    # Work conserving: everything, the bulk upload included, finishes when FIFO does
+    arrived = {meeting_id: at for at, meeting_id, _, _ in arrivals}
+    assert len(fair) == len(arrivals)
+    assert max(arrived[m] + t for m, t in fair.items()) <= 1.01 * max(arrived[m] + t for m, t in fifo.items())
+
+
+def test_short_meetings_use_priority_lane():
+    """Test short meetings jump ahead of queued long ones, within the burst limit"""
+    scheduler = FairScheduler(slots=1, short_seconds=900, short_burst=2)
+    for i in range(3):
+        scheduler.submit(f"long-{i}", "org-a", 3600, now=0)
+    for i in range(3):
+        scheduler.submit(f"short-{i}", "org-a", 600, now=1)
+
+    order = []
+    while scheduler.pending:
+        job = scheduler.dispatch(now=2)[0]
+        order.append(job.meeting_id)
+        scheduler.finish(job.meeting_id)
+
+    assert order[:3] == ["short-0", "short-1", "long-0"]
+    assert order[3] == "short-2"
+
+
+def test_weights_split_capacity_between_backlogged_organizations():
+    """Test an organization with weight 2 gets twice the dispatches"""
+    scheduler = FairScheduler(slots=1)
+    for i in range(30):
+        scheduler.submit(f"a-{i}", "org-a", 3600, weight=2.0, now=0)
+        scheduler.submit(f"b-{i}", "org-b", 3600, weight=1.0, now=0)
+
+    first = []
+    for _ in range(15):
+        job = scheduler.dispatch(now=0)[0]
+        first.append(job.organization_id)
+        scheduler.finish(job.meeting_id)
+
+    assert first.count("org-a") == 10
+    assert first.count("org-b") == 5
+
+
+def test_duplicate_submit_state_roundtrip_and_stale_slots():
+    """Test idempotent submit, persisted state and reclaiming lost slots"""
+    scheduler = FairScheduler(slots=1, stale_after=100)
+    scheduler.submit("m1", "org-a", 600, now=0)
+    scheduler.submit("m1", "org-a", 600, now=0)
+    scheduler.submit("m2", "org-b", 600, now=0)
+    assert len(scheduler.pending) == 2
+
+    assert [j.meeting_id for j in scheduler.dispatch(now=0)] == ["m1"]
+
+    restored = FairScheduler(slots=1, stale_after=100)
+    restored.load(scheduler.state())
+    assert list(restored.running) == ["m1"]
+    assert restored.dispatch(now=50) == []
+
+    # m1's worker never reported back
+    assert [j.meeting_id for j in restored.dispatch(now=200)] == ["m2"]
+    assert not restored.finish("m1")
+
+
+def test_model_follows_plan_audio_length_and_wait():
+    """Test an idle queue gets the plan's best model unless the SLA forbids it"""
+    scheduler = FairScheduler(slots=4)
+    scheduler.submit("biz-30m", "org-a", 1800, plan="business", now=0)
+    scheduler.submit("free-30m", "org-b", 1800, plan="free", now=0)
+    scheduler.submit("biz-3h", "org-c", 3 * 3600, plan="business", now=0)
+    models = {job.meeting_id: job.model for job in scheduler.dispatch(now=0)}
+
+    assert models == {"biz-30m": "medium", "free-30m": "base", "biz-3h": "base"}
+
+    # Most of the hour-long SLA already spent waiting
+    scheduler.submit("biz-late", "org-a", 1800, plan="business", now=0)
+    assert scheduler.dispatch(now=3000)[0].model == "small"
+
+
+def test_backlog_trades_model_size_for_turnaround():
+    """Test a deep queue drops started jobs to faster models"""
+    scheduler = FairScheduler(slots=1)
+    scheduler.submit("biz", "org-a", 1800, weight=4.0, plan="business", now=0)
+    for i in range(20):
+        scheduler.submit(f"bulk-{i}", "bulk", 3600, plan="free", now=0)
+
+    started = scheduler.dispatch(now=0)
+
+    assert [job.meeting_id for job in started] == ["biz"]
+    assert started[0].model == "tiny"
+
+
+def test_achieved_rtf_updates_estimates_and_persists():
+    """Test slow finished runs steer later jobs to smaller models"""
+    scheduler = FairScheduler(slots=1)
+    for _ in range(20):
+        scheduler.observe_rtf("medium", 2.0)
+    scheduler.observe_rtf("whisper-1", 0.1)
+    scheduler.observe_rtf("small", None)
+
+    restored = FairScheduler(slots=1)
+    restored.load(scheduler.state())
+    restored.submit("biz", "org-a", 1800, plan="business", now=0)
+
+    assert restored.model_rtf["medium"] > 1.9
+    assert "whisper-1" not in restored.model_rtf
+    assert restored.dispatch(now=0)[0].model == "small"
+
+    fixed = FairScheduler(slots=1, adaptive_models=False)
+    fixed.submit("biz", "org-a", 1800, plan="business", now=0)
+    assert fixed.dispatch(now=0)[0].model is None
@@ -0,0 +1,82 @@
+"""
+Tests for the singleflight task guard
+"""
+import threading
+
+from app.singleflight import claim, release, flight_key, input_hash
+
+
+class MemoryRedis:
+    """The SET NX / compare-and-delete subset of Redis the guard uses"""
+
+    def __init__(self):
+        self.data = {}
+        self.lock = threading.Lock()
+
+    def set(self, key, value, nx=False, ex=None):
+        with self.lock:
+            if nx and key in self.data:
+                return None
+            self.data[key] = value
+            return True
+
+    def eval(self, script, numkeys, key, token):
+        with self.lock:
+            if self.data.get(key) == token:
+                del self.data[key]
+                return 1
+            return 0
+
+
+class DownRedis:
+    def set(self, *args, **kwargs):
+        raise ConnectionError("redis down")
+
+    def eval(self, *args):
+        raise ConnectionError("redis down")
+
+
+def test_concurrent_claims_let_one_run_through():
+    """Test only one of many simultaneous runs for the same key proceeds"""
+    redis_client = MemoryRedis()
+    key = flight_key("analyze", "m1", input_hash(["seg"], "openai", "gpt-4o-mini"))
+    barrier = threading.Barrier(16)
+    tokens = []
+
+    def run():
+        barrier.wait()
+        tokens.append(claim(redis_client, key, ttl=60))
+
+    threads = [threading.Thread(target=run) for _ in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    winners = [t for t in tokens if t is not None]
+    assert len(winners) == 1
+
+    # Only the holder releases; afterwards the next run may claim
+    release(redis_client, key, "someone-else")
+    assert claim(redis_client, key, ttl=60) is None
+    release(redis_client, key, winners[0])
+    assert claim(redis_client, key, ttl=60) is not None
+
+
+def test_keys_differ_by_stage_meeting_and_inputs():
+    """Test a changed input (new transcript, other model) is a new flight"""
+    base = flight_key("analyze", "m1", input_hash([("s1", "hi")], "openai", "gpt-4o-mini"))
+
+    assert base == flight_key("analyze", "m1", input_hash([("s1", "hi")], "openai", "gpt-4o-mini"))
+    assert base != flight_key("analyze", "m1", input_hash([("s1", "hi!")], "openai", "gpt-4o-mini"))
+    assert base != flight_key("analyze", "m1", input_hash([("s1", "hi")], "openai", "gpt-4o"))
+    assert base != flight_key("analyze", "m2", input_hash([("s1", "hi")], "openai", "gpt-4o-mini"))
+    assert base != flight_key("transcribe", "m1", input_hash([("s1", "hi")], "openai", "gpt-4o-mini"))
+
+
+def test_unreachable_redis_fails_open():
+    """Test the guard never blocks work when Redis is down"""
+    token = claim(DownRedis(), "singleflight:analyze:m1:x", ttl=60)
+
+    assert token
+    release(DownRedis(), "singleflight:analyze:m1:x", token)
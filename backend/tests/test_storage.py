@@ -0,0 +1,122 @@
+"""
+Tests for recording downloads (local S3 stand-in)
+"""
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app import storage
+
+
+class FakeS3Handler(BaseHTTPRequestHandler):
+    """Path-style S3 subset: HEAD and (ranged) GET of stored objects"""
+
+    objects = {}
+    requests = []
+
+    def _object(self):
+        return self.objects.get(self.path.split("?")[0])
+
+    def do_HEAD(self):
+        data = self._object()
+        if data is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("ETag", '"v1"')
+        self.end_headers()
+
+    def do_GET(self):
+        data = self._object()
+        if data is None:
+            self.send_error(404)
+            return
+
+        match = re.match(r"bytes=(\d+)-(\d+)", self.headers.get("Range", ""))
+        self.requests.append(self.headers.get("Range"))
+        if match:
+            start, end = int(match.group(1)), int(match.group(2))
+            body = data[start:end + 1]
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(data)}")
+        else:
+            body = data
+            self.send_response(200)
+
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", '"v1"')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeS3Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    monkeypatch.setenv("S3_ENDPOINT_URL", f"http://127.0.0.1:{server.server_port}")
+    monkeypatch.setenv("S3_ACCESS_KEY", "test")
+    monkeypatch.setenv("S3_SECRET_KEY", "test")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setattr(storage, "_s3_client", None)
+    FakeS3Handler.objects.clear()
+    FakeS3Handler.requests.clear()
+
+    yield FakeS3Handler
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_parse_s3_url_formats(monkeypatch):
+    """Test S3 locations are recognized and other URLs are left to HTTP"""
+    monkeypatch.setenv("S3_ENDPOINT_URL", "http://minio:9000")
+
+    assert storage.parse_s3_url("s3://recordings/a/b.mp3") == ("recordings", "a/b.mp3")
+    assert storage.parse_s3_url("http://minio:9000/recordings/a/b.mp3") == ("recordings", "a/b.mp3")
+    assert storage.parse_s3_url("https://s3.amazonaws.com/recordings/b.wav") == ("recordings", "b.wav")
+    assert storage.parse_s3_url("https://recordings.s3.eu-west-1.amazonaws.com/a/b.webm") == ("recordings", "a/b.webm")
+    assert storage.parse_s3_url("https://cdn.example.com/s3/b.mp4") is None
+
+    assert storage.recording_suffix("s3://recordings/a/Call.WEBM") == ".webm"
+    assert storage.recording_suffix("https://cdn.example.com/stream?id=1") == ""
+    assert storage.is_streamable("s3://recordings/a.mp3")
+    assert not storage.is_streamable("s3://recordings/a.mp4")
+
+
+def test_large_object_is_fetched_as_parallel_ranges_in_order(s3):
+    """Test ranged parts are reassembled in order with one pooled client"""
+    data = os.urandom(5 * 1024 * 1024 + 123)
+    s3.objects["/recordings/long.webm"] = data
+
+    chunks = list(storage.iter_s3_object("recordings", "long.webm", part_size=1024 * 1024, max_workers=4))
+
+    assert b"".join(chunks) == data
+    assert len(chunks) == 6
+    assert sorted(s3.requests) == sorted(
+        f"bytes={start}-{min(start + 1024 * 1024, len(data)) - 1}"
+        for start in range(0, len(data), 1024 * 1024)
+    )
+    assert storage.get_s3_client() is storage.get_s3_client()
+
+
+def test_download_recording_keeps_suffix(s3):
+    """Test small objects are fetched in one GET into a file with the recording's suffix"""
+    s3.objects["/recordings/team/standup.webm"] = b"webm-bytes" * 100
+
+    path = storage.download_recording("s3://recordings/team/standup.webm")
+    try:
+        assert path.endswith(".webm")
+        with open(path, "rb") as f:
+            assert f.read() == b"webm-bytes" * 100
+        assert s3.requests == [None]
+    finally:
+        os.unlink(path)
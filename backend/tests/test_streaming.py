@@ -0,0 +1,76 @@
+"""
+Tests for incremental JSON parsing of streamed LLM output
+"""
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "ai-engine"))
+
+from analysis import MeetingAnalyzer
+from analysis.streaming import IncrementalJSONParser
+
+
+RESPONSE = {
+    "summary": "Team agreed on the Q3 roadmap, with \"quoted\" {braces}.",
+    "key_topics": ["roadmap", "hiring"],
+    "action_items": [
+        {"task": "Draft plan", "assignee": "Ann", "due_date": None, "priority": "high"}
+    ],
+    "sentiment": {"score": 0.8, "label": "positive"},
+    "decisions_made": ["Ship in July"],
+}
+
+
+def test_fields_emitted_in_order_as_they_close():
+    """Test each top-level field is emitted once, in stream order"""
+    emitted = []
+    parser = IncrementalJSONParser(on_field=lambda k, v: emitted.append((k, v)))
+
+    text = "```json\n" + json.dumps(RESPONSE, indent=2) + "\n```"
+    for i in range(0, len(text), 3):
+        parser.feed(text[i:i + 3])
+
+    assert parser.done
+    assert [k for k, _ in emitted] == list(RESPONSE)
+    assert parser.result() == RESPONSE
+
+
+def test_summary_emitted_before_stream_finishes():
+    """Test summary is available before the action items arrive"""
+    emitted = []
+    parser = IncrementalJSONParser(on_field=lambda k, v: emitted.append(k))
+
+    text = json.dumps(RESPONSE)
+    cut = text.index('"action_items"')
+    parser.feed(text[:cut])
+
+    assert "summary" in emitted
+    assert "action_items" not in emitted
+    assert not parser.done
+
+
+def test_scalar_values_and_trailing_text():
+    """Test numbers/bools/null and text after the object"""
+    parser = IncrementalJSONParser()
+    parser.feed('{"a": 1.5, "b": true, "c": null} trailing } text')
+
+    assert parser.done
+    assert parser.result() == {"a": 1.5, "b": True, "c": None}
+
+
+def test_analyze_meeting_stream_builds_result():
+    """Test streaming analysis returns the same result as the full response"""
+    analyzer = MeetingAnalyzer(repair_fields=False)
+    text = json.dumps(RESPONSE)
+    analyzer._stream_llm = lambda prompt: iter(text[i:i + 7] for i in range(0, len(text), 7))
+
+    fields = []
+    transcript = [{"speaker": "Ann", "text": "Hi", "start": 0.0, "end": 2.0}]
+    result = analyzer.analyze_meeting_stream(transcript, on_field=lambda k, v: fields.append(k))
+
+    assert fields[0] == "summary"
+    assert result.summary == RESPONSE["summary"]
+    assert result.action_items == RESPONSE["action_items"]
+    assert result.sentiment_score == 0.8
+    assert result.talk_time_distribution == {"Ann": 100.0}
@@ -0,0 +1,88 @@
+"""
+Tests for structured analysis output and per-field repair
+"""
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "ai-engine"))
+
+from analysis import MeetingAnalyzer, ANALYSIS_STATS, analysis_json_schema
+from analysis.structured import invalid_fields
+
+
+VALID = {
+    "summary": "Planning sync.",
+    "key_topics": ["roadmap"],
+    "action_items": [
+        {"task": "Write spec", "assignee": "Bob", "due_date": None, "priority": "low"}
+    ],
+    "sentiment": {"score": 0.6, "label": "neutral"},
+    "key_moments": [],
+    "follow_up_questions": [],
+    "decisions_made": ["Use Postgres"],
+    "risks_identified": [],
+}
+
+TRANSCRIPT = [{"speaker": "Bob", "text": "Let's plan.", "start": 0.0, "end": 3.0}]
+
+
+def test_schema_generated_from_analysis_result():
+    """Test schema covers LLM fields and skips locally computed ones"""
+    schema = analysis_json_schema()
+
+    assert set(schema["properties"]) == set(VALID)
+    assert schema["properties"]["sentiment"]["required"] == ["score", "label"]
+    assert "talk_time_distribution" not in schema["properties"]
+    assert invalid_fields(VALID) == []
+
+
+def test_only_broken_fields_are_repaired():
+    """Test a truncated reply triggers one repair call for missing fields"""
+    analyzer = MeetingAnalyzer()
+    prompts = []
+
+    truncated = json.dumps(VALID)[:json.dumps(VALID).index('"key_moments"')]
+
+    def fake_llm(prompt, validate=None):
+        prompts.append(prompt)
+        if len(prompts) == 1:
+            return truncated
+        return json.dumps({
+            "key_moments": [],
+            "follow_up_questions": ["Who owns QA?"],
+            "decisions_made": [],
+            "risks_identified": ["Timeline"],
+        })
+
+    analyzer._call_llm = fake_llm
+    before = ANALYSIS_STATS.copy()
+
+    result = analyzer.analyze_meeting(TRANSCRIPT, meeting_title="Sync")
+
+    assert len(prompts) == 2
+    assert '"summary"' not in prompts[1]
+    assert result.summary == "Planning sync."
+    assert result.risks_identified == ["Timeline"]
+    assert ANALYSIS_STATS["parse_failures"] - before["parse_failures"] == 1
+    assert ANALYSIS_STATS["repair_calls"] - before["repair_calls"] == 1
+
+
+def test_unrepairable_fields_use_fallback():
+    """Test malformed fields fall back without re-running the analysis"""
+    analyzer = MeetingAnalyzer(structured_output=True)
+    calls = []
+
+    def fake_structured(prompt, schema=None):
+        calls.append(schema)
+        if len(calls) == 1:
+            return dict(VALID, key_topics="roadmap")
+        return {}
+
+    analyzer._call_llm_structured = fake_structured
+
+    result = analyzer.analyze_meeting(TRANSCRIPT)
+
+    assert list(calls[1]["properties"]) == ["key_topics"]
+    assert result.key_topics == []
+    assert result.decisions_made == ["Use Postgres"]
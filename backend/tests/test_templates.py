@@ -0,0 +1,94 @@
+"""
+Tests for AI template engine
+"""
+import os
+import sys
+import json
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "ai-engine"))
+
+from analysis import MeetingAnalyzer, TemplateEngine, TemplateSpec
+
+
+TRANSCRIPT = [
+    {"speaker": "Ann", "text": "Hello   team.", "start": 0.0, "end": 2.0},
+    {"speaker": "Ann", "text": "Let's plan the release.", "start": 2.0, "end": 5.0},
+    {"speaker": "Bob", "text": "I will write the notes.", "start": 5.0, "end": 8.0},
+]
+
+
+class RecordingAnalyzer(MeetingAnalyzer):
+    """Analyzer that records prompts instead of calling an LLM"""
+
+    def __init__(self):
+        super().__init__()
+        self.prompts = []
+        self.lock = threading.Lock()
+
+    def _call_llm(self, prompt: str) -> str:
+        with self.lock:
+            self.prompts.append(prompt)
+        if "JSON" in prompt:
+            return json.dumps({"risks": ["deadline"]})
+        return "Plain text output"
+
+
+def test_compile_is_cached_by_id_and_updated_at():
+    """Test templates are recompiled only when updated_at changes"""
+    engine = TemplateEngine(RecordingAnalyzer())
+    spec = TemplateSpec("t1", "2026-01-01", "Recap", "Recap {meeting_title}")
+
+    first = engine.compile(spec)
+    assert engine.compile(spec) is first
+
+    spec.updated_at = "2026-02-01"
+    assert engine.compile(spec) is not first
+
+
+def test_shared_context_and_parallel_run():
+    """Test all templates share one prepared transcript prefix"""
+    analyzer = RecordingAnalyzer()
+    engine = TemplateEngine(analyzer)
+    context = engine.prepare_context(TRANSCRIPT, meeting_title="Release")
+
+    assert context.participants == "Ann, Bob"
+    assert "Hello team. Let's plan the release." in context.transcript
+
+    results = engine.run(
+        [
+            TemplateSpec("t1", None, "Recap", "Write a recap of {meeting_title}."),
+            TemplateSpec("t2", None, "Risks", "List risks from {transcript}.", {"risks": ["string"]}),
+        ],
+        context,
+    )
+
+    assert [r.name for r in results] == ["Recap", "Risks"]
+    assert results[0].output == "Plain text output"
+    assert results[1].output == {"risks": ["deadline"]}
+
+    prefix = analyzer.prompts[0].split("=== END TRANSCRIPT ===")[0]
+    assert all(p.startswith(prefix) for p in analyzer.prompts)
+    assert "Write a recap of Release." in "".join(analyzer.prompts)
+
+
+def test_failed_template_does_not_stop_others():
+    """Test one failing template is reported, not raised"""
+    class FlakyAnalyzer(RecordingAnalyzer):
+        def _call_llm(self, prompt: str) -> str:
+            if "Explode" in prompt:
+                raise RuntimeError("boom")
+            return super()._call_llm(prompt)
+
+    engine = TemplateEngine(FlakyAnalyzer())
+    context = engine.prepare_context(TRANSCRIPT)
+    results = engine.run(
+        [
+            TemplateSpec("t1", None, "Bad", "Explode"),
+            TemplateSpec("t2", None, "Good", "Summarize"),
+        ],
+        context,
+    )
+
+    assert results[0].error == "boom"
+    assert results[1].output == "Plain text output"
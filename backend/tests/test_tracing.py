@@ -0,0 +1,104 @@
+"""
+Tests for distributed tracing across the API, Celery and the ai-engine
+"""
+import json
+import os
+import sys
+
+from celery import Celery
+from celery.contrib.testing.worker import start_worker
+from opentelemetry import trace
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from sqlalchemy import create_engine, text
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "ai-engine"))
+
+from app.metrics import StageTimer
+from app.tracing import attached_context, create_exporter, current_context, flush_tracing, setup_tracing
+from analysis import MeetingAnalyzer
+
+
+exporter = InMemorySpanExporter()
+engine = create_engine("sqlite://")
+setup_tracing("meetingmind-test", exporter=exporter, engine=engine)
+tracer = trace.get_tracer(__name__)
+
+
+class FakeAnalyzer(MeetingAnalyzer):
+    def _call_openai(self, prompt):
+        self._record_usage(type("Usage", (), {"prompt_tokens": 120, "completion_tokens": 30})())
+        return "{}"
+
+
+worker_app = Celery("tracing-test", broker="memory://", backend="cache+memory://")
+
+
+@worker_app.task
+def analyze(meeting_id):
+    timer = StageTimer("test-analyze")
+    with timer.stage("db_read"), engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+    with timer.stage("llm"):
+        FakeAnalyzer()._call_llm("Transcript")
+    return meeting_id
+
+
+def finished_spans():
+    flush_tracing()
+    spans = exporter.get_finished_spans()
+    exporter.clear()
+    return spans
+
+
+def test_trace_follows_request_into_celery_task():
+    """Test task headers carry the trace into the worker, its SQL and its LLM call"""
+    finished_spans()  # drop spans of earlier tests
+    with start_worker(worker_app, perform_ping_check=False):
+        with tracer.start_as_current_span("POST /api/v1/meetings/upload") as request_span:
+            analyze.delay("m1").get(timeout=10)
+
+    spans = finished_spans()
+    names = {span.name for span in spans}
+    trace_ids = {span.context.trace_id for span in spans}
+
+    assert {"apply_async/tests.test_tracing.analyze", "run/tests.test_tracing.analyze"} <= names
+    assert {"test-analyze.db_read", "test-analyze.llm", "llm.call"} <= names
+    assert any(span.attributes.get("db.system") == "sqlite" for span in spans)
+    assert trace_ids == {request_span.get_span_context().trace_id}
+
+    llm = next(span for span in spans if span.name == "llm.call")
+    assert llm.attributes["llm.model"] == "gpt-4o-mini"
+    assert llm.attributes["llm.usage.prompt_tokens"] == 120
+    assert llm.parent.span_id == next(s for s in spans if s.name == "test-analyze.llm").context.span_id
+
+
+def test_captured_context_continues_trace_later():
+    """Test a scheduler-style deferred dispatch joins the submitting trace"""
+    finished_spans()  # drop spans of earlier tests
+    with tracer.start_as_current_span("schedule") as span:
+        carrier = current_context()
+
+    with attached_context(carrier):
+        with tracer.start_as_current_span("dispatch") as later:
+            pass
+    with attached_context(None), tracer.start_as_current_span("unrelated") as other:
+        pass
+
+    assert "traceparent" in carrier
+    assert later.get_span_context().trace_id == span.get_span_context().trace_id
+    assert other.get_span_context().trace_id != span.get_span_context().trace_id
+
+
+def test_file_exporter_writes_json_lines(tmp_path):
+    """Test the file exporter used to inspect traces without a collector"""
+    path = tmp_path / "traces.jsonl"
+    file_exporter = create_exporter("file", file_path=str(path))
+    finished_spans()  # drop spans of earlier tests
+
+    with tracer.start_as_current_span("one"), tracer.start_as_current_span("two"):
+        pass
+    file_exporter.export(finished_spans())
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line["name"] for line in lines] == ["two", "one"]
+    assert create_exporter("none") is None
@@ -0,0 +1,149 @@
+"""
+Tests for the memory-mapped vector index
+"""
+import os
+import sys
+import threading
+import uuid
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "ai-engine"))
+
+from analysis import VectorIndex, KIND_SUMMARY, KIND_CHUNK, KIND_PROFILE
+
+
+def unit_vectors(n: int, dim: int, seed: int = 0) -> np.ndarray:
+    vectors = np.random.default_rng(seed).standard_normal((n, dim))
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def test_append_search_and_kind_filter(tmp_path):
+    """Test appended rows are found across blocks and filtered by kind"""
+    index = VectorIndex(str(tmp_path), dim=16, block_rows=4)
+    vectors = unit_vectors(10, 16)
+    a, b = str(uuid.uuid4()), str(uuid.uuid4())
+
+    index.append(a, vectors[:5], [KIND_SUMMARY] + [KIND_CHUNK] * 4, [-1, 0, 1, 2, 3])
+    index.append(b, vectors[5:], [KIND_CHUNK] * 5, [0, 1, 2, 3, 4])
+
+    assert len(index) == 10
+    hit = index.search(vectors[7], k=1)[0]
+    assert (hit.meeting_id, hit.kind, hit.chunk_index) == (b, KIND_CHUNK, 2)
+    assert hit.score > 0.99
+
+    summaries = index.search(vectors[0], k=5, kind=KIND_SUMMARY)
+    assert [(h.meeting_id, h.chunk_index) for h in summaries] == [(a, -1)]
+
+
+def test_profile_rows_do_not_take_result_slots(tmp_path):
+    """Test searching summaries and chunks fills k even when profiles match best"""
+    index = VectorIndex(str(tmp_path), dim=16)
+    vectors = unit_vectors(4, 16)
+    query = vectors[0]
+    for _ in range(5):
+        index.append(str(uuid.uuid4()), np.stack([query, vectors[1], vectors[2]]),
+                     [KIND_PROFILE, KIND_SUMMARY, KIND_CHUNK], [-1, -1, 0])
+
+    hits = index.search(query, k=5, kind=(KIND_SUMMARY, KIND_CHUNK))
+
+    assert len([h for h in index.search(query, k=5) if h.kind != KIND_PROFILE]) < 5
+    assert len(hits) == 5 and all(h.kind != KIND_PROFILE for h in hits)
+
+
+def test_remove_and_compact(tmp_path):
+    """Test removed meetings disappear from results and compaction drops them"""
+    index = VectorIndex(str(tmp_path), dim=16, max_deleted_ratio=None)
+    vectors = unit_vectors(6, 16)
+    a, b = str(uuid.uuid4()), str(uuid.uuid4())
+    index.append(a, vectors[:3], [KIND_CHUNK] * 3, [0, 1, 2])
+    index.append(b, vectors[3:], [KIND_CHUNK] * 3, [0, 1, 2])
+
+    assert index.remove(a) == 3
+    assert all(h.meeting_id == b for h in index.search(vectors[0], k=6))
+    assert index.stats() == (6, 3)
+
+    assert index.compact() == 3
+    assert len(index) == 3
+    assert index.search(vectors[4], k=1)[0].chunk_index == 1
+
+
+def test_reindexing_compacts_automatically(tmp_path):
+    """Test re-indexed meetings do not grow the index past the deleted-row ratio"""
+    index = VectorIndex(str(tmp_path), dim=16, max_deleted_ratio=0.25)
+    vectors = unit_vectors(4, 16)
+    meetings = [str(uuid.uuid4()) for _ in range(4)]
+    for meeting_id, vector in zip(meetings, vectors):
+        index.append(meeting_id, vector[None], [KIND_CHUNK], [0])
+
+    for _ in range(10):
+        for meeting_id, vector in zip(meetings, vectors):
+            index.remove(meeting_id)
+            index.append(meeting_id, vector[None], [KIND_CHUNK], [0])
+            total, deleted = index.stats()
+            assert total <= 5 and deleted / total <= 0.25
+
+    assert index.search(vectors[2], k=1)[0].meeting_id == meetings[2]
+
+
+def test_ivf_search_matches_brute_force(tmp_path):
+    """Test trained IVF lists return the same neighbours on clustered data"""
+    rng = np.random.default_rng(1)
+    topics = unit_vectors(20, 32, seed=2)
+    labels = rng.integers(0, 20, 2000)
+    vectors = topics[labels] + 0.03 * rng.standard_normal((2000, 32))
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    index = VectorIndex(str(tmp_path), dim=32, nprobe=4)
+    index.append(str(uuid.uuid4()), vectors, [KIND_CHUNK] * 2000, list(range(2000)))
+    exact = {h.chunk_index for h in index.search(vectors[0], k=10)}
+
+    assert index.train(nlist=20) == 20
+    assert index.trained
+
+    # Rows appended after training are assigned to lists
+    index.append(str(uuid.uuid4()), vectors[:1], [KIND_CHUNK], [0])
+
+    approx = index.search(vectors[0], k=11)
+    assert exact <= {h.chunk_index for h in approx}
+    assert len(index._candidates(vectors[0].astype(np.float32))) < len(index)
+
+
+def test_search_during_reindexing_sees_consistent_mappings(tmp_path):
+    """Test threads searching while another thread remaps never fail"""
+    index = VectorIndex(str(tmp_path), dim=16, max_deleted_ratio=0.25)
+    vectors = unit_vectors(8, 16)
+    meetings = [str(uuid.uuid4()) for _ in range(8)]
+    for meeting_id, vector in zip(meetings, vectors):
+        index.append(meeting_id, vector[None], [KIND_CHUNK], [0])
+
+    errors, done = [], threading.Event()
+
+    def search():
+        while not done.is_set():
+            try:
+                index.search(vectors[3], k=3)
+            except Exception as e:
+                errors.append(e)
+
+    searchers = [threading.Thread(target=search) for _ in range(4)]
+    for thread in searchers:
+        thread.start()
+    for _ in range(30):
+        for meeting_id, vector in zip(meetings, vectors):
+            index.remove(meeting_id)
+            index.append(meeting_id, vector[None], [KIND_CHUNK], [0])
+            index.search(vector, k=1)
+    done.set()
+    for thread in searchers:
+        thread.join()
+
+    assert errors == []
+    assert index.search(vectors[3], k=1)[0].meeting_id == meetings[3]
+
+
+def test_searching_an_empty_index_creates_nothing(tmp_path):
+    """Test reads of an unknown organization's index leave no directory behind"""
+    index = VectorIndex(str(tmp_path / "org"), dim=16)
+    assert index.search(unit_vectors(1, 16)[0]) == [] and index.stats() == (0, 0)
+    assert not (tmp_path / "org").exists()
@@ -76,6 +76,8 @@ CREATE TABLE IF NOT EXISTS meetings (
     duration_seconds INTEGER,
     recording_url TEXT,
     transcript_status VARCHAR(50) DEFAULT 'pending',
+    transcription_model VARCHAR(50),
+    transcription_rtf DOUBLE PRECISION,
     analysis_status VARCHAR(50) DEFAULT 'pending',
     summary TEXT,
     key_topics JSONB DEFAULT '[]',
@@ -104,6 +106,11 @@ CREATE TABLE IF NOT EXISTS meeting_participants (
     duration_seconds INTEGER,
     talk_time_seconds INTEGER DEFAULT 0,
     is_speaker BOOLEAN DEFAULT FALSE,
+    turn_count INTEGER DEFAULT 0,
+    interruption_count INTEGER DEFAULT 0,
+    overlap_seconds INTEGER DEFAULT 0,
+    longest_monologue_seconds INTEGER DEFAULT 0,
+    avg_response_latency DECIMAL(8,3),
     UNIQUE(meeting_id, user_id)
 );
 
@@ -124,12 +131,15 @@ CREATE TABLE IF NOT EXISTS transcripts (
     confidence DECIMAL(3,2),
     sentiment VARCHAR(20),
     is_key_moment BOOLEAN DEFAULT FALSE,
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    search_vector TSVECTOR GENERATED ALWAYS AS (to_tsvector('simple', text)) STORED
 );
 
 CREATE INDEX idx_transcripts_meeting ON transcripts(meeting_id);
 CREATE INDEX idx_transcripts_participant ON transcripts(participant_id);
 CREATE INDEX idx_transcripts_time ON transcripts(meeting_id, start_time);
+CREATE INDEX idx_transcripts_search ON transcripts USING GIN(search_vector);
+CREATE INDEX idx_transcripts_created ON transcripts(created_at, id);
 
 -- ===========================================
 -- Action Items
@@ -144,6 +154,7 @@ CREATE TABLE IF NOT EXISTS action_items (
     status action_item_status DEFAULT 'pending',
     priority VARCHAR(20) DEFAULT 'medium',
     due_date DATE,
+    source VARCHAR(20) DEFAULT 'manual',
     completed_at TIMESTAMP WITH TIME ZONE,
     transcript_reference UUID REFERENCES transcripts(id),
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
@@ -345,3 +356,97 @@ CREATE TABLE IF NOT EXISTS ai_templates (
 
 CREATE INDEX idx_templates_user ON ai_templates(user_id);
 CREATE INDEX idx_templates_org ON ai_templates(organization_id);
+
+-- ===========================================
+-- Analysis Batches (provider batch re-analysis jobs)
+-- ===========================================
+CREATE TABLE IF NOT EXISTS analysis_batches (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    provider VARCHAR(50) NOT NULL,
+    external_batch_id VARCHAR(255),
+    model VARCHAR(100),
+    status VARCHAR(50) DEFAULT 'pending',
+    meeting_ids JSONB DEFAULT '[]',
+    request_count INTEGER DEFAULT 0,
+    completed_count INTEGER DEFAULT 0,
+    failed_count INTEGER DEFAULT 0,
+    error TEXT,
+    completed_at TIMESTAMP WITH TIME ZONE,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX idx_analysis_batches_status ON analysis_batches(status);
+CREATE INDEX idx_analysis_batches_external ON analysis_batches(external_batch_id);
+
+-- ===========================================
+-- Pre-meeting Briefs (precomputed before calendar events)
+-- ===========================================
+CREATE TABLE IF NOT EXISTS pre_meeting_briefs (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    calendar_event_id UUID REFERENCES calendar_events(id) ON DELETE CASCADE UNIQUE,
+    user_id UUID REFERENCES users(id) ON DELETE CASCADE,
+    content TEXT NOT NULL,
+    source_meeting_ids JSONB DEFAULT '[]',
+    model VARCHAR(100),
+    generated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX idx_briefs_user ON pre_meeting_briefs(user_id);
+
+-- ===========================================
+-- Template Outputs (AI template results per meeting)
+-- ===========================================
+CREATE TABLE IF NOT EXISTS template_outputs (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    meeting_id UUID REFERENCES meetings(id) ON DELETE CASCADE,
+    template_id UUID REFERENCES ai_templates(id) ON DELETE CASCADE,
+    template_name VARCHAR(255),
+    content TEXT,
+    output JSONB,
+    error TEXT,
+    model VARCHAR(100),
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(meeting_id, template_id)
+);
+
+CREATE INDEX idx_template_outputs_meeting ON template_outputs(meeting_id);
+
+-- ===========================================
+-- Transcript Chunks (embedded spans for retrieval / Q&A)
+-- ===========================================
+CREATE TABLE IF NOT EXISTS transcript_chunks (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    meeting_id UUID REFERENCES meetings(id) ON DELETE CASCADE,
+    organization_id UUID REFERENCES organizations(id) ON DELETE CASCADE,
+    chunk_index INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    start_time DECIMAL(10, 3),
+    end_time DECIMAL(10, 3),
+    embedding BYTEA,
+    embedding_model VARCHAR(50),
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(meeting_id, chunk_index)
+);
+
+CREATE INDEX idx_transcript_chunks_meeting ON transcript_chunks(meeting_id);
+CREATE INDEX idx_transcript_chunks_org ON transcript_chunks(organization_id);
+
+-- ===========================================
+-- Pipeline Timings (per-stage breakdown of transcription / analysis runs)
+-- ===========================================
+CREATE TABLE IF NOT EXISTS pipeline_timings (
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    meeting_id UUID REFERENCES meetings(id) ON DELETE CASCADE,
+    task VARCHAR(50) NOT NULL,
+    total_seconds DOUBLE PRECISION,
+    stages JSONB DEFAULT '{}',
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX idx_pipeline_timings_meeting ON pipeline_timings(meeting_id, created_at);
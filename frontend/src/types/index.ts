@@ -24,6 +24,8 @@ export interface Meeting {
   duration_seconds: number | null
   recording_url: string | null
   transcript_status: string
+  transcription_model?: string | null
+  transcription_rtf?: number | null
   analysis_status: string
   summary: string | null
   key_topics: string[]